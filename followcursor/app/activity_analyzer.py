@@ -23,7 +23,11 @@ moments where the user is actively working over raw cursor movement.
 
 import logging
 import math
-from typing import List, Optional, Tuple
+from collections import Counter
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .models import MousePosition, KeyEvent, ClickEvent, ZoomKeyframe
 
@@ -64,10 +68,72 @@ WEIGHT_MOUSE = 0.5
 CLICK_MERGE_GAP_MS = 8000    # merge click peaks within 8s if spatially close
 TYPING_MERGE_GAP_MS = 6000   # merge typing peaks within 6s if spatially close
 SPATIAL_MERGE_DIST = 0.15    # normalized distance threshold for spatial proximity
+SPATIAL_MERGE_DIST_SQ = SPATIAL_MERGE_DIST ** 2  # compared against squared distances
+
+# Activity label codes for windows / peaks (small ints compare cheaply
+# and index straight into NumPy masks)
+LABEL_MOUSE = 0
+LABEL_TYPING = 1
+LABEL_CLICK = 2
+_LABEL_NAMES = ("mouse", "typing", "click")  # indexed by label code
 
 # Pan dampening: don't drag viewport center all the way to the target
 PAN_VIEWPORT_MARGIN = 0.15   # margin fraction within viewport edge
 
+# Derived constants (evaluated once at import instead of inside loops)
+_WINDOW_S = WINDOW_MS / 1000            # window length in seconds (for keys/sec)
+_TYPING_RUN_GAP_MS = WINDOW_MS * 1.5    # max gap between windows of one typing run
+_PAN_MS_PER_UNIT = 1200                 # pan duration per unit of normalized distance
+_PAN_MAX_DIST_SQ = (PAN_TRANSITION_MAX_MS / _PAN_MS_PER_UNIT) ** 2  # pans this far hit the cap
+
+WindowInfo = Tuple[float, float, float, float, int]  # (time, score, x, y, label code)
+SpatialGrid = Dict[Tuple[int, int, int], List[WindowInfo]]
+
+# C-level sort keys for WindowInfo tuples
+_by_time = itemgetter(0)
+_by_score = itemgetter(1)
+
+
+def _make_dampen_pan(
+    zoom: float, margin: float = PAN_VIEWPORT_MARGIN,
+) -> Callable[[float, float, float, float], Tuple[float, float]]:
+    """Return a :func:`_dampen_pan` specialised for a fixed *zoom*.
+
+    The viewport extents only depend on *zoom* and *margin*, so they are
+    computed once and captured; the returned function takes
+    ``(target_x, target_y, from_x, from_y)``.
+    """
+    if zoom <= 1.0:
+        return lambda target_x, target_y, from_x, from_y: (0.5, 0.5)
+
+    # Half of viewport extent in normalised coords (square in both axes)
+    half_v = 0.5 / zoom
+    # Shrink by margin so the target isn't right at the edge
+    eff_h = half_v * (1.0 - margin)
+    lo = half_v
+    hi = 1.0 - half_v
+
+    def dampen(
+        target_x: float, target_y: float, from_x: float, from_y: float,
+    ) -> Tuple[float, float]:
+        pan_x, pan_y = from_x, from_y
+
+        # Shift only if the target falls outside the effective visible band
+        if target_x < pan_x - eff_h:
+            pan_x = target_x + eff_h
+        elif target_x > pan_x + eff_h:
+            pan_x = target_x - eff_h
+
+        if target_y < pan_y - eff_h:
+            pan_y = target_y + eff_h
+        elif target_y > pan_y + eff_h:
+            pan_y = target_y - eff_h
+
+        # Clamp so the viewport doesn't fly off the edge of the source
+        return max(lo, min(hi, pan_x)), max(lo, min(hi, pan_y))
+
+    return dampen
+
 
 def _dampen_pan(
     target_x: float, target_y: float, zoom: float,
@@ -83,35 +149,174 @@ def _dampen_pan(
     At low zoom levels most positions are already visible and no
     panning is needed at all.
     """
-    if zoom <= 1.0:
-        return 0.5, 0.5
+    return _make_dampen_pan(zoom, margin)(target_x, target_y, from_x, from_y)
+
+
+def _event_arrays(
+    events: Sequence[MousePosition | ClickEvent],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(timestamp, x, y)`` float64 arrays for positioned events."""
+    n = len(events)
+    return (
+        np.fromiter((e.timestamp for e in events), dtype=np.float64, count=n),
+        np.fromiter((e.x for e in events), dtype=np.float64, count=n),
+        np.fromiter((e.y for e in events), dtype=np.float64, count=n),
+    )
 
-    # Half of viewport extent in normalised coords
-    half_vw = 0.5 / zoom
-    half_vh = 0.5 / zoom
 
-    # Shrink by margin so the target isn't right at the edge
-    eff_hw = half_vw * (1.0 - margin)
-    eff_hh = half_vh * (1.0 - margin)
+def _grid_cell(x: float, y: float) -> Tuple[int, int]:
+    """Grid cell of a normalized position, with ``SPATIAL_MERGE_DIST`` cells."""
+    return int(x // SPATIAL_MERGE_DIST), int(y // SPATIAL_MERGE_DIST)
+
 
-    pan_x, pan_y = from_x, from_y
+def _grid_add(grid: SpatialGrid, p: WindowInfo) -> None:
+    """Bucket peak *p* by (label, grid cell) for spatial merge lookups."""
+    cx, cy = _grid_cell(p[2], p[3])
+    grid.setdefault((p[4], cx, cy), []).append(p)
 
-    # Shift only if the target falls outside the effective visible band
-    if target_x < pan_x - eff_hw:
-        pan_x = target_x + eff_hw
-    elif target_x > pan_x + eff_hw:
-        pan_x = target_x - eff_hw
 
-    if target_y < pan_y - eff_hh:
-        pan_y = target_y + eff_hh
-    elif target_y > pan_y + eff_hh:
-        pan_y = target_y - eff_hh
+def _has_spatial_neighbour(grid: SpatialGrid, p: WindowInfo, max_gap: float) -> bool:
+    """True if *grid* holds a same-type peak near *p* in space and time.
 
-    # Clamp so the viewport doesn't fly off the edge of the source
-    pan_x = max(half_vw, min(1.0 - half_vw, pan_x))
-    pan_y = max(half_vh, min(1.0 - half_vh, pan_y))
+    Any peak closer than ``SPATIAL_MERGE_DIST`` lies in one of the 3×3
+    cells around *p*'s cell, so only those buckets are probed.
+    """
+    cx, cy = _grid_cell(p[2], p[3])
+    for gx in (cx - 1, cx, cx + 1):
+        for gy in (cy - 1, cy, cy + 1):
+            for cp in grid.get((p[4], gx, gy), ()):
+                dx = p[2] - cp[2]
+                dy = p[3] - cp[3]
+                if p[0] - cp[0] < max_gap and dx * dx + dy * dy < SPATIAL_MERGE_DIST_SQ:
+                    return True
+    return False
+
+
+def _segment_argmax(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Index of the first maximum of each segment of *values*.
+
+    Segment *i* spans ``values[starts[i]:starts[i + 1]]`` (the last one
+    runs to the end).  Ties resolve to the lowest index, like ``max()``.
+    """
+    n = len(values)
+    seg_max = np.maximum.reduceat(values, starts)
+    sizes = np.diff(np.append(starts, n))
+    is_max = values == np.repeat(seg_max, sizes)
+    return np.minimum.reduceat(np.where(is_max, np.arange(n), n), starts)
+
+
+def _reduce_clusters(
+    clusters: List[List[WindowInfo]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[WindowInfo]]:
+    """Per-cluster statistics from one set of segmented reductions.
+
+    The clusters' peaks are flattened into parallel arrays where each
+    cluster is a contiguous segment.  Returns ``(start, end, peak_score,
+    total_score, sum_xs, sum_ys, best)`` — *sum_xs* / *sum_ys* are the
+    score-weighted position sums and *best* is each cluster's first
+    highest-scoring peak.
+    """
+    if not clusters:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty, empty, empty, empty, []
+
+    sizes = np.fromiter((len(c) for c in clusters), dtype=np.intp, count=len(clusters))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    flat = [p for c in clusters for p in c]
+    n = len(flat)
+    t = np.fromiter((p[0] for p in flat), dtype=np.float64, count=n)
+    score = np.fromiter((p[1] for p in flat), dtype=np.float64, count=n)
+    x = np.fromiter((p[2] for p in flat), dtype=np.float64, count=n)
+    y = np.fromiter((p[3] for p in flat), dtype=np.float64, count=n)
+
+    best_idx = _segment_argmax(score, starts)
+    peak_score = score[best_idx]
+
+    return (
+        np.minimum.reduceat(t, starts),
+        np.maximum.reduceat(t, starts),
+        peak_score,
+        np.add.reduceat(score, starts),
+        np.add.reduceat(x * score, starts),
+        np.add.reduceat(y * score, starts),
+        [flat[i] for i in best_idx],
+    )
 
-    return pan_x, pan_y
+
+def _window_means(values: np.ndarray, bounds: np.ndarray, empty: float) -> np.ndarray:
+    """Mean of *values* over each ``[bounds[i], bounds[i + 1])`` slice.
+
+    Slices with no samples get *empty*.
+    """
+    counts = np.diff(bounds)
+    # A trailing zero lets reduceat accept start indices equal to the
+    # slice end (empty windows at the tail) without changing any sums.
+    padded = np.append(values[:bounds[-1]], 0.0)
+    sums = np.add.reduceat(padded, bounds[:-1])
+    return np.where(counts > 0, sums / np.maximum(counts, 1), empty)
+
+
+def _score_windows(
+    sample_t: np.ndarray,
+    sample_speed: np.ndarray,
+    sample_nx: np.ndarray,
+    sample_ny: np.ndarray,
+    key_ts: np.ndarray,
+    n_windows: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Average and score *n_windows* consecutive ``WINDOW_MS`` windows.
+
+    *sample_t* and *key_ts* must be sorted.  Returns parallel arrays
+    ``(center_t, score, x, y, label)`` with one entry per window, where
+    *label* holds ``LABEL_MOUSE`` / ``LABEL_TYPING`` codes.
+    """
+    # First pass: compute average speed per window.  Samples are in
+    # time order, so each window is a contiguous slice whose bounds come
+    # from a single searchsorted over the window edges.
+    edges = np.arange(n_windows + 1, dtype=np.float64) * WINDOW_MS
+    bounds = np.searchsorted(sample_t, edges)
+    win_t = edges[:-1] + WINDOW_MS / 2
+    win_speed = _window_means(sample_speed, bounds, 0.0)
+    win_x = _window_means(sample_nx, bounds, 0.5)
+    win_y = _window_means(sample_ny, bounds, 0.5)
+
+    # Keystrokes per window: each window's count is the difference of
+    # its two edge positions in the sorted key timestamps.
+    win_kps = np.diff(np.searchsorted(key_ts, edges)) / _WINDOW_S
+
+    # Second pass: detect settlements (big deceleration) and typing zones.
+    # All windows are scored at once; each branch is a boolean mask.
+    #
+    # Typing zone:
+    # - Mouse truly still  → full typing score
+    # - Mouse drifting slowly → reduced typing score (position less certain)
+    mouse_is_still = win_speed < MOUSE_STILL_PX_MS
+    mouse_slow_enough = win_speed < MOUSE_TYPING_PX_MS
+    is_typing = mouse_slow_enough & (win_kps >= TYPING_MIN_KPS)
+    typing_base = np.minimum(win_kps / 10.0, 1.0) * WEIGHT_TYPING
+    typing_score = np.where(mouse_is_still, typing_base, typing_base * 0.7)
+
+    # Mouse settlement: deceleration (fast → slow) compared to the
+    # previous window.  The first window has no predecessor.  Settlements
+    # use the CURRENT window's position (where the cursor landed).
+    prev_speed = np.concatenate(([0.0], win_speed[:-1]))
+    decel_ratio = prev_speed / np.maximum(win_speed, 0.01)
+    is_settlement = (
+        ~is_typing
+        & (prev_speed > 0)
+        & (win_speed < prev_speed)
+        & (decel_ratio >= DECEL_MIN_RATIO)
+    )
+    settle_score = np.minimum(decel_ratio / 10.0, 1.0) * WEIGHT_MOUSE
+
+    # No significant deceleration — still record for fallback
+    win_score = np.where(
+        is_typing, typing_score,
+        np.where(is_settlement, settle_score, win_speed * 0.1),
+    )
+    win_label = np.where(is_typing, LABEL_TYPING, LABEL_MOUSE).astype(np.int8)
+
+    return win_t, win_score, win_x, win_y, win_label
 
 
 def analyze_activity(
@@ -136,187 +341,134 @@ def analyze_activity(
     """
     if len(mouse_track) < 10:
         return []
+    log_info = logger.isEnabledFor(logging.INFO)
 
     mon_left = monitor_rect.get("left", 0)
     mon_top = monitor_rect.get("top", 0)
     mon_w = max(monitor_rect.get("width", 1), 1)
     mon_h = max(monitor_rect.get("height", 1), 1)
 
-    key_timestamps = [k.timestamp for k in key_events] if key_events else []
-    click_list = click_events or []
-
-    logger.info(
-        "Analyzing: %d mouse samples, %d key events, %d click events, duration=%.0fms",
-        len(mouse_track), len(key_timestamps), len(click_list),
-        mouse_track[-1].timestamp,
-    )
+    # Lift event attributes into NumPy arrays once — every pass below
+    # works on these instead of the model objects.
+    track_t, track_x, track_y = _event_arrays(mouse_track)
+    key_ts = np.sort(np.fromiter(
+        (k.timestamp for k in key_events or ()), dtype=np.float64,
+    ))
+    click_ts, click_x, click_y = _event_arrays(click_events or ())
+    click_order = np.argsort(click_ts, kind="stable")
+    click_ts = click_ts[click_order]
+    click_x = click_x[click_order]
+    click_y = click_y[click_order]
+
+    if log_info:
+        logger.info(
+            "Analyzing: %d mouse samples, %d key events, %d click events, duration=%.0fms",
+            len(track_t), len(key_ts), len(click_ts), track_t[-1],
+        )
 
     # ── 1. Per-sample mouse velocity + normalized position ──────────
-    samples: List[Tuple[float, float, float, float]] = []
-    for i in range(1, len(mouse_track)):
-        prev, curr = mouse_track[i - 1], mouse_track[i]
-        dt = max(curr.timestamp - prev.timestamp, 1.0)
-        dx = curr.x - prev.x
-        dy = curr.y - prev.y
-        speed = math.sqrt(dx * dx + dy * dy) / dt
-        nx = max(0.0, min(1.0, (curr.x - mon_left) / mon_w))
-        ny = max(0.0, min(1.0, (curr.y - mon_top) / mon_h))
-        samples.append((curr.timestamp, speed, nx, ny))
-
-    if not samples:
+    # Kept as parallel arrays (time, speed, x, y) so the window passes
+    # below can work on contiguous slices instead of per-sample tuples.
+    dt = np.maximum(np.diff(track_t), 1.0)
+    sample_t = track_t[1:]
+    sample_speed = np.hypot(np.diff(track_x), np.diff(track_y)) / dt
+    sample_nx = np.clip((track_x[1:] - mon_left) / mon_w, 0.0, 1.0)
+    sample_ny = np.clip((track_y[1:] - mon_top) / mon_h, 0.0, 1.0)
+
+    if sample_t.size == 0:
         return []
 
-    duration = samples[-1][0]
+    duration = float(sample_t[-1])
     n_windows = max(1, int(duration / WINDOW_MS))
 
     # ── 2. Score each window ────────────────────────────────────────
     # Each window gets:
     #   mouse_score  = deceleration (speed drop from previous window)
     #   typing_score = keys-per-second (only when mouse is slow)
-    #   label        = "mouse" | "typing"
+    #   label        = LABEL_MOUSE | LABEL_TYPING
 
-    WindowInfo = Tuple[float, float, float, float, str]  # (time, score, x, y, label)
-    windows: List[WindowInfo] = []
-
-    # First pass: compute average speed per window
-    window_speeds: List[Tuple[float, float, float, float]] = []  # (center_t, avg_speed, avg_x, avg_y)
-    for wi in range(n_windows):
-        t_start = wi * WINDOW_MS
-        t_end = t_start + WINDOW_MS
-
-        bucket = [s for s in samples if t_start <= s[0] < t_end]
-        if not bucket:
-            window_speeds.append(((t_start + t_end) / 2, 0.0, 0.5, 0.5))
-            continue
+    win_t, win_score, win_x, win_y, win_label = _score_windows(
+        sample_t, sample_speed, sample_nx, sample_ny, key_ts, n_windows,
+    )
 
-        avg_speed = sum(b[1] for b in bucket) / len(bucket)
-        avg_x = sum(b[2] for b in bucket) / len(bucket)
-        avg_y = sum(b[3] for b in bucket) / len(bucket)
-        center_t = (t_start + t_end) / 2
-        window_speeds.append((center_t, avg_speed, avg_x, avg_y))
-
-    # Second pass: detect settlements (big deceleration) and typing zones
-    for wi in range(n_windows):
-        t_start = wi * WINDOW_MS
-        t_end = t_start + WINDOW_MS
-        center_t, avg_speed, avg_x, avg_y = window_speeds[wi]
-
-        # Count keystrokes in this window
-        n_keys = sum(1 for kt in key_timestamps if t_start <= kt < t_end)
-        kps = n_keys / (WINDOW_MS / 1000)  # keys per second
-
-        # Decide whether this is a typing zone:
-        # - Mouse truly still  → full typing score
-        # - Mouse drifting slowly → reduced typing score (position less certain)
-        mouse_is_still = avg_speed < MOUSE_STILL_PX_MS
-        mouse_slow_enough = avg_speed < MOUSE_TYPING_PX_MS
-        is_typing = mouse_slow_enough and kps >= TYPING_MIN_KPS
-
-        if is_typing:
-            # Score based on typing density; penalize if mouse is drifting
-            base_score = min(kps / 10.0, 1.0) * WEIGHT_TYPING
-            score = base_score if mouse_is_still else base_score * 0.7
-            windows.append((center_t, score, avg_x, avg_y, "typing"))
-        else:
-            # Mouse settlement: look for deceleration (fast → slow)
-            # Compare this window's speed to the previous window's speed
-            if wi > 0:
-                prev_speed = window_speeds[wi - 1][1]
-                if prev_speed > 0 and avg_speed < prev_speed:
-                    decel_ratio = prev_speed / max(avg_speed, 0.01)
-                    if decel_ratio >= DECEL_MIN_RATIO:
-                        # Score based on how dramatic the slowdown is
-                        score = min(decel_ratio / 10.0, 1.0) * WEIGHT_MOUSE
-                        # Use the CURRENT window's position (where cursor settled)
-                        windows.append((center_t, score, avg_x, avg_y, "mouse"))
-                        continue
-            # No significant deceleration — still record for fallback
-            windows.append((center_t, avg_speed * 0.1, avg_x, avg_y, "mouse"))
+    windows: List[WindowInfo] = list(zip(
+        win_t.tolist(), win_score.tolist(), win_x.tolist(),
+        win_y.tolist(), win_label.tolist(),
+    ))
 
     if not windows:
         return []
 
     # ── 3. Find peaks per signal type ───────────────────────────────
-    mouse_windows = [w for w in windows if w[4] == "mouse"]
-    typing_windows = [w for w in windows if w[4] == "typing"]
+    mouse_idx = np.flatnonzero(win_label == LABEL_MOUSE)
+    typing_idx = np.flatnonzero(win_label == LABEL_TYPING)
 
-    logger.info(
-        "Windows: %d mouse, %d typing",
-        len(mouse_windows), len(typing_windows),
-    )
+    if log_info:
+        logger.info(
+            "Windows: %d mouse, %d typing",
+            mouse_idx.size, typing_idx.size,
+        )
 
     peaks: List[WindowInfo] = []
 
-    # Mouse settlement peaks: windows with high deceleration score
-    if mouse_windows:
-        m_scores = sorted(w[1] for w in mouse_windows)
-        m_median = m_scores[len(m_scores) // 2]
+    # Mouse settlement peaks: windows with high deceleration score that
+    # are also a local maximum among the mouse windows.
+    if mouse_idx.size:
+        m_scores = win_score[mouse_idx]
+        # Upper median (element at n // 2 in sorted order) via quickselect;
+        # np.median would average the two middle values instead.
+        mid = m_scores.size // 2
+        m_median = float(np.partition(m_scores, mid)[mid])
         m_threshold = max(m_median * 2.0, WEIGHT_MOUSE * 0.15)
-        for i, w in enumerate(mouse_windows):
-            if w[1] < m_threshold:
-                continue
-            # Local maximum check within mouse windows
-            left_ok = i == 0 or w[1] >= mouse_windows[i - 1][1]
-            right_ok = i == len(mouse_windows) - 1 or w[1] >= mouse_windows[i + 1][1]
-            if left_ok and right_ok:
-                peaks.append(w)
+        left_ok = np.concatenate(([True], m_scores[1:] >= m_scores[:-1]))
+        right_ok = np.concatenate((m_scores[:-1] >= m_scores[1:], [True]))
+        is_peak = (m_scores >= m_threshold) & left_ok & right_ok
+        peaks.extend(windows[wi] for wi in mouse_idx[is_peak].tolist())
 
     # Typing peaks: sustained typing runs (merge consecutive typing windows
-    # into runs, take the center of each run)
-    if typing_windows:
-        runs: List[List[WindowInfo]] = []
-        current_run: List[WindowInfo] = [typing_windows[0]]
-        for tw in typing_windows[1:]:
-            if tw[0] - current_run[-1][0] <= WINDOW_MS * 1.5:
-                current_run.append(tw)
-            else:
-                runs.append(current_run)
-                current_run = [tw]
-        runs.append(current_run)
-
-        for run in runs:
-            # Pick the window with highest typing score in this run
-            best = max(run, key=lambda w: w[1])
-            peaks.append(best)
+    # into runs, take the best window of each run).  A run breaks wherever
+    # two typing windows are more than 1.5 windows apart.
+    if typing_idx.size:
+        gaps = np.diff(win_t[typing_idx])
+        run_starts = np.concatenate(([0], np.flatnonzero(gaps > _TYPING_RUN_GAP_MS) + 1))
+        # Pick the window with highest typing score in each run
+        best = _segment_argmax(win_score[typing_idx], run_starts)
+        peaks.extend(windows[wi] for wi in typing_idx[best].tolist())
 
     # Click-cluster peaks: ≥2 clicks within a 3-second sliding window
-    if click_events and len(click_events) >= CLICK_MIN_COUNT:
-        sorted_clicks = sorted(click_events, key=lambda c: c.timestamp)
+    n_clicks = len(click_ts)
+    if n_clicks >= CLICK_MIN_COUNT:
+        # burst_end[i] = one past the last click within CLICK_WINDOW_MS of click[i]
+        burst_end = np.searchsorted(click_ts, click_ts + CLICK_WINDOW_MS, side="right")
         i = 0
         used_up_to = -1.0  # avoid overlapping click clusters
-        while i < len(sorted_clicks):
-            # Collect all clicks within CLICK_WINDOW_MS of click[i]
-            burst: List[ClickEvent] = [sorted_clicks[i]]
-            j = i + 1
-            while j < len(sorted_clicks) and sorted_clicks[j].timestamp - sorted_clicks[i].timestamp <= CLICK_WINDOW_MS:
-                burst.append(sorted_clicks[j])
-                j += 1
-
-            if len(burst) >= CLICK_MIN_COUNT and sorted_clicks[i].timestamp > used_up_to:
+        while i < n_clicks:
+            j = int(burst_end[i])
+            n_burst = j - i
+            if n_burst >= CLICK_MIN_COUNT and click_ts[i] > used_up_to:
                 # Centroid of click positions (normalized to monitor)
-                cx = sum(c.x for c in burst) / len(burst)
-                cy = sum(c.y for c in burst) / len(burst)
+                cx = float(click_x[i:j].mean())
+                cy = float(click_y[i:j].mean())
                 nx = max(0.0, min(1.0, (cx - mon_left) / mon_w))
                 ny = max(0.0, min(1.0, (cy - mon_top) / mon_h))
-                center_t = sum(c.timestamp for c in burst) / len(burst)
+                center_t = float(click_ts[i:j].mean())
                 # Score: more clicks = stronger signal (normalize: 5 clicks = max)
-                score = min(len(burst) / 5.0, 1.0) * WEIGHT_CLICK
-                peaks.append((center_t, score, nx, ny, "click"))
-                used_up_to = burst[-1].timestamp  # skip past this burst
+                score = min(n_burst / 5.0, 1.0) * WEIGHT_CLICK
+                peaks.append((center_t, score, nx, ny, LABEL_CLICK))
+                used_up_to = float(click_ts[j - 1])  # skip past this burst
                 i = j  # advance past the burst
             else:
                 i += 1
 
     if not peaks:
         # Fallback: top-N windows by score regardless of type
-        all_scored = sorted(windows, key=lambda w: w[1], reverse=True)
+        all_scored = sorted(windows, key=_by_score, reverse=True)
         peaks = all_scored[:max_clusters]
 
     # Log peak breakdown
-    peak_types = {}
-    for p in peaks:
-        peak_types[p[4]] = peak_types.get(p[4], 0) + 1
-    logger.info("Peaks: %s", peak_types)
+    if log_info:
+        peak_types = Counter(_LABEL_NAMES[p[4]] for p in peaks)
+        logger.info("Peaks: %s", dict(peak_types))
 
     # ── 4. Cluster nearby peaks (spatial-aware) ────────────────────
     #
@@ -327,38 +479,40 @@ def analyze_activity(
     #
     # This prevents repeated zoom-out → zoom-in cycles when the user
     # clicks or types in the same area with small pauses.
-    peaks.sort(key=lambda p: p[0])
+    peaks.sort(key=_by_time)
     clusters: List[List[WindowInfo]] = []
     current_cluster: List[WindowInfo] = [peaks[0]]
+    # Click / typing peaks of the current cluster, bucketed on a coarse
+    # grid so (b) only compares against spatially nearby peaks.
+    spatial_grid: SpatialGrid = {}
+    if peaks[0][4] != LABEL_MOUSE:
+        _grid_add(spatial_grid, peaks[0])
 
     for p in peaks[1:]:
-        should_merge = False
-        for cp in current_cluster:
-            gap = p[0] - cp[0]
-            # (a) always merge if within the base time gap
-            if gap < min_gap_ms:
-                should_merge = True
-                break
-            # (b) extended merge for same-type, spatially close peaks
-            if p[4] == cp[4] and p[4] in ("click", "typing"):
-                dist = math.sqrt((p[2] - cp[2]) ** 2 + (p[3] - cp[3]) ** 2)
-                ext_gap = CLICK_MERGE_GAP_MS if p[4] == "click" else TYPING_MERGE_GAP_MS
-                if dist < SPATIAL_MERGE_DIST and gap < ext_gap:
-                    should_merge = True
-                    break
+        # (a) always merge if within the base time gap.  Peaks arrive in
+        # time order, so the cluster's last peak is the closest in time.
+        should_merge = p[0] - current_cluster[-1][0] < min_gap_ms
+        # (b) extended merge for same-type, spatially close peaks
+        is_spatial = p[4] != LABEL_MOUSE
+        if not should_merge and is_spatial:
+            ext_gap = CLICK_MERGE_GAP_MS if p[4] == LABEL_CLICK else TYPING_MERGE_GAP_MS
+            should_merge = _has_spatial_neighbour(spatial_grid, p, ext_gap)
 
         if should_merge:
             current_cluster.append(p)
         else:
             clusters.append(current_cluster)
             current_cluster = [p]
+            spatial_grid.clear()
+        if is_spatial:
+            _grid_add(spatial_grid, p)
     clusters.append(current_cluster)
 
     # Split clusters that exceed MAX_CLUSTER_DURATION_MS so a single
     # zoom block never spans the whole video.
     split_clusters: List[List[WindowInfo]] = []
     for cluster in clusters:
-        cluster.sort(key=lambda p: p[0])
+        cluster.sort(key=_by_time)
         span = cluster[-1][0] - cluster[0][0]
         if span <= MAX_CLUSTER_DURATION_MS:
             split_clusters.append(cluster)
@@ -376,13 +530,13 @@ def analyze_activity(
             split_clusters.append(sub)
     clusters = split_clusters
 
-    # Keep top N clusters by peak score
-    def cluster_peak_score(c: List[WindowInfo]) -> float:
-        return max(p[1] for p in c)
+    # Reduce every cluster once; the same stats drive both ranking and
+    # keyframe generation.
+    c_start, c_end, c_peak, c_total, c_sum_x, c_sum_y, c_best = _reduce_clusters(clusters)
 
-    clusters.sort(key=cluster_peak_score, reverse=True)
-    clusters = clusters[:max_clusters]
-    clusters.sort(key=lambda c: c[0][0])
+    # Keep top N clusters by peak score, then restore time order
+    keep = np.argsort(-c_peak, kind="stable")[:max_clusters]
+    keep = keep[np.argsort(c_start[keep], kind="stable")]
 
     # ── 5. Generate keyframe pairs ──────────────────────────────────
     #
@@ -396,19 +550,20 @@ def analyze_activity(
     # and back in.  This avoids disorienting zoom-out / zoom-in cycles
     # when actions happen across different parts of the screen.
     keyframes: List[ZoomKeyframe] = []
+    dampen_pan = _make_dampen_pan(zoom_level)
 
     # Pre-compute cluster info for boundary clamping
     cluster_info: List[dict] = []
-    for cluster in clusters:
-        best = max(cluster, key=lambda p: p[1])
-        cluster_start = min(p[0] for p in cluster)
-        cluster_end = max(p[0] for p in cluster)
+    for ci in keep.tolist():
+        best = c_best[ci]
+        cluster_start = float(c_start[ci])
+        cluster_end = float(c_end[ci])
 
         # Score-weighted centroid position (raw, un-dampened)
-        total_score = sum(p[1] for p in cluster)
+        total_score = float(c_total[ci])
         if follow_cursor and total_score > 0:
-            raw_x = sum(p[2] * p[1] for p in cluster) / total_score
-            raw_y = sum(p[3] * p[1] for p in cluster) / total_score
+            raw_x = float(c_sum_x[ci]) / total_score
+            raw_y = float(c_sum_y[ci]) / total_score
         elif follow_cursor:
             raw_x, raw_y = best[2], best[3]
         else:
@@ -416,7 +571,7 @@ def analyze_activity(
 
         # Initial dampened pan (from center).  For chained clusters
         # this will be recomputed from the previous cluster's pan.
-        pan_x, pan_y = _dampen_pan(raw_x, raw_y, zoom_level)
+        pan_x, pan_y = dampen_pan(raw_x, raw_y, 0.5, 0.5)
 
         label = best[4]
         # Anticipation: arrive ANTICIPATION_MS *before* the action starts,
@@ -426,10 +581,10 @@ def analyze_activity(
         zoom_in_time = max(0.0, cluster_start - TRANSITION_MS - ANTICIPATION_MS)
 
         # Hold duration depends on activity type
-        if label == "typing":
+        if label == LABEL_TYPING:
             hold_ms = ZOOM_HOLD_TYPING_MS
             reason = "Typing activity detected"
-        elif label == "click":
+        elif label == LABEL_CLICK:
             hold_ms = ZOOM_HOLD_CLICK_MS
             reason = "Click cluster detected"
         else:
@@ -501,9 +656,8 @@ def analyze_activity(
             curr_ci = cluster_info[chain[i]]
 
             # Recompute this cluster's pan from the previous position
-            curr_pan_x, curr_pan_y = _dampen_pan(
-                curr_ci["raw_x"], curr_ci["raw_y"], zoom_level,
-                from_x=prev_pan_x, from_y=prev_pan_y,
+            curr_pan_x, curr_pan_y = dampen_pan(
+                curr_ci["raw_x"], curr_ci["raw_y"], prev_pan_x, prev_pan_y,
             )
             # Store updated pan for the next iteration
             curr_ci["pan_x"] = curr_pan_x
@@ -512,11 +666,11 @@ def analyze_activity(
             # Duration proportional to pan distance, with min/max bounds
             dx = curr_pan_x - prev_pan_x
             dy = curr_pan_y - prev_pan_y
-            dist = math.sqrt(dx * dx + dy * dy)
-            pan_dur = min(
-                PAN_TRANSITION_MAX_MS,
-                max(PAN_TRANSITION_MS, int(dist * 1200)),
-            )
+            dist_sq = dx * dx + dy * dy
+            if dist_sq >= _PAN_MAX_DIST_SQ:
+                pan_dur = PAN_TRANSITION_MAX_MS  # long pan, capped anyway
+            else:
+                pan_dur = max(PAN_TRANSITION_MS, int(math.sqrt(dist_sq) * _PAN_MS_PER_UNIT))
 
             # Pan should complete ANTICIPATION_MS before the activity starts
             desired_arrive = curr_ci["start"] - ANTICIPATION_MS
@@ -556,7 +710,7 @@ def analyze_activity(
         )
         keyframes.append(kf_out)
 
-    keyframes.sort(key=lambda k: k.timestamp)
+    keyframes.sort(key=attrgetter("timestamp"))
 
     # ── 6. Prevent overlap between consecutive chains ──────────────
     #
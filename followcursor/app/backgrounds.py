@@ -7,7 +7,17 @@ Pattern sub-types: wavy.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# QColor is only needed by the Qt compositor; keep this module importable
+# without PySide6 (e.g. in headless test environments).
+try:
+    from PySide6.QtGui import QColor
+    _HAS_QT = True
+except ImportError:
+    _HAS_QT = False
 
 
 @dataclass
@@ -19,6 +29,11 @@ class BackgroundPreset:
     color_top: Tuple[int, int, int]
     color_bottom: Tuple[int, int, int]  # same as top for solid
     category: str = ""  # "solid", "gradient", or "pattern" — set automatically
+    # Pre-built QColor versions of the two colours (None without PySide6)
+    qcolor_top: Optional["QColor"] = field(
+        default=None, init=False, repr=False, compare=False)
+    qcolor_bottom: Optional["QColor"] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.category:
@@ -28,6 +43,9 @@ class BackgroundPreset:
                 self.category = "gradient"
             else:
                 self.category = "pattern"
+        if _HAS_QT:
+            self.qcolor_top = QColor(*self.color_top)
+            self.qcolor_bottom = QColor(*self.color_bottom)
 
     @property
     def is_gradient(self) -> bool:
@@ -186,7 +204,74 @@ PRESETS: List[BackgroundPreset] = [
 
 DEFAULT_PRESET = PRESETS[0]  # "Pure White"
 
+
+class PresetTable:
+    """Column-oriented (structure-of-arrays) view over a list of presets.
+
+    Names, kinds and categories are stored as parallel arrays and the
+    colours as ``(N, 3)`` ``uint8`` arrays, so category filters are a
+    single vectorized mask and serialization can be done in one batch.
+    The original :class:`BackgroundPreset` objects are kept as row views.
+    """
+
+    def __init__(self, presets: Sequence[BackgroundPreset]) -> None:
+        self._rows: List[BackgroundPreset] = list(presets)
+        self.names: List[str] = [p.name for p in self._rows]
+        self.kinds = np.array([p.kind for p in self._rows], dtype=str)
+        self.categories = np.array([p.category for p in self._rows], dtype=str)
+        self.color_top = np.array(
+            [p.color_top for p in self._rows], dtype=np.uint8).reshape(-1, 3)
+        self.color_bottom = np.array(
+            [p.color_bottom for p in self._rows], dtype=np.uint8).reshape(-1, 3)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, i: int) -> BackgroundPreset:
+        return self._rows[i]
+
+    def indices(self, category: str) -> np.ndarray:
+        """Row indices of all presets in *category*, in table order."""
+        return np.flatnonzero(self.categories == category)
+
+    def select(self, category: str) -> List[BackgroundPreset]:
+        """Presets in *category*, in table order."""
+        rows = self._rows
+        return [rows[i] for i in self.indices(category).tolist()]
+
+    def solids(self) -> np.ndarray:
+        """Row indices of the solid presets."""
+        return self.indices(CAT_SOLID)
+
+    def gradients(self) -> np.ndarray:
+        """Row indices of the gradient presets."""
+        return self.indices(CAT_GRADIENT)
+
+    def patterns(self) -> np.ndarray:
+        """Row indices of the pattern presets."""
+        return self.indices(CAT_PATTERN)
+
+    def to_dicts(self) -> List[dict]:
+        """Batch equivalent of ``[p.to_dict() for p in presets]``."""
+        return [
+            {"name": name, "kind": kind, "color_top": top, "color_bottom": bottom}
+            for name, kind, top, bottom in zip(
+                self.names, self.kinds.tolist(),
+                self.color_top.tolist(), self.color_bottom.tolist())
+        ]
+
+
+PRESET_TABLE = PresetTable(PRESETS)
+
+# Name → preset, for restoring a selection from settings or a swatch
+PRESETS_BY_NAME: Dict[str, BackgroundPreset] = {p.name: p for p in PRESETS}
+
+# Presets grouped by category (preserving PRESETS order)
+PRESETS_BY_CATEGORY: Dict[str, List[BackgroundPreset]] = {
+    cat: PRESET_TABLE.select(cat) for cat in CATEGORIES
+}
+
 # Convenience accessors by category
-SOLID_PRESETS   = [p for p in PRESETS if p.category == CAT_SOLID]
-GRADIENT_PRESETS = [p for p in PRESETS if p.category == CAT_GRADIENT]
-PATTERN_PRESETS  = [p for p in PRESETS if p.category == CAT_PATTERN]
+SOLID_PRESETS    = PRESETS_BY_CATEGORY[CAT_SOLID]
+GRADIENT_PRESETS = PRESETS_BY_CATEGORY[CAT_GRADIENT]
+PATTERN_PRESETS  = PRESETS_BY_CATEGORY[CAT_PATTERN]
@@ -1,7 +1,9 @@
 """Mouse click tracker — records click positions via a Win32 low-level hook.
 
 Records timestamp and screen coordinates of left/right mouse-button-down events.
-Runs the hook in a dedicated thread to avoid blocking the Qt event loop.
+Runs the hook in a dedicated thread to avoid blocking the Qt event loop;
+clicks are buffered there and turned into ``ClickEvent`` objects when
+the events are read.
 """
 
 import logging
@@ -9,9 +11,10 @@ import sys
 import time
 import ctypes
 import ctypes.wintypes as wintypes
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QThread
 
 from .models import ClickEvent
 
@@ -22,6 +25,10 @@ WH_MOUSE_LL = 14
 WM_LBUTTONDOWN = 0x0201
 WM_RBUTTONDOWN = 0x0204
 WM_QUIT = 0x0012
+PM_REMOVE = 0x0001
+
+#: Raw click as recorded by the hook: (x, y, timestamp_ms)
+RawClick = Tuple[int, int, float]
 
 if sys.platform == "win32":
     class MSLLHOOKSTRUCT(ctypes.Structure):
@@ -43,15 +50,21 @@ if sys.platform == "win32":
 
 
 class _MouseHookThread(QThread):
-    """Runs a Win32 message loop with a low-level mouse hook."""
+    """Runs a Win32 message loop with a low-level mouse hook.
 
-    click_detected = Signal(int, int, float)  # x, y screen coordinates, timestamp (ms)
+    Clicks are appended as raw ``(x, y, ts)`` tuples to a shared deque
+    (thread-safe for append/popleft) instead of being emitted as a
+    cross-thread signal, so the hook callback returns as fast as possible.
+    """
 
-    def __init__(self, start_ms: float = 0.0, parent: QObject | None = None) -> None:
+    def __init__(self, start_ns: int = 0,
+                 buffer: Deque[RawClick] | None = None,
+                 parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._thread_id: int = 0
         self._hook = None
-        self._start_ms = start_ms
+        self._start_ns = start_ns  # shared epoch on the perf_counter_ns clock
+        self._buffer: Deque[RawClick] = buffer if buffer is not None else deque()
         self._proc = None  # prevent GC of the callback
 
     def run(self) -> None:
@@ -76,29 +89,48 @@ class _MouseHookThread(QThread):
         user32.UnhookWindowsHookEx.argtypes = [wintypes.HHOOK]
         user32.UnhookWindowsHookEx.restype = wintypes.BOOL
 
-        start_ms = self._start_ms
+        # Low-level hooks are latency-sensitive: bind everything the
+        # callback needs to closure locals up front.
+        start_ns = self._start_ns
+        perf_counter_ns = time.perf_counter_ns
+        buffer = self._buffer
+        call_next = user32.CallNextHookEx
+        from_address = MSLLHOOKSTRUCT.from_address
+        hook = None  # assigned below, read by the callback via its closure
 
         def low_level_handler(n_code, w_param, l_param):
             try:
                 if n_code >= 0 and w_param in (WM_LBUTTONDOWN, WM_RBUTTONDOWN):
-                    ts = time.time() * 1000 - start_ms
-                    # Cast the raw LPARAM integer to a pointer to MSLLHOOKSTRUCT
-                    info = ctypes.cast(l_param, ctypes.POINTER(MSLLHOOKSTRUCT)).contents
-                    self.click_detected.emit(info.pt.x, info.pt.y, ts)
+                    ts = (perf_counter_ns() - start_ns) / 1_000_000
+                    # View the raw LPARAM address as an MSLLHOOKSTRUCT
+                    info = from_address(l_param)
+                    buffer.append((info.pt.x, info.pt.y, ts))
             except Exception:
                 logger.exception("Error in mouse click hook callback")
-            return user32.CallNextHookEx(self._hook, n_code, w_param, l_param)
+            return call_next(hook, n_code, w_param, l_param)
 
         self._proc = HOOKPROC(low_level_handler)
-        self._hook = user32.SetWindowsHookExW(
+        self._hook = hook = user32.SetWindowsHookExW(
             WH_MOUSE_LL, self._proc, None, 0
         )
 
-        # Pump messages so the hook receives events
+        # Pump messages so the hook receives events.  Low-level hook
+        # callbacks run inside GetMessageW/PeekMessageW themselves, so each
+        # wake-up just drains whatever else is queued in one go; there is
+        # no keyboard input to translate on this thread.
         msg = wintypes.MSG()
-        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
-            user32.TranslateMessage(ctypes.byref(msg))
-            user32.DispatchMessageW(ctypes.byref(msg))
+        p_msg = ctypes.byref(msg)
+        get_message = user32.GetMessageW
+        peek_message = user32.PeekMessageW
+        dispatch_message = user32.DispatchMessageW
+        running = True
+        while running and get_message(p_msg, None, 0, 0) > 0:
+            dispatch_message(p_msg)
+            while peek_message(p_msg, None, 0, 0, PM_REMOVE):
+                if msg.message == WM_QUIT:
+                    running = False
+                    break
+                dispatch_message(p_msg)
 
         if self._hook:
             user32.UnhookWindowsHookEx(self._hook)
@@ -118,35 +150,65 @@ class ClickTracker(QObject):
         super().__init__(parent)
         self._thread: Optional[_MouseHookThread] = None
         self._events: List[ClickEvent] = []
+        self._buffer: Deque[RawClick] = deque()
         self._start_time: float = 0.0
 
     def start(self, start_ms: float = 0.0) -> None:
         """Begin tracking mouse clicks.
 
-        *start_ms* — shared epoch (``time.time() * 1000``) so all trackers
+        *start_ms* — shared epoch (``time.perf_counter() * 1000``) so all trackers
         use the same time base.
         """
         if sys.platform != "win32":
             return
         self._events.clear()
-        self._start_time = start_ms if start_ms > 0 else time.time() * 1000
-        self._thread = _MouseHookThread(start_ms=self._start_time, parent=self)
-        self._thread.click_detected.connect(self._on_click)
+        self._buffer.clear()
+        self._start_time = start_ms if start_ms > 0 else time.perf_counter() * 1000
+        # The epoch in perf_counter_ns units: the hook then only needs a
+        # cheap integer subtraction per click
+        start_ns = round(self._start_time * 1_000_000)
+        self._thread = _MouseHookThread(
+            start_ns=start_ns,
+            buffer=self._buffer,
+            parent=self,
+        )
         self._thread.start()
 
+    def request_stop(self) -> None:
+        """Ask the hook thread to exit without waiting for it.
+
+        :meth:`stop` still joins the thread and returns the events.
+        """
+        if self._thread is not None:
+            self._thread.request_stop()
+
     def stop(self) -> List[ClickEvent]:
-        """Stop tracking and return collected events."""
+        """Stop tracking and return collected events.
+
+        Safe to call from a worker thread: it only touches the hook thread
+        and the click buffer, never a GUI-thread timer.
+        """
         if self._thread is not None:
             self._thread.request_stop()
             self._thread.wait(2000)
             self._thread = None
+        self._drain()
         result = list(self._events)
         self._events.clear()
         return result
 
-    def _on_click(self, x: int, y: int, ts: float) -> None:
-        self._events.append(ClickEvent(x=float(x), y=float(y), timestamp=ts))
+    def _drain(self) -> None:
+        """Move buffered raw clicks from the hook thread into ``_events``."""
+        buffer = self._buffer
+        # Only take what is there now; the hook may keep appending
+        raw = [buffer.popleft() for _ in range(len(buffer))]
+        if raw:
+            self._events.extend(
+                ClickEvent(x=float(x), y=float(y), timestamp=ts)
+                for x, y, ts in raw
+            )
 
     @property
     def events(self) -> List[ClickEvent]:
+        self._drain()
         return list(self._events)
@@ -4,21 +4,27 @@ Used by both the live preview widget and the video exporter so the
 exported MP4 looks identical to the in-app preview.
 """
 
-from typing import List, Optional
+import math
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
-from PySide6.QtCore import QRectF, QPointF, Qt
+import numpy as np
+
+from PySide6.QtCore import QRect, QRectF, QPointF, Qt
 from PySide6.QtGui import (
     QImage,
     QPainter,
     QColor,
-    QLinearGradient,
-    QRadialGradient,
     QPen,
     QBrush,
     QPainterPath,
+    QPixmap,
+    QPolygonF,
+    QTransform,
 )
 
 from .models import MousePosition
+from .cursor_renderer import ClickTrack, MouseTrack, draw_cursor_qpainter, draw_clicks_qpainter
 from .backgrounds import BackgroundPreset, DEFAULT_PRESET, WAVE_LAYERS
 from .frames import FramePreset, DEFAULT_FRAME
 
@@ -44,108 +50,191 @@ DEVICE_ASPECT_FALLBACK = 16.0 / 9.0
 
 # ── Background rendering helper ────────────────────────────────────
 
-def _paint_bg(painter: QPainter, W: float, H: float,
-              preset: BackgroundPreset) -> None:
-    """Paint the background fill — solid, gradient, or pattern."""
-    import math
+@lru_cache(maxsize=8)
+def _build_wave_polygons(W: float, H: float) -> Tuple[QPolygonF, ...]:
+    """Build the closed sine-wave outline for each of ``WAVE_LAYERS``.
 
-    ct = QColor(*preset.color_top)
-    cb = QColor(*preset.color_bottom)
-    kind = preset.kind
+    The shapes depend only on the canvas size, so they are cached and
+    reused across frames instead of being rebuilt on every paint.
+    """
+    step = max(int(W / 300), 1)
+    xs = np.arange(0, int(W) + 1, step, dtype=np.float64)
+    params = np.array([layer[:4] for layer in WAVE_LAYERS], dtype=np.float64)
+    y_frac, amp_frac, freq, phase = (col[:, None] for col in params.T)
+    # One (layers × samples) evaluation instead of a scalar sin() per vertex
+    ys = H * y_frac + H * amp_frac * np.sin(
+        2 * np.pi * freq * (xs / max(W, 1)) + phase)
+
+    # drawPolygon() closes the outline implicitly
+    return tuple(
+        QPolygonF([
+            QPointF(0, H),
+            *map(QPointF, xs.tolist(), row.tolist()),
+            QPointF(W, H),
+        ])
+        for row in ys
+    )
+
+
+# Linear-gradient axis end point as fractions of (W, H), per kind
+_LINEAR_AXIS = {"wavy": (0.3, 1.0), "gradient": (0.5, 1.0)}
+# Radial glow centre (fractions of W, H) and radius (fraction of max(W, H))
+_RADIAL_GLOW = {"radial": (0.5, 0.5, 0.6), "spotlight": (0.8, 0.2, 0.75)}
+
+
+# Gradient position quantized to this many steps (one per 8-bit level)
+_RAMP_STEPS = 256
+
+
+@lru_cache(maxsize=4)
+def _ramp_index(kind: str, w: int, h: int) -> np.ndarray:
+    """Per-pixel gradient position for *kind*, quantized to ``uint8``.
+
+    Depends only on the geometry, not on the preset colours, so the
+    ``hypot`` / projection math runs once per canvas size and kind;
+    colouring is then a table lookup.  Positions are sampled at pixel
+    centres, matching ``QLinearGradient`` / ``QRadialGradient``.
+    """
+    xs = np.arange(w, dtype=np.float32) + 0.5
+    ys = (np.arange(h, dtype=np.float32) + 0.5)[:, None]
+
+    if kind in _RADIAL_GLOW:
+        fx, fy, fr = _RADIAL_GLOW[kind]
+        radius = max(w, h) * fr
+        # Glow fades from the top colour to transparent over the bottom fill
+        t = np.hypot(xs - w * fx, ys - h * fy) / radius
+    else:
+        gx, gy = w * _LINEAR_AXIS[kind][0], h * _LINEAR_AXIS[kind][1]
+        t = (xs * gx + ys * gy) / (gx * gx + gy * gy)
 
-    if kind == "wavy":
-        # Base gradient
-        grad = QLinearGradient(0, 0, W * 0.3, H)
-        grad.setColorAt(0.0, ct)
-        grad.setColorAt(1.0, cb)
-        painter.fillRect(QRectF(0, 0, W, H), grad)
+    np.clip(t, 0.0, 1.0, out=t)
+    return np.rint(t * (_RAMP_STEPS - 1)).astype(np.uint8)
 
-        # Overlaid sine-wave layers
-        for y_frac, amp_frac, freq, phase, alpha, use_top in WAVE_LAYERS:
-            wave_c = QColor(ct if use_top else cb)
-            wave_c.setAlphaF(alpha)
 
-            path = QPainterPath()
-            path.moveTo(0, H)
-            step = max(int(W / 300), 1)
-            for x_px in range(0, int(W) + 1, step):
-                t = x_px / max(W, 1)
-                y = H * y_frac + H * amp_frac * math.sin(
-                    2 * math.pi * freq * t + phase)
-                path.lineTo(x_px, y)
-            path.lineTo(W, H)
-            path.closeSubpath()
-            painter.fillPath(path, wave_c)
-
-    elif kind == "radial":
-        # Dark outer fill
-        painter.fillRect(QRectF(0, 0, W, H), cb)
-        # Radial glow from centre
-        rg = QRadialGradient(W / 2, H / 2, max(W, H) * 0.6)
-        rg.setColorAt(0.0, ct)
-        rg.setColorAt(1.0, QColor(cb.red(), cb.green(), cb.blue(), 0))
-        painter.fillRect(QRectF(0, 0, W, H), QBrush(rg))
-
-    elif kind == "spotlight":
-        # Dark fill with off-centre glow from upper-right area
-        painter.fillRect(QRectF(0, 0, W, H), cb)
-        rg = QRadialGradient(W * 0.8, H * 0.2, max(W, H) * 0.75)
-        rg.setColorAt(0.0, ct)
-        rg.setColorAt(1.0, QColor(cb.red(), cb.green(), cb.blue(), 0))
-        painter.fillRect(QRectF(0, 0, W, H), QBrush(rg))
-
-    elif kind == "gradient":
-        grad = QLinearGradient(0, 0, W * 0.5, H)
-        grad.setColorAt(0.0, ct)
-        grad.setColorAt(1.0, cb)
-        painter.fillRect(QRectF(0, 0, W, H), grad)
-
-    else:  # solid
-        painter.fillRect(QRectF(0, 0, W, H), ct)
+def _bg_image(kind: str, w: int, h: int,
+              top: Tuple[int, int, int],
+              bottom: Tuple[int, int, int]) -> QImage:
+    """Rasterize a gradient / radial / spotlight background with NumPy."""
+    # 256-entry colour ramp packed as Format_RGB32 pixels (0xffRRGGBB)
+    s = np.linspace(0.0, 1.0, _RAMP_STEPS)[:, None]
+    rgb = np.rint(np.array(top) * (1.0 - s) + np.array(bottom) * s)
+    rgb = rgb.astype(np.uint32)
+    lut = 0xFF000000 | (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
 
+    pixels = lut[_ramp_index(kind, w, h)]
+    # copy() detaches the QImage from the temporary NumPy buffer
+    return QImage(pixels.data, w, h, 4 * w, QImage.Format.Format_RGB32).copy()
 
-# ── Public API ──────────────────────────────────────────────────────
 
+# Rendered backgrounds keyed by canvas size, preset look and antialiasing.
+# Kept small: each entry is a full canvas-sized pixmap.
+_BG_PIXMAP_CACHE_SIZE = 4
+_bg_pixmap_cache: Dict[tuple, QPixmap] = {}
 
-def compose_scene(
-    painter: QPainter,
-    frame: QImage,
-    canvas_w: float,
-    canvas_h: float,
-    zoom: float = 1.0,
-    pan_x: float = 0.5,
-    pan_y: float = 0.5,
-    mouse_track: Optional[List[MousePosition]] = None,
-    time_ms: float = 0.0,
-    monitor_rect: Optional[dict] = None,
-    bg_preset: Optional[BackgroundPreset] = None,
-    frame_preset: Optional[FramePreset] = None,
-    click_events: Optional[List[ClickEvent]] = None,
-) -> None:
-    """Paint the device-frame composition onto *painter*.
 
-    Draws:  gradient background  →  device bezel  →  video inside screen
-            →  mouse cursor (if mouse_track provided).
+def _paint_bg(painter: QPainter, W: float, H: float,
+              preset: BackgroundPreset) -> None:
+    """Paint the background fill — solid, gradient, or pattern.
 
-    When *zoom* > 1 the device scales up and pans so the point
-    (*pan_x*, *pan_y*) in the video stays centred in the output.
+    Gradient and pattern backgrounds are identical for every frame of a
+    clip, so they are rendered once into an off-screen pixmap and
+    blitted afterwards.
     """
-    W, H = float(canvas_w), float(canvas_h)
-    iw, ih = frame.width(), frame.height()
-    if iw <= 0 or ih <= 0:
-        return
-
-    fp = frame_preset or DEFAULT_FRAME
-
-    # ── background ─────────────────────────────────────────────────
-    preset = bg_preset or DEFAULT_PRESET
-    _paint_bg(painter, W, H, preset)
+    # Full-canvas fills and unscaled blits gain nothing from antialiasing,
+    # so skip the AA span generator here and restore the caller's hint.
+    aa = painter.testRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+    if preset.kind == "solid":
+        # A flat fill is already cheaper than a pixmap blit.  On whole-pixel
+        # canvases use the integer QRect overload, which skips the raster
+        # engine's sub-pixel coverage path.
+        if W.is_integer() and H.is_integer():
+            painter.fillRect(QRect(0, 0, int(W), int(H)), preset.qcolor_top)
+        else:
+            painter.fillRect(QRectF(0, 0, W, H), preset.qcolor_top)
+    else:
+        # Same source and target rect → an unscaled blit
+        rect = QRectF(0, 0, W, H)
+        painter.drawPixmap(rect, _bg_pixmap(W, H, preset, aa), rect)
+
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, aa)
+
+
+def _bg_pixmap(W: float, H: float, preset: BackgroundPreset,
+               antialias: bool) -> QPixmap:
+    """Return the cached off-screen rendering of a non-solid background."""
+    key = (W, H, preset.kind, preset.color_top, preset.color_bottom, antialias)
+    pm = _bg_pixmap_cache.get(key)
+    if pm is None:
+        if len(_bg_pixmap_cache) >= _BG_PIXMAP_CACHE_SIZE:
+            del _bg_pixmap_cache[next(iter(_bg_pixmap_cache))]
+        pm = QPixmap(max(math.ceil(W), 1), max(math.ceil(H), 1))
+        pm.fill(Qt.GlobalColor.transparent)
+        pm_painter = QPainter(pm)
+        _render_bg(pm_painter, W, H, preset, antialias)
+        pm_painter.end()
+        _bg_pixmap_cache[key] = pm
+    return pm
+
+
+def _render_bg(painter: QPainter, W: float, H: float,
+               preset: BackgroundPreset, antialias: bool) -> None:
+    """Render a gradient or pattern background into a *W* × *H* area.
+
+    *antialias* only applies to the wave outlines; the gradient itself
+    is a straight image copy.
+    """
+    img = _bg_image(preset.kind, max(math.ceil(W), 1), max(math.ceil(H), 1),
+                    tuple(preset.color_top), tuple(preset.color_bottom))
+    painter.drawImage(0, 0, img)
 
-    # ── fit device into canvas ──────────────────────────────────────
+    if preset.kind == "wavy":
+        # Overlaid sine-wave layers
+        ct, cb = preset.qcolor_top, preset.qcolor_bottom
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialias)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for poly, (*_, alpha, use_top) in zip(_build_wave_polygons(W, H),
+                                               WAVE_LAYERS):
+            wave_c = QColor(ct if use_top else cb)
+            wave_c.setAlphaF(alpha)
+            painter.setBrush(wave_c)
+            painter.drawPolygon(poly)
+
+
+# ── Layout ──────────────────────────────────────────────────────────
+
+
+class _Layout(NamedTuple):
+    """Device and screen rectangles for one canvas / video / frame combo."""
+    dev_x: float
+    dev_y: float
+    dev_w: float
+    dev_h: float
+    scr_x: float
+    scr_y: float
+    scr_w: float
+    scr_h: float
+    bw: float
+    outer_r: float
+    inner_r: float
+    scale: float
+
+
+@lru_cache(maxsize=8)
+def _compute_layout(W: float, H: float, iw: int, ih: int,
+                    is_none: bool, padding: float, bezel_width: float,
+                    outer_radius: float, inner_radius: float) -> _Layout:
+    """Fit the device (or bare video) into a *W* × *H* canvas.
+
+    Takes the relevant ``FramePreset`` fields as plain values so the
+    result can be memoized: canvas, video size and frame are normally
+    constant for a whole preview session or export.
+    """
     video_aspect = iw / ih
-    dev_pad = fp.padding
+    dev_pad = padding
 
-    if fp.is_none:
+    if is_none:
         # No frame — video fills the entire canvas
         scr_x, scr_y = 0.0, 0.0
         scr_w, scr_h = W, H
@@ -165,7 +254,7 @@ def compose_scene(
         scale = 1.0
     else:
         preliminary_scale = (W - 2 * W * dev_pad) / 900.0
-        bw_est = fp.bezel_width * preliminary_scale
+        bw_est = bezel_width * preliminary_scale
         pad_x = W * dev_pad
         pad_y = H * dev_pad
         avail_w = W - 2 * pad_x
@@ -184,15 +273,113 @@ def compose_scene(
         dev_x = (W - dev_w) / 2
         dev_y = (H - dev_h) / 2
         scale = dev_w / 900.0
-        bw = fp.bezel_width * scale
-        outer_r = fp.outer_radius * scale
-        inner_r = fp.inner_radius * scale
+        bw = bezel_width * scale
+        outer_r = outer_radius * scale
+        inner_r = inner_radius * scale
 
         scr_x = dev_x + bw
         scr_y = dev_y + bw
         scr_w = dev_w - 2 * bw
         scr_h = dev_h - 2 * bw
 
+    return _Layout(dev_x, dev_y, dev_w, dev_h, scr_x, scr_y, scr_w, scr_h,
+                   bw, outer_r, inner_r, scale)
+
+
+# ── Device shadow ───────────────────────────────────────────────────
+
+def _fill_shadow_layers(p: QPainter, x: float, y: float, w: float, h: float,
+                        outer_r: float, layers: int) -> None:
+    """Fill the stacked drop-shadow paths for a device at (*x*, *y*)."""
+    for i in range(layers):
+        shadow_off = 2 + i * 2
+        sp = QPainterPath()
+        sp.addRoundedRect(
+            QRectF(x + shadow_off * 0.3, y + shadow_off, w, h),
+            outer_r + 2, outer_r + 2)
+        p.fillPath(sp, QColor(0, 0, 0, max(40 - i * 10, 5)))
+
+
+def _is_pixel_aligned(painter: QPainter) -> bool:
+    """True when *painter* maps user space 1:1 onto device pixels.
+
+    That is, no world scale/rotation, a whole-pixel translation and a
+    device pixel ratio of 1 — the only case where a pre-rendered image
+    can stand in for vector fills without being resampled.
+    """
+    t = painter.worldTransform()
+    if t.type().value > QTransform.TransformationType.TxTranslate.value:
+        return False
+    if t.dx() != math.floor(t.dx()) or t.dy() != math.floor(t.dy()):
+        return False
+    return painter.device().devicePixelRatioF() == 1.0
+
+
+@lru_cache(maxsize=8)
+def _shadow_image(dev_w: float, dev_h: float, frac_x: float, frac_y: float,
+                  outer_r: float, layers: int, antialias: bool) -> QImage:
+    """Pre-render the stacked device drop shadow into a transparent image.
+
+    The image's origin sits on the whole-pixel position below the device's
+    top-left corner; *frac_x* / *frac_y* carry the sub-pixel remainder so
+    the baked shadow lines up exactly with the old per-frame fills.  Only
+    valid for a pixel-aligned painter (see ``_is_pixel_aligned``).
+    """
+    max_off = 2 + (layers - 1) * 2
+    img = QImage(math.ceil(frac_x + dev_w + max_off * 0.3) + 1,
+                 math.ceil(frac_y + dev_h + max_off) + 1,
+                 QImage.Format.Format_ARGB32_Premultiplied)
+    img.fill(Qt.GlobalColor.transparent)
+    p = QPainter(img)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing, antialias)
+    _fill_shadow_layers(p, frac_x, frac_y, dev_w, dev_h, outer_r, layers)
+    p.end()
+    return img
+
+
+# ── Public API ──────────────────────────────────────────────────────
+
+
+def compose_scene(
+    painter: QPainter,
+    frame: QImage,
+    canvas_w: float,
+    canvas_h: float,
+    zoom: float = 1.0,
+    pan_x: float = 0.5,
+    pan_y: float = 0.5,
+    mouse_track: Optional[Union[MouseTrack, List[MousePosition]]] = None,
+    time_ms: float = 0.0,
+    monitor_rect: Optional[dict] = None,
+    bg_preset: Optional[BackgroundPreset] = None,
+    frame_preset: Optional[FramePreset] = None,
+    click_events: Optional[Union[ClickTrack, List[ClickEvent]]] = None,
+) -> None:
+    """Paint the device-frame composition onto *painter*.
+
+    Draws:  gradient background  →  device bezel  →  video inside screen
+            →  mouse cursor (if mouse_track provided).
+
+    When *zoom* > 1 the device scales up and pans so the point
+    (*pan_x*, *pan_y*) in the video stays centred in the output.
+    """
+    W, H = float(canvas_w), float(canvas_h)
+    iw, ih = frame.width(), frame.height()
+    if iw <= 0 or ih <= 0:
+        return
+
+    fp = frame_preset or DEFAULT_FRAME
+
+    # ── background ─────────────────────────────────────────────────
+    preset = bg_preset or DEFAULT_PRESET
+    _paint_bg(painter, W, H, preset)
+
+    # ── fit device into canvas ──────────────────────────────────────
+    (dev_x, dev_y, dev_w, dev_h, scr_x, scr_y, scr_w, scr_h,
+     bw, outer_r, inner_r, scale) = _compute_layout(
+        W, H, iw, ih, fp.is_none, fp.padding,
+        fp.bezel_width, fp.outer_radius, fp.inner_radius)
+
     # ── zoom ─────────────────────────────────────────────────────────
     # No Frame: crop source video only (background stays static).
     # Device frame: zoom entire canvas (physical device metaphor).
@@ -219,12 +406,18 @@ def compose_scene(
         device_rect = QRectF(dev_x, dev_y, dev_w, dev_h)
 
         # Drop shadow
-        for i in range(fp.shadow_layers):
-            shadow_off = 2 + i * 2
-            shadow_rect = QRectF(dev_x + shadow_off * 0.3, dev_y + shadow_off, dev_w, dev_h)
-            sp = QPainterPath()
-            sp.addRoundedRect(shadow_rect, outer_r + 2, outer_r + 2)
-            painter.fillPath(sp, QColor(0, 0, 0, max(40 - i * 10, 5)))
+        # The baked image is 1:1 in device pixels; under a zoom transform
+        # or on a HiDPI surface it would be upscaled and come out blurry,
+        # so fill the paths at full resolution instead.
+        if fp.shadow_layers > 0 and not _is_pixel_aligned(painter):
+            _fill_shadow_layers(painter, dev_x, dev_y, dev_w, dev_h,
+                                outer_r, fp.shadow_layers)
+        elif fp.shadow_layers > 0:
+            ox, oy = math.floor(dev_x), math.floor(dev_y)
+            painter.drawImage(QPointF(ox, oy), _shadow_image(
+                dev_w, dev_h, dev_x - ox, dev_y - oy, outer_r,
+                fp.shadow_layers,
+                painter.testRenderHint(QPainter.RenderHint.Antialiasing)))
 
         if bw > 0:
             # Outer edge + bezel body
@@ -266,51 +459,39 @@ def compose_scene(
         painter.drawEllipse(QPointF(cam_cx - cam_r * 0.2, cam_cy - cam_r * 0.2),
                             cam_r * 0.35, cam_r * 0.35)
 
-    # ── mouse cursor overlay ───────────────────────────────────────
-    if mouse_track and monitor_rect:
-        from .cursor_renderer import draw_cursor_qpainter
-        if _zoom_video_only and zoom > 1.001:
+    # ── mouse cursor & click effect overlays ──────────────────────
+    draw_cursor = bool(mouse_track and monitor_rect)
+    draw_clicks = bool(click_events and monitor_rect)
+    if draw_cursor or draw_clicks:
+        clip_overlays = _zoom_video_only and zoom > 1.001
+        if clip_overlays:
             # No Frame + zoom: virtual screen rect for cropped video
             src = source_rect
-            vscr_w = scr_w * (iw / src.width())
-            vscr_h = scr_h * (ih / src.height())
-            vscr_x = scr_x - (src.x() / iw) * vscr_w
-            vscr_y = scr_y - (src.y() / ih) * vscr_h
+            ov_w = scr_w * (iw / src.width())
+            ov_h = scr_h * (ih / src.height())
+            ov_x = scr_x - (src.x() / iw) * ov_w
+            ov_y = scr_y - (src.y() / ih) * ov_h
             painter.save()
             painter.setClipRect(QRectF(scr_x, scr_y, scr_w, scr_h))
-            draw_cursor_qpainter(
-                painter, mouse_track, time_ms, monitor_rect,
-                vscr_x, vscr_y, vscr_w, vscr_h,
-            )
-            painter.restore()
         else:
             # Device frame (zoomed via painter transform) or no zoom
+            ov_x, ov_y, ov_w, ov_h = scr_x, scr_y, scr_w, scr_h
+
+        # One render-hint change covers both overlays
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        if draw_cursor:
             draw_cursor_qpainter(
                 painter, mouse_track, time_ms, monitor_rect,
-                scr_x, scr_y, scr_w, scr_h,
+                ov_x, ov_y, ov_w, ov_h,
             )
-
-    # ── click effects overlay ──────────────────────────────────────
-    if click_events and monitor_rect:
-        from .cursor_renderer import draw_clicks_qpainter
-        if _zoom_video_only and zoom > 1.001:
-            src = source_rect
-            vscr_w = scr_w * (iw / src.width())
-            vscr_h = scr_h * (ih / src.height())
-            vscr_x = scr_x - (src.x() / iw) * vscr_w
-            vscr_y = scr_y - (src.y() / ih) * vscr_h
-            painter.save()
-            painter.setClipRect(QRectF(scr_x, scr_y, scr_w, scr_h))
+        if draw_clicks:
             draw_clicks_qpainter(
                 painter, click_events, time_ms, monitor_rect,
-                vscr_x, vscr_y, vscr_w, vscr_h,
+                ov_x, ov_y, ov_w, ov_h,
             )
+
+        if clip_overlays:
             painter.restore()
-        else:
-            draw_clicks_qpainter(
-                painter, click_events, time_ms, monitor_rect,
-                scr_x, scr_y, scr_w, scr_h,
-            )
 
 
 def draw_empty_bg(painter: QPainter, w: float, h: float,
@@ -5,7 +5,8 @@ Provides both QPainter-based (for live preview) and numpy/OpenCV-based
 Also renders click ripple effects at recorded click positions.
 """
 
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
 
 import cv2
 import numpy as np
@@ -17,6 +18,7 @@ from PySide6.QtGui import (
     QPainterPath,
     QPen,
     QBrush,
+    QTransform,
 )
 
 from .models import MousePosition, ClickEvent
@@ -24,8 +26,10 @@ from .models import MousePosition, ClickEvent
 
 # ── Cursor appearance ───────────────────────────────────────────────
 
-CURSOR_COLOR = (255, 255, 255)       # white  (RGB for QPainter, BGR for CV)
+CURSOR_COLOR = (255, 255, 255)       # white  (RGB for QPainter)
+CURSOR_COLOR_BGR = CURSOR_COLOR[::-1]
 CURSOR_OUTLINE = (30, 30, 30)        # near-black outline (softer than pure black)
+CURSOR_OUTLINE_BGR = CURSOR_OUTLINE[::-1]
 CURSOR_OUTLINE_W = 2.0               # outline width
 CURSOR_SHADOW_ALPHA = 80             # drop shadow opacity (0-255)
 
@@ -34,36 +38,172 @@ CURSOR_SHADOW_ALPHA = 80             # drop shadow opacity (0-255)
 CLICK_DURATION_MS = 400.0            # how long the click ripple is visible
 CLICK_COLOR = (138, 92, 246)         # purple (#8b5cf6) in RGB
 CLICK_COLOR_BGR = (246, 92, 138)     # purple in BGR for OpenCV
+# CLICK_COLOR_BGR scaled by i/255 for i in 0..255 — ripple fades index
+# this instead of building a colour tuple per click per frame
+_CLICK_BGR_RAMP = [tuple(int(c * i / 255) for c in CLICK_COLOR_BGR) for i in range(256)]
 CLICK_MAX_RADIUS = 24.0              # max ripple radius (preview, scaled)
+CLICK_AA_MIN_RADIUS = 32             # export: anti-alias rings at least this big
+CLICK_AA_MIN_THICKNESS = 2           # … and at least this thick
+
+# Ripple animation ramps, sampled at _RIPPLE_STEPS points of the
+# normalized click age t ∈ [0, 1] and indexed with the nearest step, so
+# drawing a ripple is a table lookup instead of a handful of float ops.
+_RIPPLE_STEPS = 64
+_RIPPLE_T = np.linspace(0.0, 1.0, _RIPPLE_STEPS)
+_RIPPLE_RADIUS_FRAC = (0.3 + 0.7 * _RIPPLE_T).tolist()
+# Preview (QPainter): ring alpha / pen width, dot alpha / radius
+_RIPPLE_RING_ALPHA = (220 * (1.0 - _RIPPLE_T)).astype(int).tolist()
+_RIPPLE_RING_PEN_W = np.maximum(2.0, 3.0 * (1.0 - _RIPPLE_T)).tolist()
+_RIPPLE_DOT_ALPHA = (200 * np.maximum(0.0, 1.0 - _RIPPLE_T * 1.8)).astype(int).tolist()
+_RIPPLE_DOT_R = np.maximum(3.0, 5.0 * (1.0 - _RIPPLE_T * 0.5)).tolist()
+# Export (OpenCV): ring thickness / _CLICK_BGR_RAMP index (-1 = hidden),
+# dot radius / ramp index
+_RIPPLE_CV_THICKNESS = np.maximum(1, (3.0 * (1.0 - _RIPPLE_T)).astype(int)).tolist()
+_RIPPLE_CV_RING_SHADE = np.where(
+    1.0 - _RIPPLE_T > 0.05, ((1.0 - _RIPPLE_T) * 0.85 * 255).astype(int), -1,
+).tolist()
+_RIPPLE_CV_DOT_R = np.maximum(2, (5.0 * (1.0 - _RIPPLE_T * 0.5)).astype(int)).tolist()
+_RIPPLE_CV_DOT_SHADE = np.where(
+    np.maximum(0.0, 1.0 - _RIPPLE_T * 1.8) > 0.05,
+    (np.maximum(0.0, 1.0 - _RIPPLE_T * 1.8) * 0.8 * 255).astype(int), -1,
+).tolist()
+
+
+class MouseTrack:
+    """Structure-of-arrays copy of a recorded mouse track.
+
+    Holds the sample timestamps and coordinates as parallel ``float64``
+    arrays so interpolation can locate its interval with
+    ``np.searchsorted`` instead of a Python-level bisect over
+    :class:`MousePosition` objects.  Build it once per preview session
+    or export and reuse it for every frame.
+    """
 
+    __slots__ = ("ts", "xs", "ys")
+
+    def __init__(self, ts: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> None:
+        self.ts = ts
+        self.xs = xs
+        self.ys = ys
+
+    @classmethod
+    def from_positions(cls, track: Sequence[MousePosition]) -> "MouseTrack":
+        n = len(track)
+        return cls(
+            np.fromiter((p.timestamp for p in track), np.float64, n),
+            np.fromiter((p.x for p in track), np.float64, n),
+            np.fromiter((p.y for p in track), np.float64, n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def positions_at(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized :func:`_interp_mouse` for an array of *times*.
+
+        Returns ``(xs, ys)`` arrays shaped like *times*.  The track must
+        not be empty.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        ts, xs, ys = self.ts, self.xs, self.ys
+        n = len(ts)
+        if n == 1:
+            return np.full(times.shape, xs[0]), np.full(times.shape, ys[0])
+
+        hi = np.clip(np.searchsorted(ts, times, side="right"), 1, n - 1)
+        lo = hi - 1
+        dt = ts[hi] - ts[lo]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(dt > 0, (times - ts[lo]) / dt, 0.0)
+        out_x = xs[lo] + (xs[hi] - xs[lo]) * t
+        out_y = ys[lo] + (ys[hi] - ys[lo]) * t
+
+        # Clamp to the first / last sample outside the recorded range
+        before = times <= ts[0]
+        after = times >= ts[-1]
+        out_x[before], out_y[before] = xs[0], ys[0]
+        out_x[after], out_y[after] = xs[-1], ys[-1]
+        return out_x, out_y
+
+
+def as_mouse_track(track: Union[MouseTrack, Sequence[MousePosition]]) -> MouseTrack:
+    """Return *track* as a :class:`MouseTrack`, converting lists once."""
+    if isinstance(track, MouseTrack):
+        return track
+    return MouseTrack.from_positions(track)
+
+
+class ClickTrack:
+    """Structure-of-arrays copy of recorded clicks, sorted by timestamp.
+
+    Ripples are only visible for ``CLICK_DURATION_MS`` after a click, so
+    each frame can slice out the visible clicks with two
+    ``np.searchsorted`` calls instead of testing every recorded click.
+    """
 
-def _interp_mouse(track: List[MousePosition], time_ms: float) -> Optional[Tuple[float, float]]:
+    __slots__ = ("ts", "xs", "ys")
+
+    def __init__(self, ts: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> None:
+        self.ts = ts
+        self.xs = xs
+        self.ys = ys
+
+    @classmethod
+    def from_events(cls, events: Sequence[ClickEvent]) -> "ClickTrack":
+        n = len(events)
+        ts = np.fromiter((c.timestamp for c in events), np.float64, n)
+        xs = np.fromiter((c.x for c in events), np.float64, n)
+        ys = np.fromiter((c.y for c in events), np.float64, n)
+        order = np.argsort(ts, kind="stable")
+        return cls(ts[order], xs[order], ys[order])
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def visible(
+        self, time_ms: float,
+    ) -> Tuple[List[float], List[float], List[float]]:
+        """``(ts, xs, ys)`` lists of the clicks whose ripple shows at *time_ms*."""
+        ts = self.ts
+        lo = int(np.searchsorted(ts, time_ms - CLICK_DURATION_MS, side="left"))
+        hi = int(np.searchsorted(ts, time_ms, side="right"))
+        if lo >= hi:
+            return [], [], []
+        return ts[lo:hi].tolist(), self.xs[lo:hi].tolist(), self.ys[lo:hi].tolist()
+
+
+def as_click_track(events: Union[ClickTrack, Sequence[ClickEvent]]) -> ClickTrack:
+    """Return *events* as a :class:`ClickTrack`, converting lists once."""
+    if isinstance(events, ClickTrack):
+        return events
+    return ClickTrack.from_events(events)
+
+
+def _interp_mouse(track: MouseTrack, time_ms: float) -> Optional[Tuple[float, float]]:
     """Interpolate mouse position at *time_ms* from recorded track.
 
     Returns (x, y) in absolute screen coordinates, or None if no data.
     """
-    if not track:
+    ts = track.ts
+    n = len(ts)
+    if n == 0:
         return None
-    if time_ms <= track[0].timestamp:
-        return track[0].x, track[0].y
-    if time_ms >= track[-1].timestamp:
-        return track[-1].x, track[-1].y
-
-    # Binary search for the right interval
-    lo, hi = 0, len(track) - 1
-    while lo < hi - 1:
-        mid = (lo + hi) // 2
-        if track[mid].timestamp <= time_ms:
-            lo = mid
-        else:
-            hi = mid
-
-    a, b = track[lo], track[hi]
-    dt = b.timestamp - a.timestamp
+    xs, ys = track.xs, track.ys
+    if time_ms <= ts[0]:
+        return float(xs[0]), float(ys[0])
+    if time_ms >= ts[-1]:
+        return float(xs[-1]), float(ys[-1])
+
+    # First sample strictly after time_ms → interval [hi - 1, hi]
+    hi = int(np.searchsorted(ts, time_ms, side="right"))
+    lo = hi - 1
+
+    dt = ts[hi] - ts[lo]
     if dt <= 0:
-        return a.x, a.y
-    t = (time_ms - a.timestamp) / dt
-    return a.x + (b.x - a.x) * t, a.y + (b.y - a.y) * t
+        return float(xs[lo]), float(ys[lo])
+    t = (time_ms - ts[lo]) / dt
+    return (float(xs[lo] + (xs[hi] - xs[lo]) * t),
+            float(ys[lo] + (ys[hi] - ys[lo]) * t))
 
 
 # ── Classic arrow cursor shape (normalized, tip at 0,0) ─────────────
@@ -81,12 +221,48 @@ _ARROW_POINTS = [
 ]
 
 
+def _build_arrow_path() -> QPainterPath:
+    """The arrow outline in normalized units (height 1, tip at 0,0)."""
+    path = QPainterPath()
+    path.moveTo(*_ARROW_POINTS[0])
+    for ax, ay in _ARROW_POINTS[1:]:
+        path.lineTo(ax, ay)
+    path.closeSubpath()
+    return path
+
+
+_ARROW_PATH = _build_arrow_path()
+
+# Preview paint state, created once instead of per frame
+_SHADOW_BRUSH = QBrush(QColor(0, 0, 0, CURSOR_SHADOW_ALPHA))
+_FILL_BRUSH = QBrush(QColor(*CURSOR_COLOR))
+
+
+@lru_cache(maxsize=8)
+def _outline_pen(width: float) -> QPen:
+    """Cursor outline pen — *width* only changes when the preview resizes."""
+    return QPen(QColor(*CURSOR_OUTLINE), width, Qt.PenStyle.SolidLine,
+                Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+
+
+@lru_cache(maxsize=_RIPPLE_STEPS)
+def _ripple_ring_pen(step: int) -> QPen:
+    """Ring pen for ripple animation *step* (see the ``_RIPPLE_*`` ramps)."""
+    return QPen(QColor(*CLICK_COLOR, _RIPPLE_RING_ALPHA[step]), _RIPPLE_RING_PEN_W[step])
+
+
+@lru_cache(maxsize=_RIPPLE_STEPS)
+def _ripple_dot_brush(step: int) -> QBrush:
+    """Dot brush for ripple animation *step*."""
+    return QBrush(QColor(*CLICK_COLOR, _RIPPLE_DOT_ALPHA[step]))
+
+
 # ── QPainter-based cursor (for live preview) ───────────────────────
 
 
 def draw_cursor_qpainter(
     painter: QPainter,
-    track: List[MousePosition],
+    track: Union[MouseTrack, List[MousePosition]],
     time_ms: float,
     monitor_rect: dict,
     screen_rect_x: float,
@@ -96,10 +272,15 @@ def draw_cursor_qpainter(
 ) -> None:
     """Draw a cursor on the preview compositor's screen area.
 
+    Antialiasing is left to the caller, which enables it once for all
+    overlays (see :func:`compose_scene`).
+
+    *track* should be a prebuilt :class:`MouseTrack`; a plain list is
+    converted on every call.
     *monitor_rect* = dict with left/top/width/height of the captured monitor.
     *screen_rect_*  = pixel position of the screen area in painter coordinates.
     """
-    pos = _interp_mouse(track, time_ms)
+    pos = _interp_mouse(as_mouse_track(track), time_ms)
     if pos is None:
         return
 
@@ -120,42 +301,41 @@ def draw_cursor_qpainter(
     # Cursor size scales with screen rect
     cs = max(14.0, screen_rect_h * 0.032)
 
-    path = QPainterPath()
-    pts = _ARROW_POINTS
-    path.moveTo(px + pts[0][0] * cs, py + pts[0][1] * cs)
-    for ax, ay in pts[1:]:
-        path.lineTo(px + ax * cs, py + ay * cs)
-    path.closeSubpath()
-
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    # Map the prebuilt unit arrow to painter coords in one C++ call;
+    # the path keeps its device-space geometry, so stroking is unchanged
+    path = QTransform(cs, 0.0, 0.0, cs, px, py).map(_ARROW_PATH)
 
     # Drop shadow (offset + translucent)
     shadow_off = max(1.5, cs * 0.08)
-    shadow_path = QPainterPath()
-    shadow_path.moveTo(px + pts[0][0] * cs + shadow_off, py + pts[0][1] * cs + shadow_off)
-    for ax, ay in pts[1:]:
-        shadow_path.lineTo(px + ax * cs + shadow_off, py + ay * cs + shadow_off)
-    shadow_path.closeSubpath()
+    shadow_path = QTransform(cs, 0.0, 0.0, cs, px + shadow_off, py + shadow_off).map(_ARROW_PATH)
     painter.setPen(Qt.PenStyle.NoPen)
-    painter.setBrush(QBrush(QColor(0, 0, 0, CURSOR_SHADOW_ALPHA)))
+    painter.setBrush(_SHADOW_BRUSH)
     painter.drawPath(shadow_path)
 
-    # Outline
-    outline_w = max(CURSOR_OUTLINE_W, cs * 0.07)
-    painter.setPen(QPen(QColor(*CURSOR_OUTLINE), outline_w, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin))
-    painter.setBrush(QBrush(QColor(*CURSOR_COLOR)))
+    # Outline + fill
+    painter.setPen(_outline_pen(max(CURSOR_OUTLINE_W, cs * 0.07)))
+    painter.setBrush(_FILL_BRUSH)
     painter.drawPath(path)
 
 
 # ── OpenCV/numpy-based cursor (for export) ─────────────────────────
 
 
-def _build_cursor_template(height: int) -> Tuple[np.ndarray, np.ndarray]:
+@lru_cache(maxsize=8)
+def _build_cursor_template(
+    height: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Pre-render a cursor image + alpha mask at the given pixel height.
 
-    Returns (cursor_bgr, cursor_alpha) both of shape (H, W).
-    The cursor tip is at (0, 0) in the returned image.
+    Returns ``(cursor_bgr, cursor_alpha, cursor_premul, cursor_inv_alpha)``:
+    the (H, W, 3) colour and (H, W) alpha of the cursor, plus the
+    ``uint16`` blend operands used by :func:`draw_cursor_cv` — colour
+    premultiplied by alpha, shape (H, W, 3), and ``255 - alpha``, shape
+    (H, W, 1).  The cursor tip is at (0, 0) in the returned image.
     Includes a soft drop shadow for depth.
+
+    Results are memoized per *height* and returned read-only, since the
+    same arrays are shared by every caller.
     """
     h = max(height, 8)
     w = int(h * 0.7) + 2  # ensure enough width
@@ -180,79 +360,132 @@ def _build_cursor_template(height: int) -> Tuple[np.ndarray, np.ndarray]:
 
     # Outline (dark, slightly thicker)
     outline_thick = max(2, int(h * 0.09))
-    cv2.fillPoly(cursor_bgra, [pts], (*CURSOR_OUTLINE[::-1], 255))
-    cv2.polylines(cursor_bgra, [pts], True, (*CURSOR_OUTLINE[::-1], 255), outline_thick, cv2.LINE_AA)
+    cv2.fillPoly(cursor_bgra, [pts], (*CURSOR_OUTLINE_BGR, 255))
+    cv2.polylines(cursor_bgra, [pts], True, (*CURSOR_OUTLINE_BGR, 255), outline_thick, cv2.LINE_AA)
 
     # Inner fill (white)
-    cv2.fillPoly(cursor_bgra, [pts], (255, 255, 255, 255))
-
-    # Trim to bounding box
-    alpha = cursor_bgra[:, :, 3]
-    rows = np.any(alpha > 0, axis=1)
-    cols = np.any(alpha > 0, axis=0)
-    if not rows.any():
-        return np.zeros((1, 1, 3), dtype=np.uint8), np.zeros((1, 1), dtype=np.uint8)
-    rmin, rmax = np.where(rows)[0][[0, -1]]
-    cmin, cmax = np.where(cols)[0][[0, -1]]
-    cropped = cursor_bgra[rmin:rmax + 1, cmin:cmax + 1]
+    cv2.fillPoly(cursor_bgra, [pts], (*CURSOR_COLOR_BGR, 255))
+
+    # Trim to the bounding box of the non-zero alpha pixels
+    bx, by, bw, bh = cv2.boundingRect(cursor_bgra[:, :, 3])
+    if bw == 0:
+        cropped = np.zeros((1, 1, 4), dtype=np.uint8)
+    else:
+        cropped = cursor_bgra[by:by + bh, bx:bx + bw]
 
     cursor_bgr = cropped[:, :, :3]
     cursor_alpha = cropped[:, :, 3]
-    return cursor_bgr, cursor_alpha
+    # Fixed-point blend operands — constant for the template, so the
+    # per-frame blend is pure uint16 integer math
+    alpha_u16 = cursor_alpha[:, :, np.newaxis].astype(np.uint16)
+    cursor_premul = cursor_bgr.astype(np.uint16) * alpha_u16
+    cursor_inv_alpha = 255 - alpha_u16
+    result = (cursor_bgr, cursor_alpha, cursor_premul, cursor_inv_alpha)
+    for arr in result:
+        arr.setflags(write=False)
+    return result
 
 
 def draw_cursor_cv(
     frame_bgr: np.ndarray,
-    track: List[MousePosition],
+    track: Union[MouseTrack, List[MousePosition]],
     time_ms: float,
     mon_left: int,
     mon_top: int,
     mon_w: int,
     mon_h: int,
-    cursor_bgr: np.ndarray,
-    cursor_alpha: np.ndarray,
+    cursor_premul: np.ndarray,
+    cursor_inv_alpha: np.ndarray,
 ) -> None:
     """Draw cursor onto *frame_bgr* in-place.
 
     *frame_bgr* is the raw video frame (same resolution as monitor).
-    The cursor template is pre-built via _build_cursor_template().
+    *track* should be a prebuilt :class:`MouseTrack`.
+    *cursor_premul* / *cursor_inv_alpha* are the blend operands returned
+    by _build_cursor_template().
     """
-    pos = _interp_mouse(track, time_ms)
+    pos = _interp_mouse(as_mouse_track(track), time_ms)
     if pos is None:
         return
 
     mx, my = pos
     fh, fw = frame_bgr.shape[:2]
-    ch, cw = cursor_bgr.shape[:2]
 
     # Position in frame pixels
     px = int((mx - mon_left) / max(mon_w, 1) * fw)
     py = int((my - mon_top) / max(mon_h, 1) * fh)
 
-    # Bounds check
-    x1, y1 = px, py
-    x2, y2 = px + cw, py + ch
+    draw_cursor_cv_at(frame_bgr, px, py, cursor_premul, cursor_inv_alpha)
+
 
-    # Clip to frame
-    src_x1 = max(0, -x1)
-    src_y1 = max(0, -y1)
-    x1 = max(0, x1)
-    y1 = max(0, y1)
-    x2 = min(fw, x2)
-    y2 = min(fh, y2)
-    src_x2 = src_x1 + (x2 - x1)
-    src_y2 = src_y1 + (y2 - y1)
+def cursor_pixels_at(
+    track: MouseTrack,
+    times: np.ndarray,
+    mon_left: int,
+    mon_top: int,
+    mon_w: int,
+    mon_h: int,
+    frame_w: int,
+    frame_h: int,
+) -> Tuple[List[int], List[int]]:
+    """Cursor tip positions in frame pixels for every time in *times*.
+
+    Batch version of the interpolation + monitor mapping done by
+    :func:`draw_cursor_cv`, for callers that know all frame times up
+    front (the exporter).  Returns plain ``int`` lists, identical to the
+    per-frame computation.
+    """
+    mx, my = track.positions_at(times)
+    pxs = ((mx - mon_left) / max(mon_w, 1) * frame_w).astype(np.int64)
+    pys = ((my - mon_top) / max(mon_h, 1) * frame_h).astype(np.int64)
+    return pxs.tolist(), pys.tolist()
+
+
+def draw_cursor_cv_at(
+    frame_bgr: np.ndarray,
+    px: int,
+    py: int,
+    cursor_premul: np.ndarray,
+    cursor_inv_alpha: np.ndarray,
+    scratch: Optional[np.ndarray] = None,
+) -> None:
+    """Draw the cursor template with its tip at frame pixel (*px*, *py*).
+
+    Clipping, ROI selection and the blend happen in this one routine on
+    views of *frame_bgr* and the template.  The blend computes
+    ``round((c·a + bg·(255 - a)) / 255)`` in ``uint16``, writing every
+    step into one work buffer via ``out=``.  ``x / 255`` never has a
+    fractional part of exactly one half, so ``(x + 127) // 255`` rounds
+    to nearest.
+
+    *scratch* — optional ``uint16`` buffer at least the template's shape,
+    reused across frames so the blend allocates nothing.
+    """
+    fh, fw = frame_bgr.shape[:2]
+    ch, cw = cursor_premul.shape[:2]
 
+    # Clip the template rect [px, px+cw) × [py, py+ch) to the frame
+    x1, y1 = max(px, 0), max(py, 0)
+    x2, y2 = min(px + cw, fw), min(py + ch, fh)
     if x2 <= x1 or y2 <= y1:
         return
+    sx, sy = x1 - px, y1 - py
+    h, w = y2 - y1, x2 - x1
 
     roi = frame_bgr[y1:y2, x1:x2]
-    c_roi = cursor_bgr[src_y1:src_y2, src_x1:src_x2]
-    a_roi = cursor_alpha[src_y1:src_y2, src_x1:src_x2]
-
-    alpha = a_roi[:, :, np.newaxis].astype(np.float32) / 255.0
-    blended = (c_roi.astype(np.float32) * alpha + roi.astype(np.float32) * (1 - alpha))
-    np.copyto(roi, blended.astype(np.uint8))
+    # Fully transparent / opaque pixels are not special-cased: the dense
+    # blend already leaves them exact, and at cursor sizes (a few hundred
+    # pixels) gathering and scattering the partial-alpha rim by index
+    # costs more than one contiguous pass over the whole patch.
+    if scratch is None:
+        acc = np.empty((h, w, 3), dtype=np.uint16)
+    else:
+        acc = scratch[:h, :w]
+    np.multiply(roi, cursor_inv_alpha[sy:sy + h, sx:sx + w], out=acc)
+    np.add(acc, cursor_premul[sy:sy + h, sx:sx + w], out=acc)
+    np.add(acc, 127, out=acc)
+    np.floor_divide(acc, 255, out=acc)
+    np.copyto(roi, acc, casting="unsafe")
 
 
 # ── QPainter-based click effects (for live preview) ────────────────
@@ -260,7 +493,7 @@ def draw_cursor_cv(
 
 def draw_clicks_qpainter(
     painter: QPainter,
-    click_events: List[ClickEvent],
+    click_events: Union[ClickTrack, List[ClickEvent]],
     time_ms: float,
     monitor_rect: dict,
     screen_rect_x: float,
@@ -268,8 +501,15 @@ def draw_clicks_qpainter(
     screen_rect_w: float,
     screen_rect_h: float,
 ) -> None:
-    """Draw expanding ripple effects for recent clicks on the preview."""
-    if not click_events:
+    """Draw expanding ripple effects for recent clicks on the preview.
+
+    *click_events* should be a prebuilt :class:`ClickTrack`; a plain
+    list is converted on every call.
+    """
+    if not len(click_events):
+        return
+    vis_ts, vis_xs, vis_ys = as_click_track(click_events).visible(time_ms)
+    if not vis_ts:
         return
 
     mon_w = max(monitor_rect.get("width", 1), 1)
@@ -280,80 +520,91 @@ def draw_clicks_qpainter(
     # Scale ripple radius with preview size
     max_r = max(CLICK_MAX_RADIUS, screen_rect_h * 0.025)
 
-    for click in click_events:
-        age = time_ms - click.timestamp
-        if age < 0 or age > CLICK_DURATION_MS:
-            continue
+    step_scale = (_RIPPLE_STEPS - 1) / CLICK_DURATION_MS
 
-        t = age / CLICK_DURATION_MS  # 0 → 1
+    for ts, cx, cy in zip(vis_ts, vis_xs, vis_ys):
+        k = int((time_ms - ts) * step_scale + 0.5)  # nearest ramp step
 
         # Map click position to screen rect
-        nx = (click.x - mon_left) / mon_w
-        ny = (click.y - mon_top) / mon_h
+        nx = (cx - mon_left) / mon_w
+        ny = (cy - mon_top) / mon_h
         px = screen_rect_x + nx * screen_rect_w
         py = screen_rect_y + ny * screen_rect_h
 
         # Expanding ring with fade
-        radius = max_r * (0.3 + 0.7 * t)
-        ring_alpha = int(220 * (1.0 - t))
-        if ring_alpha > 0:
-            color = QColor(*CLICK_COLOR, ring_alpha)
-            pen_w = max(2.0, 3.0 * (1.0 - t))
-            painter.setPen(QPen(color, pen_w))
+        radius = max_r * _RIPPLE_RADIUS_FRAC[k]
+        if _RIPPLE_RING_ALPHA[k] > 0:
+            painter.setPen(_ripple_ring_pen(k))
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawEllipse(QPointF(px, py), radius, radius)
 
         # Inner solid dot (fades faster)
-        dot_alpha = int(200 * max(0.0, 1.0 - t * 1.8))
-        if dot_alpha > 0:
+        if _RIPPLE_DOT_ALPHA[k] > 0:
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(*CLICK_COLOR, dot_alpha))
-            dot_r = max(3.0, 5.0 * (1.0 - t * 0.5))
+            painter.setBrush(_ripple_dot_brush(k))
+            dot_r = _RIPPLE_DOT_R[k]
             painter.drawEllipse(QPointF(px, py), dot_r, dot_r)
 
 
 # ── OpenCV/numpy-based click effects (for export) ──────────────────
 
 
+def _cv_line_type(radius: int, thickness: int) -> int:
+    """Pick the OpenCV line type for a ripple circle.
+
+    Anti-aliased rasterization is much slower than ``LINE_8`` and makes
+    no visible difference on thin, small rings, so it is only used once
+    the ring is large and thick enough to show stair-stepping.
+    """
+    if radius >= CLICK_AA_MIN_RADIUS and thickness >= CLICK_AA_MIN_THICKNESS:
+        return cv2.LINE_AA
+    return cv2.LINE_8
+
+
 def draw_clicks_cv(
     frame_bgr: np.ndarray,
-    click_events: List[ClickEvent],
+    click_events: Union[ClickTrack, List[ClickEvent]],
     time_ms: float,
     mon_left: int,
     mon_top: int,
     mon_w: int,
     mon_h: int,
 ) -> None:
-    """Draw expanding ripple effects for recent clicks onto *frame_bgr* in-place."""
-    if not click_events:
+    """Draw expanding ripple effects for recent clicks onto *frame_bgr* in-place.
+
+    *click_events* should be a prebuilt :class:`ClickTrack`; a plain
+    list is converted on every call.
+    """
+    if not len(click_events):
+        return
+    vis_ts, vis_xs, vis_ys = as_click_track(click_events).visible(time_ms)
+    if not vis_ts:
         return
 
     fh, fw = frame_bgr.shape[:2]
     max_r = max(20, int(fh * 0.015))
+    ramp = _CLICK_BGR_RAMP
 
-    for click in click_events:
-        age = time_ms - click.timestamp
-        if age < 0 or age > CLICK_DURATION_MS:
-            continue
+    step_scale = (_RIPPLE_STEPS - 1) / CLICK_DURATION_MS
 
-        t = age / CLICK_DURATION_MS
+    for ts, cx, cy in zip(vis_ts, vis_xs, vis_ys):
+        k = int((time_ms - ts) * step_scale + 0.5)  # nearest ramp step
 
         # Position in frame pixels
-        px = int((click.x - mon_left) / max(mon_w, 1) * fw)
-        py = int((click.y - mon_top) / max(mon_h, 1) * fh)
+        px = int((cx - mon_left) / max(mon_w, 1) * fw)
+        py = int((cy - mon_top) / max(mon_h, 1) * fh)
 
         # Expanding ring with fade
-        radius = int(max_r * (0.3 + 0.7 * t))
-        ring_alpha = 1.0 - t
-        if ring_alpha > 0.05:
-            thickness = max(1, int(3.0 * (1.0 - t)))
+        shade = _RIPPLE_CV_RING_SHADE[k]
+        if shade >= 0:
+            radius = int(max_r * _RIPPLE_RADIUS_FRAC[k])
+            thickness = _RIPPLE_CV_THICKNESS[k]
             # Draw directly — small visual element, no need for alpha blending
-            color_scaled = tuple(int(c * ring_alpha * 0.85) for c in CLICK_COLOR_BGR)
-            cv2.circle(frame_bgr, (px, py), radius, color_scaled, thickness, cv2.LINE_AA)
-
-        # Inner solid dot
-        dot_alpha = max(0.0, 1.0 - t * 1.8)
-        if dot_alpha > 0.05:
-            dot_r = max(2, int(5.0 * (1.0 - t * 0.5)))
-            color_dot = tuple(int(c * dot_alpha * 0.8) for c in CLICK_COLOR_BGR)
-            cv2.circle(frame_bgr, (px, py), dot_r, color_dot, -1, cv2.LINE_AA)
+            cv2.circle(frame_bgr, (px, py), radius, ramp[shade], thickness,
+                       _cv_line_type(radius, thickness))
+
+        # Inner solid dot — always well under the anti-aliasing threshold
+        shade = _RIPPLE_CV_DOT_SHADE[k]
+        if shade >= 0:
+            cv2.circle(frame_bgr, (px, py), _RIPPLE_CV_DOT_R[k], ramp[shade], -1,
+                       cv2.LINE_8)
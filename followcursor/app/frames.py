@@ -5,12 +5,15 @@ Includes "No Frame" for a clean borderless look.
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class FramePreset:
-    """A named device-frame style."""
+    """A named device-frame style.
+
+    Frozen, so the built-in presets can be shared (and hashed) freely.
+    """
     name: str
     bezel_width: float        # px at reference width (900px device)
     outer_radius: float       # corner radius of outer shell
@@ -39,7 +42,14 @@ class FramePreset:
 
     @staticmethod
     def from_dict(d: dict) -> "FramePreset":
-        """Reconstruct from a dict produced by ``to_dict()``."""
+        """Reconstruct from a dict produced by ``to_dict()``.
+
+        A dict matching a built-in preset returns that shared instance
+        rather than a copy; anything else is rebuilt field by field.
+        """
+        builtin = FRAME_PRESETS_BY_NAME.get(d.get("name"))
+        if builtin is not None and _BUILTIN_FRAME_DICTS[builtin.name] == d:
+            return builtin
         return FramePreset(
             name=d["name"],
             bezel_width=d["bezel_width"],
@@ -95,3 +105,8 @@ FRAME_PRESETS: List[FramePreset] = [
 ]
 
 DEFAULT_FRAME = FRAME_PRESETS[0]  # "Wide Bezel"
+
+FRAME_PRESETS_BY_NAME: Dict[str, FramePreset] = {fp.name: fp for fp in FRAME_PRESETS}
+
+# Serialized form of each built-in, for interning in ``from_dict``
+_BUILTIN_FRAME_DICTS: Dict[str, dict] = {fp.name: fp.to_dict() for fp in FRAME_PRESETS}
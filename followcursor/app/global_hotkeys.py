@@ -38,9 +38,12 @@ class _HotkeyThread(QThread):
             user32.RegisterHotKey(None, hk_id, mods, vk)
 
         msg = wintypes.MSG()
-        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+        p_msg = ctypes.byref(msg)
+        get_message = user32.GetMessageW
+        emit = self.triggered.emit
+        while get_message(p_msg, None, 0, 0) > 0:
             if msg.message == WM_HOTKEY:
-                self.triggered.emit(msg.wParam)
+                emit(msg.wParam)
 
         for hk_id, _mods, _vk in self._hotkeys:
             user32.UnregisterHotKey(None, hk_id)
@@ -5,6 +5,7 @@ Also writes an .ico file on first run so Windows taskbar picks it up.
 
 import os
 import struct
+from functools import lru_cache
 from typing import List, Tuple
 
 from PySide6.QtCore import Qt, QPointF, QBuffer, QIODevice
@@ -23,6 +24,15 @@ from PySide6.QtGui import (
 
 _ICO_CACHE: str | None = None
 
+# PNG "quality" for embedded .ico images — Qt maps 80 to zlib level 1,
+# the fastest deflate setting; these tiny images barely compress further.
+_ICO_PNG_QUALITY = 80
+
+_ICO_HEADER = struct.Struct("<HHH")
+_ICO_ENTRY = struct.Struct("<BBBBHHII")
+
+_ICON_SIZES = (16, 24, 32, 48, 64, 128, 256)
+
 
 def create_app_icon() -> QIcon:
     """Return a multi-size QIcon for the application.
@@ -31,7 +41,7 @@ def create_app_icon() -> QIcon:
     so that SetCurrentProcessExplicitAppUserModelID can find it.
     """
     icon = QIcon()
-    for size in (16, 24, 32, 48, 64, 128, 256):
+    for size in _ICON_SIZES:
         icon.addPixmap(_render(size))
     return icon
 
@@ -43,15 +53,18 @@ def get_ico_path() -> str:
         return _ICO_CACHE
 
     ico_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "followcursor.ico")
-    sizes = [16, 24, 32, 48, 64, 128, 256]
-    images: List[Tuple[int, bytes]] = []
+    # Written by an earlier run — reuse it without painting anything
+    if _ico_is_current(ico_path):
+        _ICO_CACHE = ico_path
+        return ico_path
 
-    for sz in sizes:
+    images: List[Tuple[int, bytes]] = []
+    for sz in _ICON_SIZES:
         pm = _render(sz)
         img = pm.toImage().convertToFormat(QImage.Format.Format_ARGB32)
         buf = QBuffer()
         buf.open(QIODevice.OpenModeFlag.WriteOnly)
-        img.save(buf, "PNG")
+        img.save(buf, "PNG", _ICO_PNG_QUALITY)
         buf.close()
         images.append((sz, bytes(buf.data())))
 
@@ -60,33 +73,69 @@ def get_ico_path() -> str:
     return ico_path
 
 
+def _ico_is_current(path: str) -> bool:
+    """True if *path* is a complete .ico written from the current artwork.
+
+    The file must be newer than this module (so editing :func:`_render`
+    regenerates it) and hold one entry per ``_ICON_SIZES`` size, laid
+    out back to back exactly as :func:`_write_ico` writes them — which
+    also rejects a truncated file whose header survived.
+    """
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(__file__):
+            return False
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return False
+    if len(data) < _ICO_HEADER.size:
+        return False
+    reserved, kind, count = _ICO_HEADER.unpack_from(data, 0)
+    if reserved != 0 or kind != 1 or count != len(_ICON_SIZES):
+        return False
+    offset = _ICO_HEADER.size + count * _ICO_ENTRY.size
+    for i, size in enumerate(_ICON_SIZES):
+        pos = _ICO_HEADER.size + i * _ICO_ENTRY.size
+        if pos + _ICO_ENTRY.size > len(data):
+            return False
+        w, h, _, _, _, _, length, start = _ICO_ENTRY.unpack_from(data, pos)
+        dim = 0 if size >= 256 else size
+        if w != dim or h != dim or start != offset or length == 0:
+            return False
+        offset += length
+    return offset == len(data)
+
+
 def _write_ico(path: str, images: List[Tuple[int, bytes]]) -> None:
     """Write a multi-resolution .ico file using PNG-compressed entries."""
     n = len(images)
-    header = struct.pack("<HHH", 0, 1, n)
-    dir_entries = bytearray()
-    data_blobs = bytearray()
-    offset = 6 + n * 16
+    offset = _ICO_HEADER.size + n * _ICO_ENTRY.size
+    out = bytearray(offset + sum(len(png) for _, png in images))
+    _ICO_HEADER.pack_into(out, 0, 0, 1, n)
 
+    pos = _ICO_HEADER.size
     for size, png_data in images:
         w = 0 if size >= 256 else size
         h = 0 if size >= 256 else size
-        entry = struct.pack(
-            "<BBBBHHII",
+        _ICO_ENTRY.pack_into(
+            out, pos,
             w, h, 0, 0, 1, 32, len(png_data), offset,
         )
-        dir_entries += entry
-        data_blobs += png_data
+        out[offset:offset + len(png_data)] = png_data
+        pos += _ICO_ENTRY.size
         offset += len(png_data)
 
     with open(path, "wb") as f:
-        f.write(header)
-        f.write(dir_entries)
-        f.write(data_blobs)
+        f.write(out)
 
 
+@lru_cache(maxsize=16)
 def _render(size: int) -> QPixmap:
-    """Paint the app icon at the given pixel size and return a QPixmap."""
+    """Paint the app icon at the given pixel size and return a QPixmap.
+
+    Memoized: the icon is deterministic, and both :func:`create_app_icon`
+    and :func:`get_ico_path` need every size.
+    """
     pm = QPixmap(size, size)
     pm.fill(Qt.GlobalColor.transparent)
 
@@ -9,6 +9,7 @@ import sys
 import time
 import ctypes
 import ctypes.wintypes as wintypes
+from array import array
 from typing import List, Optional
 
 from PySide6.QtCore import QObject, QThread, Signal
@@ -59,19 +60,21 @@ if sys.platform == "win32":
 class _KeyboardHookThread(QThread):
     """Dedicated thread running a Win32 message pump with a low-level keyboard hook.
 
-    Key-down events are filtered through ``_IGNORE_VKS`` and appended
-    directly to a shared list (no cross-thread signal overhead).
+    Key-down events are filtered through ``_IGNORE_VKS`` and their
+    timestamps appended directly to a shared ``array('d')`` (no
+    cross-thread signal overhead, and no object allocated per key —
+    :class:`KeyEvent` objects are built when the events are read).
     """
 
-    def __init__(self, start_ms: float = 0.0,
-                 events_list: List[KeyEvent] | None = None,
+    def __init__(self, start_ns: int = 0,
+                 timestamps: "array[float] | None" = None,
                  parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._thread_id: int = 0
         self._hook = None
-        self._start_ms = start_ms
-        # Direct append list — avoids cross-thread signal queuing losses
-        self._events_list: List[KeyEvent] = events_list if events_list is not None else []
+        self._start_ns = start_ns  # shared epoch on the perf_counter_ns clock
+        # Direct append buffer — avoids cross-thread signal queuing losses
+        self._timestamps = timestamps if timestamps is not None else array("d")
         # prevent GC of the callback
         self._proc = None
 
@@ -97,34 +100,40 @@ class _KeyboardHookThread(QThread):
         user32.UnhookWindowsHookEx.argtypes = [wintypes.HHOOK]
         user32.UnhookWindowsHookEx.restype = wintypes.BOOL
 
-        start_ms = self._start_ms
-        events_list = self._events_list
+        # Low-level hooks are latency-sensitive: bind everything the
+        # callback needs to closure locals up front.
+        start_ns = self._start_ns
+        perf_counter_ns = time.perf_counter_ns
+        append = self._timestamps.append
+        call_next = user32.CallNextHookEx
+        from_address = KBDLLHOOKSTRUCT.from_address
+        hook = None  # assigned below, read by the callback via its closure
 
         def low_level_handler(n_code, w_param, l_param):
             try:
                 if n_code >= 0 and w_param in (WM_KEYDOWN, WM_SYSKEYDOWN):
                     # Skip modifier keys and app-hotkey keys
-                    kb = ctypes.cast(l_param, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
-                    if kb.vkCode in _IGNORE_VKS:
-                        return user32.CallNextHookEx(
-                            self._hook, n_code, w_param, l_param,
-                        )
-                    ts = time.time() * 1000 - start_ms
-                    events_list.append(KeyEvent(timestamp=ts))
+                    if from_address(l_param).vkCode not in _IGNORE_VKS:
+                        append((perf_counter_ns() - start_ns) / 1_000_000)
             except Exception:
                 logger.exception("Error in keyboard hook callback")
-            return user32.CallNextHookEx(self._hook, n_code, w_param, l_param)
+            return call_next(hook, n_code, w_param, l_param)
 
         self._proc = HOOKPROC(low_level_handler)
-        self._hook = user32.SetWindowsHookExW(
+        self._hook = hook = user32.SetWindowsHookExW(
             WH_KEYBOARD_LL, self._proc, None, 0
         )
 
-        # Pump messages so the hook receives events
+        # Pump messages so the hook receives events — one MSG and its
+        # byref() are reused, and the user32 entry points are bound once
         msg = wintypes.MSG()
-        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
-            user32.TranslateMessage(ctypes.byref(msg))
-            user32.DispatchMessageW(ctypes.byref(msg))
+        p_msg = ctypes.byref(msg)
+        get_message = user32.GetMessageW
+        translate_message = user32.TranslateMessage
+        dispatch_message = user32.DispatchMessageW
+        while get_message(p_msg, None, 0, 0) > 0:
+            translate_message(p_msg)
+            dispatch_message(p_msg)
 
         if self._hook:
             user32.UnhookWindowsHookEx(self._hook)
@@ -143,36 +152,48 @@ class KeyboardTracker(QObject):
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._thread: Optional[_KeyboardHookThread] = None
-        self._events: List[KeyEvent] = []
+        self._timestamps: "array[float]" = array("d")
         self._start_time: float = 0.0
 
     def start(self, start_ms: float = 0.0) -> None:
         """Begin tracking keyboard events.
 
-        *start_ms* — shared epoch (``time.time() * 1000``) so all trackers
+        *start_ms* — shared epoch (``time.perf_counter() * 1000``) so all trackers
         use the same time base.
         """
         if sys.platform != "win32":
             return
-        self._events.clear()
-        self._start_time = start_ms if start_ms > 0 else time.time() * 1000
+        del self._timestamps[:]
+        self._start_time = start_ms if start_ms > 0 else time.perf_counter() * 1000
+        # The hook reads perf_counter_ns, the integer form of the
+        # perf_counter clock the shared epoch is taken on
+        start_ns = round(self._start_time * 1_000_000)
         self._thread = _KeyboardHookThread(
-            start_ms=self._start_time,
-            events_list=self._events,
+            start_ns=start_ns,
+            timestamps=self._timestamps,
             parent=self,
         )
         self._thread.start()
 
+    def request_stop(self) -> None:
+        """Ask the hook thread to exit without waiting for it.
+
+        :meth:`stop` still joins the thread and returns the events.
+        """
+        if self._thread is not None:
+            self._thread.request_stop()
+
     def stop(self) -> List[KeyEvent]:
         """Stop tracking and return collected events."""
         if self._thread is not None:
             self._thread.request_stop()
             self._thread.wait(2000)
             self._thread = None
-        result = list(self._events)
-        self._events.clear()
+        result = self.events
+        del self._timestamps[:]
         return result
 
     @property
     def events(self) -> List[KeyEvent]:
-        return list(self._events)
+        # Slice first: a snapshot the hook thread cannot append to mid-loop
+        return [KeyEvent(timestamp=ts) for ts in self._timestamps[:]]
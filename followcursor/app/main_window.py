@@ -1,14 +1,26 @@
 """Main application window — assembles all widgets and manages state."""
 
+import bisect
 import logging
 import os
 import subprocess
+import tempfile
+import threading
+import time
 import uuid
-from typing import Optional, List
+from collections import deque
+from functools import partial
+from dataclasses import dataclass
+from typing import Deque, Optional, List, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-from PySide6.QtCore import Qt, QTimer, QSettings, QByteArray, QEvent, QThread, Signal as CoreSignal
+from PySide6.QtCore import (
+    Qt, QTimer, QSettings, QByteArray, QEvent, QMetaObject, QObject, QRunnable,
+    QThread, QThreadPool, Signal as CoreSignal, Slot,
+)
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -43,55 +55,119 @@ from .screen_recorder import ScreenRecorder
 from .global_hotkeys import GlobalHotkeys
 from .video_exporter import VideoExporter
 from .project_file import PROJ_EXT
-from .backgrounds import PRESETS as BG_PRESETS
-from .frames import FRAME_PRESETS
-from .theme import DARK_THEME
+from .backgrounds import PRESETS_BY_NAME as BG_PRESETS_BY_NAME
+from .cursor_renderer import MouseTrack
+from .frames import FRAME_PRESETS_BY_NAME
+from .utils import encoder_display_name
+from .theme import DARK_THEME, MENU_QSS
 from .widgets.title_bar import TitleBar
 from .widgets.source_picker import SourcePickerDialog
 from .widgets.preview_widget import PreviewWidget
 from .widgets.timeline_widget import TimelineWidget
-from .widgets.editor_panel import EditorPanel
+from .widgets.editor_panel import EditorPanel, ZOOM_DEPTHS
 from .widgets.countdown_overlay import CountdownOverlay
 from .widgets.processing_overlay import ProcessingOverlay
 from .widgets.recording_border import RecordingBorderOverlay
 from .icon import create_app_icon
 
 
-class _LoadProjectWorker(QThread):
-    """Background thread that loads a .fcproj file.
+# Post-recording remux limits
+_REMUX_TIMEOUT_S = 60.0
+_REMUX_LOG_TAIL = 20  # ffmpeg log lines kept for the failure message
+
+# Keys of the capture-area dict (``_monitor_rect``) saved with a project
+_RECT_KEYS = ("left", "top", "width", "height")
+
+# QSettings keys read while the main window is being constructed
+_STARTUP_SETTINGS_KEYS = (
+    "lastExportDir", "lastProjectDir", "windowGeometry",
+    "bgPreset", "framePreset", "encoderId",
+)
+
+# Smallest playhead step (ms, ~one 60 Hz frame) the playback sync pushes
+# to the preview and timeline; smaller moves change nothing on screen
+_SYNC_MIN_STEP_MS = 16.0
+
+# Summary line logged by _FinalizeWorker once a recording has stopped
+_REC_STOPPED_FMT = (
+    "Recording stopped | duration_ms=%d | backend=%s | actual_fps=%.1f "
+    "| pipe_frames=%d | frame_timestamps=%d | output=%s"
+)
+
+
+def _retag(widget: QWidget, name: str) -> None:
+    """Switch *widget*'s QSS object name, repolishing only on a change."""
+    if widget.objectName() == name:
+        return
+    widget.setObjectName(name)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+def _connect_all(connections) -> None:
+    """Connect each ``(signal, slot)`` pair in *connections*."""
+    for signal, slot in connections:
+        signal.connect(slot)
+
+
+def _warm_imports() -> None:
+    """Import modules the worker threads load lazily, ahead of first use.
+
+    Run once on the thread pool at startup so the first project
+    load/save finds them in ``sys.modules``.  cv2 and imageio-ffmpeg
+    are not listed: the exporter and cursor renderer import cv2, and the
+    editor panel's encoder probe resolves ffmpeg, during construction.
+    """
+    try:
+        from . import project_file  # noqa: F401
+    except Exception:
+        logger.debug("Import warm-up failed", exc_info=True)
+
+
+class _ProjectTaskSignals(QObject):
+    """Signals for the project load/save tasks.
+
+    :class:`QRunnable` is not a :class:`QObject` and cannot emit signals
+    itself, so each task carries one of these.  It is created on the GUI
+    thread, so emissions from the pool thread are queued back to it.
+    """
+    done = CoreSignal(object)  # project dict (load) or saved path (save)
+    failed = CoreSignal(str)   # error message on failure
+
+
+class _LoadProjectTask(QRunnable):
+    """One-shot pool task that loads a .fcproj file.
 
     ZIP extraction and JSON parsing happen here so the GUI thread stays
     responsive and the processing overlay can animate.
     """
-    done = CoreSignal(dict)    # the full project dict on success
-    failed = CoreSignal(str)   # error message on failure
 
-    def __init__(self, path: str, parent=None) -> None:
-        super().__init__(parent)
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.signals = _ProjectTaskSignals()
         self._path = path
 
     def run(self) -> None:  # noqa: D401
         try:
             from .project_file import load_project
             proj = load_project(self._path)
-            self.done.emit(proj)
+            self.signals.done.emit(proj)
         except Exception as exc:
-            self.failed.emit(str(exc))
+            self.signals.failed.emit(str(exc))
 
 
-class _SaveProjectWorker(QThread):
-    """Background thread that writes a .fcproj ZIP file.
+class _SaveProjectTask(QRunnable):
+    """One-shot pool task that writes a .fcproj ZIP file.
 
     Bundling the AVI can take noticeable time; the GUI thread stays
     responsive while this runs.
     """
-    done = CoreSignal(str)     # saved file path on success
-    failed = CoreSignal(str)   # error message on failure
 
     def __init__(self, path: str, video_path: str, session,
                  monitor_rect, actual_fps: float,
-                 bg_preset, frame_preset, parent=None) -> None:
-        super().__init__(parent)
+                 bg_preset, frame_preset) -> None:
+        super().__init__()
+        self.signals = _ProjectTaskSignals()
         self._path = path
         self._video_path = video_path
         self._session = session
@@ -108,9 +184,19 @@ class _SaveProjectWorker(QThread):
                 self._monitor_rect, self._actual_fps,
                 self._bg_preset, self._frame_preset,
             )
-            self.done.emit(self._path)
+            self.signals.done.emit(self._path)
         except Exception as exc:
-            self.failed.emit(str(exc))
+            self.signals.failed.emit(str(exc))
+
+
+@dataclass
+class _FinalizeResult:
+    """Everything :class:`_FinalizeWorker` hands back to the GUI thread."""
+    mouse_track: list
+    key_events: list
+    click_events: list
+    frame_timestamps: list
+    fps: float
 
 
 class _FinalizeWorker(QThread):
@@ -119,7 +205,8 @@ class _FinalizeWorker(QThread):
     Thread joins, frame-counting, and ffmpeg remux all happen here so the
     GUI thread stays responsive and the processing overlay can animate.
     """
-    done = CoreSignal(list, list, list, list, float)  # mouse, keys, clicks, timestamps, fps
+    done = CoreSignal(object)  # _FinalizeResult — one object across the thread hop
+    progress = CoreSignal(float)  # 0.0–1.0 while remuxing
 
     def __init__(
         self,
@@ -143,55 +230,85 @@ class _FinalizeWorker(QThread):
         self._result_fps: float = actual_fps_override
 
     def run(self) -> None:  # noqa: D401 — required by QThread
+        # Signal every worker first so the capture thread and both hook
+        # threads shut down concurrently; the joins below then overlap.
+        self._recorder.request_stop()
+        self._keyboard_tracker.request_stop()
+        self._click_tracker.request_stop()
+
         # These calls may block briefly (capture-thread join, hook-thread joins).
         self._recorder.stop_capture()
         mouse_track = self._mouse_tracker.stop()
         key_events = self._keyboard_tracker.stop()
         click_events = self._click_tracker.stop()
-        frame_timestamps = self._recorder.frame_timestamps
+        snap = self._recorder.snapshot()
+        frame_timestamps = snap.frame_timestamps
 
-        actual_fps = self._actual_fps_override if self._actual_fps_override > 0 else self._recorder.actual_fps
-        pipe_frames = self._recorder.frame_count
+        actual_fps = self._actual_fps_override if self._actual_fps_override > 0 else snap.actual_fps
+        pipe_frames = snap.frame_count
         logger.info(
-            "Recording stopped | duration_ms=%d | backend=%s | actual_fps=%.1f "
-            "| pipe_frames=%d | frame_timestamps=%d | output=%s",
-            int(self._rec_duration_ms), self._recorder.backend or "unknown",
+            _REC_STOPPED_FMT,
+            int(self._rec_duration_ms), snap.backend or "unknown",
             actual_fps, pipe_frames, len(frame_timestamps), self._video_path,
         )
-        if key_events:
-            for i, k in enumerate(key_events):
-                logger.debug("Key #%d: ts=%.0fms", i, k.timestamp)
-        if click_events:
-            for i, c in enumerate(click_events):
-                logger.debug("Click #%d: ts=%.0fms  x=%.0f y=%.0f", i, c.timestamp, c.x, c.y)
+        # Per-event dumps are only formatted when DEBUG is actually on
+        if logger.isEnabledFor(logging.DEBUG):
+            if key_events:
+                logger.debug("Keys:\n%s", "\n".join(
+                    f"  #{i}: ts={k.timestamp:.0f}ms" for i, k in enumerate(key_events)))
+            if click_events:
+                logger.debug("Clicks:\n%s", "\n".join(
+                    f"  #{i}: ts={c.timestamp:.0f}ms  x={c.x:.0f} y={c.y:.0f}"
+                    for i, c in enumerate(click_events)))
 
         # Remux AVI with correct FPS
         self._result_fps = self._remux_with_correct_fps(actual_fps)
 
-        self.done.emit(mouse_track, key_events, click_events, frame_timestamps, self._result_fps)
+        self.done.emit(_FinalizeResult(
+            mouse_track, key_events, click_events, frame_timestamps, self._result_fps,
+        ))
 
     # ── remux (runs in worker thread) ───────────────────────────────
 
     def _remux_with_correct_fps(self, actual_fps: float) -> float:
         """Remux the recorded AVI so its metadata FPS matches reality.
 
-        Returns the correct FPS value.
+        The recording pipe tells ffmpeg ``-r {target_fps}`` (e.g. 60) but
+        WGC only delivers changed frames, so the real write-rate is much
+        lower (e.g. 7 fps).  This makes the AVI header claim 60 fps for
+        only ~270 frames → OpenCV thinks the video is ~4.5 s instead of
+        ~37 s.  Every seek, playback, and export is then wrong.
+
+        Counts the real frames, computes ``real_frames / duration_s`` and
+        rewrites the AVI header's rate fields in place, falling back to a
+        ``-c:v copy`` remux.  Returns the correct FPS value.
         """
         if not self._video_path or not os.path.isfile(self._video_path):
             return actual_fps
         if self._rec_duration_ms <= 0:
             return actual_fps
 
-        import cv2 as _cv2
+        from .utils import count_grabbed_frames, probe_video_stream, read_avi_frame_info
+
+        # The AVI header already records the frame count; only probe the
+        # stream when it's missing (e.g. the writer never finalized it)
+        probe = None
+        if self._video_path.lower().endswith(".avi"):
+            probe = read_avi_frame_info(self._video_path)
+        if probe is None:
+            probe = probe_video_stream(self._video_path)
+        if probe is not None:
+            real_frames, old_meta_fps = probe
+        else:
+            # No usable ffmpeg log — count by grabbing every frame
+            import cv2 as _cv2
 
-        cap = _cv2.VideoCapture(self._video_path)
-        if not cap.isOpened():
-            return actual_fps
-        real_frames = 0
-        while cap.grab():
-            real_frames += 1
-        old_meta_fps = cap.get(_cv2.CAP_PROP_FPS)
-        cap.release()
+            cap = _cv2.VideoCapture(self._video_path)
+            if not cap.isOpened():
+                return actual_fps
+            real_frames = count_grabbed_frames(cap)
+            old_meta_fps = cap.get(_cv2.CAP_PROP_FPS)
+            cap.release()
 
         if real_frames == 0:
             return actual_fps
@@ -205,6 +322,16 @@ class _FinalizeWorker(QThread):
             )
             return correct_fps
 
+        # AVI keeps its frame rate in a few header fields — patch them in
+        # place instead of stream-copying the whole recording.
+        from .utils import patch_avi_fps
+        if self._video_path.lower().endswith(".avi") and patch_avi_fps(self._video_path, correct_fps):
+            logger.info(
+                "Patched AVI header: %d frames, fps %.1f → %.2f",
+                real_frames, old_meta_fps, correct_fps,
+            )
+            return correct_fps
+
         try:
             from .utils import ffmpeg_exe, subprocess_kwargs
             ffmpeg = ffmpeg_exe()
@@ -212,20 +339,54 @@ class _FinalizeWorker(QThread):
             logger.warning("ffmpeg not found — skipping remux")
             return actual_fps
 
-        temp_output = self._video_path + ".remux.avi"
+        from .utils import FFMPEG_QUIET_ARGS, ffmpeg_progress_fraction
+
+        # Remux into a uniquely named file beside the recording so the
+        # swap below is an atomic os.replace() on the same volume; the
+        # original is never truncated or rewritten in place.
+        temp_output: Optional[str] = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                prefix="followcursor_remux_", suffix=".avi", delete=False,
+                dir=os.path.dirname(os.path.abspath(self._video_path)),
+            ) as tf:
+                temp_output = tf.name
+        except OSError as exc:
+            logger.warning("Remux skipped — no temp file: %s", exc)
+            return actual_fps
         cmd = [
-            ffmpeg, "-y",
+            ffmpeg, "-y", *FFMPEG_QUIET_ARGS,
             "-r", f"{correct_fps:.4f}",
             "-i", self._video_path,
             "-c:v", "copy",
+            "-progress", "pipe:2",
             temp_output,
         ]
+        duration_us = self._rec_duration_ms * 1000.0
+        # Only the tail of the log is kept for the failure message
+        log_tail: Deque[str] = deque(maxlen=_REMUX_LOG_TAIL)
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, timeout=60,
-                **subprocess_kwargs(),
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                bufsize=1 << 20, **subprocess_kwargs(),
             )
-            if result.returncode == 0 and os.path.isfile(temp_output):
+            # Reading stderr blocks until ffmpeg exits, so the timeout
+            # is enforced by killing the process instead.
+            killer = threading.Timer(_REMUX_TIMEOUT_S, proc.kill)
+            killer.start()
+            try:
+                for raw in proc.stderr:
+                    line = raw.decode(errors="replace")
+                    frac = ffmpeg_progress_fraction(line, real_frames, duration_us)
+                    if frac is not None:
+                        self.progress.emit(frac)
+                    elif line.strip():
+                        log_tail.append(line.rstrip())
+                returncode = proc.wait()
+            finally:
+                killer.cancel()
+                proc.stderr.close()
+            if returncode == 0 and os.path.isfile(temp_output):
                 os.replace(temp_output, self._video_path)
                 logger.info(
                     "Remuxed AVI: %d frames, fps %.1f → %.2f",
@@ -233,16 +394,20 @@ class _FinalizeWorker(QThread):
                 )
                 return correct_fps
             else:
-                stderr = result.stderr.decode(errors="replace")[:300] if result.stderr else ""
-                logger.warning("Remux failed (rc=%d): %s", result.returncode, stderr)
+                stderr = "\n".join(log_tail)[-300:]
+                logger.warning("Remux failed (rc=%d): %s", returncode, stderr)
         except Exception as exc:
             logger.warning("Remux error: %s", exc)
         finally:
-            if os.path.isfile(temp_output):
+            # One unlink, no isfile() pre-check: a missing file is the
+            # normal case once os.replace() has moved it into place.
+            if temp_output:
                 try:
-                    os.remove(temp_output)
-                except OSError:
+                    os.unlink(temp_output)
+                except FileNotFoundError:
                     pass
+                except OSError as exc:
+                    logger.debug("Could not remove remux temp file %s: %s", temp_output, exc)
         return actual_fps
 
 
@@ -267,9 +432,10 @@ class MainWindow(QMainWindow):
 
         # ── persistent settings ─────────────────────────────────────
         self._settings = QSettings("FollowCursor", "FollowCursor")
-        self._last_export_dir: str = self._settings.value("lastExportDir", "")
-        self._last_project_dir: str = self._settings.value("lastProjectDir", "")
-        self._restore_geometry()
+        saved = self._read_settings()
+        self._last_export_dir: str = saved.get("lastExportDir", "")
+        self._last_project_dir: str = saved.get("lastProjectDir", "")
+        self._restore_geometry(saved.get("windowGeometry"))
 
         # ── core objects ────────────────────────────────────────────
         self._zoom_engine = ZoomEngine()
@@ -286,13 +452,19 @@ class MainWindow(QMainWindow):
         self._monitor_rect: dict = {}    # {left, top, width, height} of selected monitor
         self._source_type: str = "monitor"  # "monitor" | "window"
         self._window_hwnd: int = 0
+        self._source_picker: Optional[SourcePickerDialog] = None  # built on first use
         self._view: str = "record"  # "record" | "edit"
         self._rec_duration_ms: float = 0
         self._mouse_track: List[MousePosition] = []
+        # Built lazily from _mouse_track: its SoA copy, and the samples as
+        # normalized pan coordinates keyed by the capture rect they used
+        self._mouse_soa: Optional[MouseTrack] = None
+        self._mouse_pan: Optional[Tuple[tuple, np.ndarray]] = None
         self._key_events: List[KeyEvent] = []
         self._click_events: List[ClickEvent] = []
         self._video_path: str = ""
         self._playback_time: float = 0
+        self._last_sync_t: float = -1.0  # playhead last pushed to the timeline
         self._actual_fps_override: float = 0.0
         self._frame_timestamps: List[float] = []  # per-frame ms offsets
         self._bg_preset = None  # BackgroundPreset, None = default
@@ -302,25 +474,29 @@ class MainWindow(QMainWindow):
         self._trim_start_ms: float = 0.0  # trim start point (0 = beginning)
         self._trim_end_ms: float = 0.0    # trim end point (0 = full duration)
         self._project_path: str = ""      # path to current .fcproj file
+        self._project_name: str = ""      # basename of _project_path, for the title
         self._unsaved_changes: bool = False  # True when edits exist since last save
 
         # Restore persisted background & frame presets
-        saved_bg = self._settings.value("bgPreset", "")
+        saved_bg = saved.get("bgPreset", "")
         if saved_bg:
-            match = next((p for p in BG_PRESETS if p.name == saved_bg), None)
+            match = BG_PRESETS_BY_NAME.get(saved_bg)
             if match:
                 self._bg_preset = match
-        saved_frame = self._settings.value("framePreset", "")
+        saved_frame = saved.get("framePreset", "")
         if saved_frame:
-            match = next((p for p in FRAME_PRESETS if p.name == saved_frame), None)
+            match = FRAME_PRESETS_BY_NAME.get(saved_frame)
             if match:
                 self._frame_preset = match
 
-        # duration update timer
+        # duration update timer — the label only shows whole seconds
         self._dur_timer = QTimer(self)
+        self._dur_timer.setInterval(500)
         self._dur_timer.timeout.connect(self._tick_duration)
+        self._rec_t0: float = 0.0  # time.monotonic() when recording started
+        self._rec_time_text: str = "0:00"
 
-        # playback zoom sync timer
+        # playback zoom sync timer — runs only while the preview plays
         self._zoom_sync_timer = QTimer(self)
         self._zoom_sync_timer.setInterval(33)
         self._zoom_sync_timer.timeout.connect(self._sync_zoom)
@@ -391,14 +567,17 @@ class MainWindow(QMainWindow):
         # timeline (hidden until edit mode)
         self._timeline = TimelineWidget()
         self._timeline.setVisible(False)
-        self._timeline.seek_requested.connect(self._on_seek)
-        self._timeline.keyframe_moved.connect(self._on_keyframe_moved)
-        self._timeline.segment_clicked.connect(self._on_segment_clicked)
-        self._timeline.segment_deleted.connect(self._delete_zoom_section)
-        self._timeline.play_pause_clicked.connect(self._on_play_pause)
-        self._timeline.click_event_deleted.connect(self._on_click_event_deleted)
-        self._timeline.trim_changed.connect(self._on_trim_changed)
-        self._timeline.drag_finished.connect(self._on_drag_finished)
+        tl = self._timeline
+        _connect_all((
+            (tl.seek_requested, self._on_seek),
+            (tl.keyframe_moved, self._on_keyframe_moved),
+            (tl.segment_clicked, self._on_segment_clicked),
+            (tl.segment_deleted, self._delete_zoom_section),
+            (tl.play_pause_clicked, self._on_play_pause),
+            (tl.click_event_deleted, self._on_click_event_deleted),
+            (tl.trim_changed, self._on_trim_changed),
+            (tl.drag_finished, self._on_drag_finished),
+        ))
         center.addWidget(self._timeline)
 
         content.addLayout(center, 1)
@@ -406,16 +585,19 @@ class MainWindow(QMainWindow):
         # editor panel (hidden until edit mode)
         self._editor = EditorPanel()
         self._editor.setVisible(False)
-        self._editor.remove_keyframe.connect(self._on_remove_keyframe)
-        self._editor.add_keyframe_at.connect(self._add_keyframe)
-        self._editor.auto_keyframes_generated.connect(self._on_auto_keyframes)
-        self._editor.background_changed.connect(self._on_bg_changed)
-        self._editor.frame_changed.connect(self._on_frame_changed)
-        self._editor.debug_overlay_changed.connect(self._on_debug_overlay_changed)
-        self._editor.output_dimensions_changed.connect(self._on_output_dim_changed)
-        self._editor.undo_requested.connect(self._undo)
-        self._editor.redo_requested.connect(self._redo)
-        self._editor.encoder_changed.connect(self._on_encoder_changed)
+        ed = self._editor
+        _connect_all((
+            (ed.remove_keyframe, self._on_remove_keyframe),
+            (ed.add_keyframe_at, self._add_keyframe),
+            (ed.auto_keyframes_generated, self._on_auto_keyframes),
+            (ed.background_changed, self._on_bg_changed),
+            (ed.frame_changed, self._on_frame_changed),
+            (ed.debug_overlay_changed, self._on_debug_overlay_changed),
+            (ed.output_dimensions_changed, self._on_output_dim_changed),
+            (ed.undo_requested, self._undo),
+            (ed.redo_requested, self._redo),
+            (ed.encoder_changed, self._on_encoder_changed),
+        ))
         content.addWidget(self._editor)
 
         root.addLayout(content, 1)
@@ -425,16 +607,16 @@ class MainWindow(QMainWindow):
         root.addWidget(self._status_bar)
 
         # ── connections ─────────────────────────────────────────────
-        self._recorder.frame_ready.connect(self._on_frame)
-        self._recorder.recording_finished.connect(self._on_recording_finished)
-        self._recorder.capture_backend_changed.connect(self._on_capture_backend_changed)
-
-        self._hotkeys.record_toggle_pressed.connect(self._on_record_toggle)
-
-        self._exporter.progress.connect(self._on_export_progress)
-        self._exporter.finished.connect(self._on_export_finished)
-        self._exporter.error.connect(self._on_export_error)
-        self._exporter.status.connect(self._on_export_status)
+        _connect_all((
+            (self._recorder.frame_ready, self._on_frame),
+            (self._recorder.recording_finished, self._on_recording_finished),
+            (self._recorder.capture_backend_changed, self._on_capture_backend_changed),
+            (self._hotkeys.record_toggle_pressed, self._on_record_toggle),
+            (self._exporter.progress, self._on_export_progress),
+            (self._exporter.finished, self._on_export_finished),
+            (self._exporter.error, self._on_export_error),
+            (self._exporter.status, self._on_export_status),
+        ))
 
         # countdown overlay (covers the central widget)
         self._countdown = CountdownOverlay(central)
@@ -462,7 +644,7 @@ class MainWindow(QMainWindow):
             self._editor.set_frame_by_name(self._frame_preset.name)
 
         # Restore persisted encoder preference
-        saved_encoder = self._settings.value("encoderId", "")
+        saved_encoder = saved.get("encoderId", "")
         if saved_encoder:
             self._editor.set_encoder_by_id(saved_encoder)
 
@@ -475,6 +657,9 @@ class MainWindow(QMainWindow):
         # Register persistent Ctrl+Shift+R hotkey
         self._hotkeys.register_record_hotkey()
 
+        # Load lazily-imported worker modules off the GUI thread
+        QThreadPool.globalInstance().start(_warm_imports)
+
     # ════════════════════════════════════════════════════════════════
     #  UI builders
     # ════════════════════════════════════════════════════════════════
@@ -634,28 +819,31 @@ class MainWindow(QMainWindow):
 
     def _select_source(self) -> None:
         """Open the source picker dialog and start capturing the chosen source."""
-        dlg = SourcePickerDialog(self, exclude_hwnd=int(self.winId()))
+        # The dialog is built once and kept; reopening it only re-enumerates
+        # sources when its snapshot has gone stale.
+        if self._source_picker is None:
+            self._source_picker = SourcePickerDialog(self, exclude_hwnd=int(self.winId()))
+        else:
+            self._source_picker.refresh()
+        dlg = self._source_picker
         if dlg.exec():
             source = dlg.chosen_source
             if not source:
                 return
 
+            # Copy just the geometry once, for either kind of source: the
+            # picker keeps its source dicts alive between opens, and their
+            # extra keys (index, name, hwnd, ...) don't belong in saved projects.
+            self._monitor_rect = {key: source[key] for key in _RECT_KEYS}
             if source.get("type") == "window":
                 self._source_type = "window"
                 self._window_hwnd = source["hwnd"]
                 self._selected_monitor = -1  # sentinel: not a monitor
-                self._monitor_rect = {
-                    "left": source["left"],
-                    "top": source["top"],
-                    "width": source["width"],
-                    "height": source["height"],
-                }
                 self._recorder.start_capture_window(source["hwnd"], DEFAULT_FPS)
             else:
                 # Monitor source
                 self._source_type = "monitor"
                 self._selected_monitor = source["index"]
-                self._monitor_rect = source
                 self._recorder.start_capture(source["index"], DEFAULT_FPS)
 
             self._preview_stack.setCurrentWidget(self._preview)
@@ -676,15 +864,14 @@ class MainWindow(QMainWindow):
 
     def _do_start_recording(self) -> None:
         """Called when the 3-2-1 countdown finishes."""
-        import time as _time
-
         try:
             self._zoom_engine.clear()
             self._preview.set_recording_mode(True)  # blur + indicator
 
             # Single shared epoch — recorder + all activity trackers use the
-            # exact same origin so every timestamp is perfectly aligned.
-            shared_epoch = _time.time()
+            # exact same origin and the same monotonic clock, so every
+            # timestamp stays aligned even if the wall clock is stepped.
+            shared_epoch = time.perf_counter()
             shared_start_ms = shared_epoch * 1000
             self._video_path = self._recorder.start_recording(start_time=shared_epoch)
             self._mouse_tracker.start(shared_start_ms)
@@ -692,14 +879,15 @@ class MainWindow(QMainWindow):
             self._click_tracker.start(shared_start_ms)
 
             self._recording = True
-            self._dur_timer.start(100)
+            self._rec_t0 = time.monotonic()
+            self._rec_time_text = "0:00"
+            self._rec_time_label.setText(self._rec_time_text)
+            self._dur_timer.start()
             self._rec_indicator.setVisible(True)
             self._btn_stop.setVisible(True)
             if self._source_type == "monitor" and self._selected_monitor > 0:
                 self._border_overlay.show_on_monitor(self._selected_monitor)
-            self._status_dot.setObjectName("StatusDotRecording")
-            self._status_dot.style().unpolish(self._status_dot)
-            self._status_dot.style().polish(self._status_dot)
+            _retag(self._status_dot, "StatusDotRecording")
             self._status_text.setOpenExternalLinks(False)
             self._status_text.setText("Recording")
 
@@ -745,9 +933,7 @@ class MainWindow(QMainWindow):
         self._border_overlay.hide_border()
         self._rec_indicator.setVisible(False)
         self._btn_stop.setVisible(False)
-        self._status_dot.setObjectName("StatusDotReady")
-        self._status_dot.style().unpolish(self._status_dot)
-        self._status_dot.style().polish(self._status_dot)
+        _retag(self._status_dot, "StatusDotReady")
         self._status_text.setOpenExternalLinks(False)
         self._status_text.setText("Finishing recording\u2026")
         self._restore_from_tray()
@@ -756,10 +942,14 @@ class MainWindow(QMainWindow):
         self._processing_overlay.setGeometry(self.centralWidget().rect())
         self._processing_overlay.show_overlay()
 
-        # Defer heavy cleanup (thread joins, video load) so the UI paints
-        # before any blocking work happens.
-        QTimer.singleShot(50, self._finalize_stop_recording)
+        # Start the finalize worker from the event loop rather than from
+        # inside this handler; deferring costs nothing because finalize only
+        # starts a thread (the joins and file work run on it).
+        QMetaObject.invokeMethod(
+            self, "_finalize_stop_recording", Qt.ConnectionType.QueuedConnection,
+        )
 
+    @Slot()
     def _finalize_stop_recording(self) -> None:
         """Kick off heavy post-recording work in a background thread."""
         self._finalize_worker = _FinalizeWorker(
@@ -773,23 +963,18 @@ class MainWindow(QMainWindow):
             parent=self,
         )
         self._finalize_worker.done.connect(self._on_finalize_done)
+        self._finalize_worker.progress.connect(self._processing_overlay.set_progress)
         self._finalize_worker.start()
 
-    def _on_finalize_done(
-        self,
-        mouse_track: list,
-        key_events: list,
-        click_events: list,
-        frame_timestamps: list,
-        actual_fps: float,
-    ) -> None:
+    def _on_finalize_done(self, result: _FinalizeResult) -> None:
         """Called on the GUI thread when the finalize worker finishes."""
         try:
-            self._mouse_track = mouse_track
-            self._key_events = key_events
-            self._click_events = click_events
-            self._frame_timestamps = frame_timestamps
-            self._actual_fps_override = actual_fps
+            self._mouse_track = result.mouse_track
+            self._mouse_soa = self._mouse_pan = None
+            self._key_events = result.key_events
+            self._click_events = result.click_events
+            self._frame_timestamps = result.frame_timestamps
+            self._actual_fps_override = result.fps
 
             self._processing_overlay.hide_overlay()
             self._status_text.setText("Ready")
@@ -805,100 +990,13 @@ class MainWindow(QMainWindow):
         self._finalize_worker.deleteLater()
         self._finalize_worker = None
 
-    def _remux_with_correct_fps(self) -> None:
-        """Remux the recorded AVI so its metadata FPS matches reality.
-
-        The recording pipe tells ffmpeg ``-r {target_fps}`` (e.g. 60) but
-        WGC only delivers changed frames, so the real write-rate is much
-        lower (e.g. 7 fps).  This makes the AVI header claim 60 fps for
-        only ~270 frames → OpenCV thinks the video is ~4.5 s instead of
-        ~37 s.  Every seek, playback, and export is then wrong.
-
-        This method counts the real frames in the file, computes the
-        correct FPS from ``real_frames / (duration_s)``, and remuxes
-        (``-c:v copy``) so the container metadata is accurate.
-        """
-        if not self._video_path or not os.path.isfile(self._video_path):
-            return
-        if self._rec_duration_ms <= 0:
-            return
-
-        import cv2 as _cv2
-
-        # Count real frames — the only reliable method for huffyuv AVI
-        cap = _cv2.VideoCapture(self._video_path)
-        if not cap.isOpened():
-            return
-        real_frames = 0
-        while cap.grab():
-            real_frames += 1
-        old_meta_fps = cap.get(_cv2.CAP_PROP_FPS)
-        cap.release()
-
-        if real_frames == 0:
-            return
-
-        correct_fps = real_frames / (self._rec_duration_ms / 1000.0)
-
-        # Skip remux if metadata is already close enough (within 5 %)
-        if old_meta_fps > 0 and abs(correct_fps - old_meta_fps) / old_meta_fps < 0.05:
-            logger.info(
-                "AVI metadata already correct (meta_fps=%.1f, real_fps=%.2f)",
-                old_meta_fps, correct_fps,
-            )
-            self._actual_fps_override = correct_fps
-            return
-
-        try:
-            from .utils import ffmpeg_exe, subprocess_kwargs
-            ffmpeg = ffmpeg_exe()
-        except Exception:
-            logger.warning("ffmpeg not found — skipping remux")
-            return
-
-        temp_output = self._video_path + ".remux.avi"
-        cmd = [
-            ffmpeg, "-y",
-            "-r", f"{correct_fps:.4f}",
-            "-i", self._video_path,
-            "-c:v", "copy",
-            temp_output,
-        ]
-        try:
-            result = subprocess.run(
-                cmd, capture_output=True, timeout=60,
-                **subprocess_kwargs(),
-            )
-            if result.returncode == 0 and os.path.isfile(temp_output):
-                os.replace(temp_output, self._video_path)
-                self._actual_fps_override = correct_fps
-                logger.info(
-                    "Remuxed AVI: %d frames, fps %.1f → %.2f",
-                    real_frames, old_meta_fps, correct_fps,
-                )
-            else:
-                stderr = result.stderr.decode(errors="replace")[:300] if result.stderr else ""
-                logger.warning("Remux failed (rc=%d): %s", result.returncode, stderr)
-        except Exception as exc:
-            logger.warning("Remux error: %s", exc)
-        finally:
-            if os.path.isfile(temp_output):
-                try:
-                    os.remove(temp_output)
-                except OSError:
-                    pass
-
     def _set_view(self, view: str) -> None:
         """Switch between 'record' and 'edit' views, updating sidebar and widgets."""
         self._view = view
 
         # sidebar highlight
-        self._btn_record_view.setObjectName("SidebarBtnActive" if view == "record" else "SidebarBtn")
-        self._btn_record_view.style().unpolish(self._btn_record_view)
-        self._btn_record_view.style().polish(self._btn_record_view)
-        self._btn_edit_view.setObjectName("SidebarBtnActive" if view == "edit" else "SidebarBtn")
-        self._btn_edit_view.style().unpolish(self._btn_edit_view)
-        self._btn_edit_view.style().polish(self._btn_edit_view)
+        _retag(self._btn_record_view, "SidebarBtnActive" if view == "record" else "SidebarBtn")
+        _retag(self._btn_edit_view, "SidebarBtnActive" if view == "edit" else "SidebarBtn")
 
         if view == "record":
             self._timeline.setVisible(False)
@@ -946,14 +1044,14 @@ class MainWindow(QMainWindow):
             self._timeline.setVisible(self._rec_duration_ms > 0)
             self._editor.setVisible(True)
             self._refresh_editor()
-            self._zoom_sync_timer.start()
+            if self._preview.is_playing:
+                self._zoom_sync_timer.start()
 
     # ── title & dirty state ─────────────────────────────────────────
 
     def _update_title(self) -> None:
         """Refresh the title bar text to reflect project name and save state."""
-        name = os.path.basename(self._project_path) if self._project_path else ""
-        self._title_bar.set_title(name, self._unsaved_changes)
+        self._title_bar.set_title(self._project_name, self._unsaved_changes)
 
     def _mark_dirty(self) -> None:
         """Mark the session as having unsaved changes."""
@@ -991,29 +1089,41 @@ class MainWindow(QMainWindow):
         else:
             self._start_recording()
 
-    def _refresh_editor(self) -> None:
-        self._editor.refresh(
+    def _refresh_editor(self, editor: bool = True) -> None:
+        """Push the session state to the timeline, preview and editor panel.
+
+        *editor* can be False while a timeline drag is in progress: the
+        panel only needs the result, which ``_on_drag_finished`` sends.
+        """
+        # Keyframes or tracks changed: the next sync must not be skipped
+        self._last_sync_t = -1.0
+        if editor:
+            self._refresh_editor_panel()
+        self._timeline.set_data(
+            self._rec_duration_ms,
+            self._playback_time,
             self._zoom_engine.keyframes,
             self._mouse_track,
-            self._rec_duration_ms,
-            self._monitor_rect,
             self._key_events,
             self._click_events,
             self._trim_start_ms,
             self._trim_end_ms,
         )
-        self._timeline.set_data(
-            self._rec_duration_ms,
-            self._playback_time,
+        # Keep debug overlay in sync with keyframes
+        self._preview.set_debug_keyframes(self._zoom_engine.keyframes)
+
+    def _refresh_editor_panel(self) -> None:
+        """Send the editor panel the data auto-zoom and its tooltip use."""
+        self._editor.refresh(
             self._zoom_engine.keyframes,
             self._mouse_track,
+            self._rec_duration_ms,
+            self._monitor_rect,
             self._key_events,
             self._click_events,
             self._trim_start_ms,
             self._trim_end_ms,
         )
-        # Keep debug overlay in sync with keyframes
-        self._preview.set_debug_keyframes(self._zoom_engine.keyframes)
 
     def _on_auto_keyframes(self, keyframes) -> None:
         """Handle auto-generated keyframes from activity analysis."""
@@ -1061,7 +1171,6 @@ class MainWindow(QMainWindow):
         self._update_encoder_label(enc_id)
 
     def _update_encoder_label(self, enc_id: str) -> None:
-        from .utils import encoder_display_name
         self._encoder_label.setText(f"Encoder: {encoder_display_name(enc_id)}")
 
     # ── undo / redo ─────────────────────────────────────────────────
@@ -1099,25 +1208,19 @@ class MainWindow(QMainWindow):
     def _on_drag_finished(self) -> None:
         """Reset undo debounce flag when a timeline drag completes."""
         self._drag_undo_pushed = False
-        # Push updated trim bounds to editor so auto-gen uses the trimmed range
-        self._editor.refresh(
-            self._zoom_engine.keyframes,
-            self._mouse_track,
-            self._rec_duration_ms,
-            self._monitor_rect,
-            self._key_events,
-            self._click_events,
-            self._trim_start_ms,
-            self._trim_end_ms,
-        )
+        # Push updated trim bounds and keyframes to the editor so auto-gen
+        # uses the trimmed range
+        self._refresh_editor_panel()
 
     # ── recording helpers ───────────────────────────────────────────
 
     def _tick_duration(self) -> None:
-        ms = self._recorder.recording_duration_ms
-        s = int(ms / 1000)
-        m = s // 60
-        self._rec_time_label.setText(f"{m}:{s % 60:02d}")
+        s = int(time.monotonic() - self._rec_t0)
+        text = f"{s // 60}:{s % 60:02d}"
+        # Half the ticks land in the same second — skip the relayout
+        if text != self._rec_time_text:
+            self._rec_time_text = text
+            self._rec_time_label.setText(text)
 
     def _on_frame(self, frame) -> None:
         if self._view == "record":
@@ -1143,22 +1246,30 @@ class MainWindow(QMainWindow):
     def _lookup_mouse_pan(self, time_ms: float) -> tuple:
         """Find the recorded mouse position at a given playback time and return
         normalized pan coordinates (0-1).  Falls back to (0.5, 0.5)."""
-        if not self._mouse_track or not self._monitor_rect:
+        track = self._mouse_track
+        if not track or not self._monitor_rect:
             return 0.5, 0.5
-        # Binary-ish search: find the sample closest to time_ms
-        best = self._mouse_track[0]
-        best_delta = abs(best.timestamp - time_ms)
-        for mp in self._mouse_track:
-            d = abs(mp.timestamp - time_ms)
-            if d < best_delta:
-                best = mp
-                best_delta = d
-            elif mp.timestamp > time_ms:
-                break
+        soa = self._mouse_soa
+        if soa is None:
+            soa = self._mouse_soa = MouseTrack.from_positions(track)
         mon = self._monitor_rect
-        px = (best.x - mon.get("left", 0)) / max(mon.get("width", 1), 1)
-        py = (best.y - mon.get("top", 0)) / max(mon.get("height", 1), 1)
-        return max(0.0, min(1.0, px)), max(0.0, min(1.0, py))
+        rect = (mon.get("left", 0), mon.get("top", 0),
+                max(mon.get("width", 1), 1), max(mon.get("height", 1), 1))
+        if self._mouse_pan is None or self._mouse_pan[0] != rect:
+            # Normalize every sample once per track and capture rect
+            mon_left, mon_top, mon_w, mon_h = rect
+            pan = np.empty((len(soa), 2))
+            pan[:, 0] = (soa.xs - mon_left) / mon_w
+            pan[:, 1] = (soa.ys - mon_top) / mon_h
+            np.clip(pan, 0.0, 1.0, out=pan)
+            self._mouse_pan = (rect, pan)
+        pan = self._mouse_pan[1]
+        # Binary search, then pick the closer of the two neighbours
+        ts = soa.ts
+        idx = min(int(np.searchsorted(ts, time_ms)), len(ts) - 1)
+        if idx > 0 and time_ms - ts[idx - 1] <= abs(ts[idx] - time_ms):
+            idx -= 1
+        return float(pan[idx, 0]), float(pan[idx, 1])
 
     def _add_keyframe(self, timestamp: float, zoom: float, x: float = -1.0, y: float = -1.0) -> None:
         """Add a zoom keyframe at the given time, with auto zoom-out pairing."""
@@ -1187,12 +1298,15 @@ class MainWindow(QMainWindow):
             zoom_out_time = min(timestamp + 3000, self._rec_duration_ms)
             zoom_out_dur = 1200.0  # slower zoom-out for smooth feel
 
-            # Clamp zoom-out so it doesn't overlap the next zoom-in
-            next_zoom_in = next(
-                (k for k in self._zoom_engine.keyframes
-                 if k.timestamp > timestamp and k.zoom > 1.01),
-                None,
+            # Keyframes are sorted: those after this zoom-in start at idx
+            kfs = self._zoom_engine.keyframes
+            idx = bisect.bisect_right(kfs, timestamp, key=lambda k: k.timestamp)
+            next_idx = next(
+                (i for i in range(idx, len(kfs)) if kfs[i].zoom > 1.01), len(kfs),
             )
+            next_zoom_in = kfs[next_idx] if next_idx < len(kfs) else None
+
+            # Clamp zoom-out so it doesn't overlap the next zoom-in
             if next_zoom_in is not None:
                 # End of zoom-out = zoom_out_time + zoom_out_dur
                 # Must be ≤ next_zoom_in.timestamp
@@ -1205,11 +1319,9 @@ class MainWindow(QMainWindow):
                     zoom_out_time = max(timestamp + 200, boundary - 200)
                     zoom_out_dur = max(0, boundary - zoom_out_time)
 
-            # Only add if there's no existing zoom-out after this zoom-in
-            has_zoom_out = any(
-                k.timestamp > timestamp and k.zoom <= 1.01
-                for k in self._zoom_engine.keyframes
-            )
+            # Only add if this zoom-in isn't already closed by a zoom-out
+            # (every keyframe before the next zoom-in is one)
+            has_zoom_out = next_idx > idx
             if not has_zoom_out:
                 kf_out = ZoomKeyframe.create(
                     timestamp=zoom_out_time, zoom=1.0, x=0.5, y=0.5,
@@ -1252,11 +1364,7 @@ class MainWindow(QMainWindow):
 
         # Find the keyframe being moved and its index
         kfs = self._zoom_engine.keyframes
-        moved_idx = None
-        for i, kf in enumerate(kfs):
-            if kf.id == kf_id:
-                moved_idx = i
-                break
+        moved_idx = self._zoom_engine.index_of(kf_id)
         if moved_idx is None:
             return
 
@@ -1291,47 +1399,33 @@ class MainWindow(QMainWindow):
             self._zoom_engine.current_pan_x,
             self._zoom_engine.current_pan_y,
         )
-        self._refresh_editor()
+        self._refresh_editor(editor=False)
 
     def _on_segment_clicked(self, start_kf_id: str) -> None:
         """Handle clicking on a zoom segment body — show depth picker + delete."""
-        from .widgets.editor_panel import ZOOM_DEPTHS
-
         # Find the keyframe
-        target_kf = None
-        for kf in self._zoom_engine.keyframes:
-            if kf.id == start_kf_id:
-                target_kf = kf
-                break
+        target_kf = self._zoom_engine.find(start_kf_id)
         if target_kf is None:
             return
 
         menu = QMenu(self)
-        menu.setStyleSheet(
-            "QMenu { background: #28263e; color: #e4e4ed; border: 1px solid #3d3a58; padding: 4px; }"
-            "QMenu::item { padding: 6px 20px; }"
-            "QMenu::item:selected { background: #8b5cf6; }"
-        )
+        menu.setStyleSheet(MENU_QSS)
 
         for label, level in ZOOM_DEPTHS.items():
             check = " ✓" if abs(target_kf.zoom - level) < 0.01 else ""
             act = menu.addAction(f"{label} ({level}×){check}")
-            act.triggered.connect(
-                lambda checked, z=level: self._set_segment_zoom(start_kf_id, z)
-            )
+            act.triggered.connect(partial(self._set_segment_zoom, start_kf_id, level))
 
         menu.addSeparator()
 
         # Centroid repositioning — click preview to set new center
         centroid_label = f"📍 Set centroid  ({target_kf.x:.2f}, {target_kf.y:.2f})"
         centroid_act = menu.addAction(centroid_label)
-        centroid_act.triggered.connect(
-            lambda: self._enter_centroid_pick(start_kf_id)
-        )
+        centroid_act.triggered.connect(partial(self._enter_centroid_pick, start_kf_id))
 
         menu.addSeparator()
         del_act = menu.addAction("🗑 Delete zoom section")
-        del_act.triggered.connect(lambda: self._delete_zoom_section(start_kf_id))
+        del_act.triggered.connect(partial(self._delete_zoom_section, start_kf_id))
 
         menu.exec(self.cursor().pos())
 
@@ -1339,10 +1433,9 @@ class MainWindow(QMainWindow):
         """Update the zoom level of a segment's start keyframe."""
         self._zoom_engine.push_undo()
         self._mark_dirty()
-        for kf in self._zoom_engine.keyframes:
-            if kf.id == kf_id:
-                kf.zoom = new_zoom
-                break
+        kf = self._zoom_engine.find(kf_id)
+        if kf is not None:
+            kf.zoom = new_zoom
         self._zoom_engine.update(self._playback_time)
         self._preview.set_zoom(
             self._zoom_engine.current_zoom,
@@ -1363,11 +1456,10 @@ class MainWindow(QMainWindow):
         if not kf_id:
             return
         self._zoom_engine.push_undo()
-        for kf in self._zoom_engine.keyframes:
-            if kf.id == kf_id:
-                kf.x = pan_x
-                kf.y = pan_y
-                break
+        kf = self._zoom_engine.find(kf_id)
+        if kf is not None:
+            kf.x = pan_x
+            kf.y = pan_y
         self._mark_dirty()
         self._zoom_engine.update(self._playback_time)
         self._preview.set_zoom(
@@ -1381,11 +1473,7 @@ class MainWindow(QMainWindow):
         """Delete a zoom section (the zoom-in keyframe and its matching zoom-out)."""
         # Find the start keyframe's index
         kfs = self._zoom_engine.keyframes
-        start_idx = None
-        for i, kf in enumerate(kfs):
-            if kf.id == start_kf_id:
-                start_idx = i
-                break
+        start_idx = self._zoom_engine.index_of(start_kf_id)
         if start_idx is None:
             return
         self._zoom_engine.push_undo()
@@ -1425,6 +1513,9 @@ class MainWindow(QMainWindow):
             self._zoom_engine.current_pan_x,
             self._zoom_engine.current_pan_y,
         )
+        if time_ms == self._last_sync_t:
+            return
+        self._last_sync_t = time_ms
         self._timeline.set_data(
             self._rec_duration_ms,
             time_ms,
@@ -1449,6 +1540,9 @@ class MainWindow(QMainWindow):
             if self._rec_duration_ms > 0:
                 t = min(t, self._rec_duration_ms)
             self._playback_time = t
+            if abs(t - self._last_sync_t) < _SYNC_MIN_STEP_MS:
+                return
+            self._last_sync_t = t
             self._zoom_engine.update(t)
             self._preview.set_zoom(
                 self._zoom_engine.current_zoom,
@@ -1466,8 +1560,10 @@ class MainWindow(QMainWindow):
                 self._trim_end_ms,
             )
         else:
-            # Preview may have self-paused (end of video) — sync button state
+            # Preview may have self-paused (end of video) — sync button
+            # state and stop polling until playback resumes
             self._timeline.set_playing(False)
+            self._zoom_sync_timer.stop()
 
     # ── save / load ─────────────────────────────────────────────────
 
@@ -1499,7 +1595,6 @@ class MainWindow(QMainWindow):
                 if path.lower().endswith(".gif"):
                     self._status_text.setText("Exporting GIF\u2026")
                 else:
-                    from .utils import encoder_display_name
                     enc_label = encoder_display_name(self._editor.encoder_id)
                     self._status_text.setText(f"Encoding with {enc_label}\u2026")
                 fps = self._recorder.actual_fps
@@ -1531,10 +1626,13 @@ class MainWindow(QMainWindow):
         if self._preview.is_playing:
             self._preview.pause()
             self._timeline.set_playing(False)
+            self._zoom_sync_timer.stop()
         else:
             self._preview.play()
             # Only update the button if play actually started
             self._timeline.set_playing(self._preview.is_playing)
+            if self._preview.is_playing:
+                self._zoom_sync_timer.start()
 
     def keyPressEvent(self, event) -> None:  # type: ignore[override]
         """Handle keyboard shortcuts in edit view."""
@@ -1568,6 +1666,7 @@ class MainWindow(QMainWindow):
         """Delete a click event by index from the timeline."""
         if 0 <= index < len(self._click_events):
             self._click_events.pop(index)
+            self._preview.set_click_events(self._click_events)
             self._refresh_editor()
 
     def _on_export_progress(self, pct: float) -> None:
@@ -1647,21 +1746,21 @@ class MainWindow(QMainWindow):
             self._last_project_dir = os.path.dirname(path)
             self._status_text.setOpenExternalLinks(False)
             self._status_text.setText("Saving project\u2026")
-            # Run on background thread so the UI stays responsive
-            self._save_worker = _SaveProjectWorker(
+            # Run on a pooled thread so the UI stays responsive
+            self._save_task = _SaveProjectTask(
                 path, self._video_path, session,
                 self._monitor_rect, self._recorder.actual_fps,
                 self._bg_preset, self._frame_preset,
-                parent=self,
             )
-            self._save_worker.done.connect(self._on_save_done)
-            self._save_worker.failed.connect(self._on_save_failed)
+            self._save_task.signals.done.connect(self._on_save_done)
+            self._save_task.signals.failed.connect(self._on_save_failed)
             # Optimistically mark unsaved=False so a quick Ctrl+S
             # doesn't trigger a second save while the worker runs.
             self._project_path = path
+            self._project_name = os.path.basename(path)
             self._unsaved_changes = False
             self._update_title()
-            self._save_worker.start()
+            QThreadPool.globalInstance().start(self._save_task)
 
     def _on_save_done(self, path: str) -> None:
         """Background save finished successfully."""
@@ -1696,11 +1795,11 @@ class MainWindow(QMainWindow):
             "Extracting files, please wait",
         )
 
-        # Run in background thread
-        self._load_worker = _LoadProjectWorker(path, parent=self)
-        self._load_worker.done.connect(self._on_load_done)
-        self._load_worker.failed.connect(self._on_load_failed)
-        self._load_worker.start()
+        # Run on a pooled thread
+        self._load_task = _LoadProjectTask(path)
+        self._load_task.signals.done.connect(self._on_load_done)
+        self._load_task.signals.failed.connect(self._on_load_failed)
+        QThreadPool.globalInstance().start(self._load_task)
 
     def _on_load_done(self, proj: dict) -> None:
         """Called on the GUI thread when the project finishes loading."""
@@ -1710,6 +1809,7 @@ class MainWindow(QMainWindow):
         try:
             session = proj["session"]
             self._mouse_track = session.mouse_track
+            self._mouse_soa = self._mouse_pan = None
             self._key_events = session.key_events or []
             self._click_events = session.click_events or []
             self._rec_duration_ms = session.duration
@@ -1739,26 +1839,24 @@ class MainWindow(QMainWindow):
 
             self._set_view("edit")
             self._project_path = path
+            self._project_name = name = os.path.basename(path)
             self._unsaved_changes = False
             self._update_title()
-            name = os.path.basename(path)
             self._status_text.setOpenExternalLinks(False)
             self._status_text.setText(f"Loaded {name}")
         except Exception as exc:
             self._status_text.setOpenExternalLinks(False)
             self._status_text.setText(f"Load error: {exc}")
 
-        # Clean up worker reference
-        self._load_worker.deleteLater()
-        self._load_worker = None
+        # Drop the task reference
+        self._load_task = None
 
     def _on_load_failed(self, error: str) -> None:
         """Called on the GUI thread when project loading fails."""
         self._processing_overlay.hide_overlay()
         self._status_text.setOpenExternalLinks(False)
         self._status_text.setText(f"Load error: {error}")
-        self._load_worker.deleteLater()
-        self._load_worker = None
+        self._load_task = None
 
     # ── cleanup ─────────────────────────────────────────────────────
 
@@ -1825,8 +1923,20 @@ class MainWindow(QMainWindow):
         import os
         os._exit(0)
 
-    def _restore_geometry(self) -> None:
-        """Restore window size/position from saved settings."""
-        geom = self._settings.value("windowGeometry")
+    def _read_settings(self) -> dict:
+        """Read the settings ``__init__`` needs into one dict up front.
+
+        Only the keys in ``_STARTUP_SETTINGS_KEYS`` are looked up; keys that
+        were never saved are left out so callers' ``.get()`` defaults apply.
+        """
+        saved = {}
+        for key in _STARTUP_SETTINGS_KEYS:
+            value = self._settings.value(key)
+            if value is not None:
+                saved[key] = value
+        return saved
+
+    def _restore_geometry(self, geom) -> None:
+        """Restore window size/position from the saved *geom* bytes."""
         if geom and isinstance(geom, QByteArray):
             self.restoreGeometry(geom)
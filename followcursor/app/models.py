@@ -12,7 +12,7 @@ import uuid
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class MousePosition:
     """A single cursor position sample captured during recording.
 
@@ -32,7 +32,7 @@ class MousePosition:
         return MousePosition(x=d["x"], y=d["y"], timestamp=d["timestamp"])
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyEvent:
     """A single keystroke timestamp (no key identity stored for privacy)."""
     timestamp: float  # ms since recording start
@@ -45,7 +45,7 @@ class KeyEvent:
         return KeyEvent(timestamp=d["timestamp"])
 
 
-@dataclass
+@dataclass(slots=True)
 class ClickEvent:
     """A mouse click with position and timestamp."""
     x: float
@@ -47,10 +47,10 @@ class MouseTracker(QObject):
     def start(self, start_ms: float = 0.0) -> None:
         """Begin polling cursor position.
 
-        *start_ms* — shared epoch (``time.time() * 1000``) so all trackers
+        *start_ms* — shared epoch (``time.perf_counter() * 1000``) so all trackers
         use the same time base.
         """
-        self._start_time = start_ms if start_ms > 0 else time.time() * 1000
+        self._start_time = start_ms if start_ms > 0 else time.perf_counter() * 1000
         self._positions.clear()
         self._timer.start(self._interval)
 
@@ -64,6 +64,6 @@ class MouseTracker(QObject):
         mp = MousePosition(
             x=px,
             y=py,
-            timestamp=time.time() * 1000 - self._start_time,
+            timestamp=time.perf_counter() * 1000 - self._start_time,
         )
         self._positions.append(mp)
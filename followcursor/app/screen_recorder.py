@@ -16,7 +16,7 @@ import subprocess
 
 logger = logging.getLogger(__name__)
 import ctypes
-from typing import Optional, List
+from typing import List, NamedTuple, Optional
 
 import numpy as np
 import cv2
@@ -39,7 +39,7 @@ except AttributeError:
     _winmm = None
 
 
-from .utils import ffmpeg_exe as _ffmpeg_exe, subprocess_kwargs as _subprocess_kwargs
+from .utils import FFMPEG_QUIET_ARGS, ffmpeg_exe as _ffmpeg_exe, subprocess_kwargs as _subprocess_kwargs
 
 
 def _precise_sleep(seconds: float) -> None:
@@ -68,6 +68,7 @@ def _start_ffmpeg_writer(
         cmd = [
             ffmpeg,
             "-y",                        # overwrite
+            *FFMPEG_QUIET_ARGS,          # stderr is only read after exit
             "-f", "rawvideo",
             "-pix_fmt", "bgra",
             "-s", f"{w}x{h}",
@@ -100,23 +101,32 @@ def _stop_ffmpeg_writer(proc: Optional[subprocess.Popen]) -> None:
     """Cleanly close an ffmpeg writer subprocess."""
     if proc is None:
         return
+    stderr = b""
     try:
-        if proc.stdin and not proc.stdin.closed:
-            proc.stdin.close()
-        proc.wait(timeout=15)
+        if proc.stdin is not None and proc.stdin.closed:
+            proc.stdin = None  # a failed write already closed it; nothing to flush
+        # communicate() closes stdin (EOF lets ffmpeg finish the file) and
+        # drains stderr while it waits, so shutdown can't stall on a full
+        # pipe the way wait() + read() could.
+        _, stderr = proc.communicate(timeout=15)
     except Exception:
         try:
             proc.kill()
         except Exception:
             pass
     # Log any errors
-    if proc.stderr:
-        try:
-            tail = proc.stderr.read().decode(errors="replace").strip()
-            if tail and proc.returncode != 0:
-                logger.warning("ffmpeg stderr: %s", tail[-300:])
-        except Exception:
-            pass
+    if stderr and proc.returncode != 0:
+        tail = stderr.decode(errors="replace").strip()
+        if tail:
+            logger.warning("ffmpeg stderr: %s", tail[-300:])
+
+
+class RecorderSnapshot(NamedTuple):
+    """Consistent view of the last recording's stats (see :meth:`ScreenRecorder.snapshot`)."""
+    frame_timestamps: List[float]
+    frame_count: int
+    actual_fps: float
+    backend: str
 
 
 class ScreenRecorder(QObject):
@@ -208,7 +218,7 @@ class ScreenRecorder(QObject):
     def recording_duration_ms(self) -> float:
         if not self._recording or self._start_time == 0:
             return 0
-        return (time.time() - self._start_time) * 1000
+        return (time.perf_counter() - self._start_time) * 1000
 
     @property
     def actual_fps(self) -> float:
@@ -230,6 +240,18 @@ class ScreenRecorder(QObject):
         """Current capture backend: 'DXGI' or 'GDI' (mss)."""
         return self._backend
 
+    def snapshot(self) -> RecorderSnapshot:
+        """Read the recording stats together, under a single lock acquire.
+
+        ``frame_count`` and ``frame_timestamps`` are guaranteed to agree,
+        even if a capture thread is still writing its last frame.
+        """
+        with self._lock:
+            return RecorderSnapshot(
+                list(self._frame_timestamps), self._frame_count,
+                self._actual_fps, self._backend,
+            )
+
     # ── public API ──────────────────────────────────────────────────
 
     def start_capture(self, monitor_index: int, fps: int = 60) -> None:
@@ -263,16 +285,16 @@ class ScreenRecorder(QObject):
     def start_recording(self, start_time: float = 0.0) -> str:
         """Begin writing captured frames to a temp video file. Returns path.
 
-        *start_time* — ``time.time()`` epoch shared with activity trackers
-        so all timestamps are relative to the same origin.  If 0 the current
-        wall-clock is used.
+        *start_time* — ``time.perf_counter()`` epoch shared with activity
+        trackers so all timestamps are relative to the same origin.  If 0
+        the current ``perf_counter()`` reading is used.
         """
         temp_path = os.path.join(
             tempfile.gettempdir(), f"followcursor_{int(time.time())}.avi"
         )
         with self._lock:
             self._output_path = temp_path
-            self._start_time = start_time if start_time > 0 else time.time()
+            self._start_time = start_time if start_time > 0 else time.perf_counter()
             self._frame_count = 0
             self._frame_timestamps = []
             self._recording = True
@@ -282,17 +304,25 @@ class ScreenRecorder(QObject):
         """Stop recording and return the path to the raw AVI file."""
         with self._lock:
             self._recording = False
-            elapsed = time.time() - self._start_time
+            elapsed = time.perf_counter() - self._start_time
             if elapsed > 0 and self._frame_count > 0:
                 self._actual_fps = self._frame_count / elapsed
             else:
                 self._actual_fps = float(self._fps)
             return self._output_path
 
-    def stop_capture(self) -> None:
-        """Stop the capture thread and release all resources."""
+    def request_stop(self) -> None:
+        """Signal the capture thread to stop without waiting for it.
+
+        Lets callers shut several workers down concurrently before
+        joining; :meth:`stop_capture` then only waits.
+        """
         self._capturing = False
         self._recording = False
+
+    def stop_capture(self) -> None:
+        """Stop the capture thread and release all resources."""
+        self.request_stop()
         if self._thread:
             self._thread.join()
             self._thread = None
@@ -471,7 +501,7 @@ class ScreenRecorder(QObject):
                                 else np.ascontiguousarray(frame_bgra).tobytes()
                             )
                             with self._lock:
-                                ts = (time.time() - self._start_time) * 1000.0
+                                ts = (time.perf_counter() - self._start_time) * 1000.0
                                 self._frame_timestamps.append(ts)
                                 self._frame_count += 1
                         except (BrokenPipeError, OSError) as exc:
@@ -482,7 +512,7 @@ class ScreenRecorder(QObject):
                         frame_bgr = frame_bgra[:, :, :3]
                         writer_cv.write(np.ascontiguousarray(frame_bgr))
                         with self._lock:
-                            ts = (time.time() - self._start_time) * 1000.0
+                            ts = (time.perf_counter() - self._start_time) * 1000.0
                             self._frame_timestamps.append(ts)
                             self._frame_count += 1
                 else:
@@ -570,7 +600,7 @@ class ScreenRecorder(QObject):
                             try:
                                 writer_proc.stdin.write(frame.tobytes())
                                 with self._lock:
-                                    ts = (time.time() - self._start_time) * 1000.0
+                                    ts = (time.perf_counter() - self._start_time) * 1000.0
                                     self._frame_timestamps.append(ts)
                                     self._frame_count += 1
                             except (BrokenPipeError, OSError):
@@ -580,7 +610,7 @@ class ScreenRecorder(QObject):
                             frame_bgr = np.ascontiguousarray(frame[:, :, :3])
                             writer_cv.write(frame_bgr)
                             with self._lock:
-                                ts = (time.time() - self._start_time) * 1000.0
+                                ts = (time.perf_counter() - self._start_time) * 1000.0
                                 self._frame_timestamps.append(ts)
                                 self._frame_count += 1
                     else:
@@ -698,7 +728,7 @@ class ScreenRecorder(QObject):
                             try:
                                 writer_proc.stdin.write(frame.tobytes())
                                 with self._lock:
-                                    ts = (time.time() - self._start_time) * 1000.0
+                                    ts = (time.perf_counter() - self._start_time) * 1000.0
                                     self._frame_timestamps.append(ts)
                                     self._frame_count += 1
                             except (BrokenPipeError, OSError):
@@ -708,7 +738,7 @@ class ScreenRecorder(QObject):
                             frame_bgr = np.ascontiguousarray(frame[:, :, :3])
                             writer_cv.write(frame_bgr)
                             with self._lock:
-                                ts = (time.time() - self._start_time) * 1000.0
+                                ts = (time.perf_counter() - self._start_time) * 1000.0
                                 self._frame_timestamps.append(ts)
                                 self._frame_count += 1
                     else:
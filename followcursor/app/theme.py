@@ -1,5 +1,12 @@
 """Dark theme QSS stylesheet — Clipchamp-inspired design."""
 
+# Popup menus (segment, click-event and settings menus)
+MENU_QSS = (
+    "QMenu { background: #28263e; color: #e4e4ed; border: 1px solid #3d3a58; padding: 4px; }"
+    "QMenu::item { padding: 6px 20px; }"
+    "QMenu::item:selected { background: #8b5cf6; }"
+)
+
 DARK_THEME = """
 /* ── Global ─────────────────────────────────────────── */
 QWidget {
@@ -1,9 +1,14 @@
 """Shared utilities used by multiple modules."""
 
 import logging
+import os
+import re
+import shutil
+import struct
 import subprocess
 import sys
-from typing import Dict, List, Tuple
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +19,37 @@ def ffmpeg_exe() -> str:
     return imageio_ffmpeg.get_ffmpeg_exe()
 
 
+# Keeps ffmpeg's stderr down to actual errors: no banner, no per-second
+# stats line.  Long-running pipes are never drained while ffmpeg runs,
+# so anything chattier eventually fills the pipe and stalls it.
+FFMPEG_QUIET_ARGS: List[str] = ["-hide_banner", "-loglevel", "error", "-nostats"]
+
+
+_UNSET = object()
+_ffprobe_path: object = _UNSET  # resolved lazily by ffprobe_exe()
+
+
+def ffprobe_exe() -> Optional[str]:
+    """Return the path to an ``ffprobe`` binary, or ``None`` if there isn't one.
+
+    imageio-ffmpeg only bundles ffmpeg, so this looks next to
+    :func:`ffmpeg_exe` first (a full ffmpeg install ships both) and then
+    on ``PATH``.  The lookup runs once per process.
+    """
+    global _ffprobe_path
+    if _ffprobe_path is _UNSET:
+        found: Optional[str] = None
+        name = "ffprobe.exe" if sys.platform == "win32" else "ffprobe"
+        try:
+            candidate = os.path.join(os.path.dirname(ffmpeg_exe()), name)
+            if os.path.isfile(candidate):
+                found = candidate
+        except Exception:
+            pass
+        _ffprobe_path = found or shutil.which("ffprobe")
+    return _ffprobe_path  # type: ignore[return-value]
+
+
 def subprocess_kwargs() -> dict:
     """Extra kwargs to hide the console window on Windows."""
     kw: dict = {}
@@ -25,6 +61,288 @@ def subprocess_kwargs() -> dict:
     return kw
 
 
+# ── Video probing ───────────────────────────────────────────────────
+
+_PACKETS_READ_RE = re.compile(r"Input stream #0:\d+ \(video\): (\d+) packets read")
+_STREAM_FPS_RE = re.compile(r"Stream #0:\d+.*: Video: .*?, (\d+(?:\.\d+)?) fps")
+
+# (path, mtime_ns, size) → (packet count, container fps)
+_video_probe_cache: Dict[Tuple[str, int, int], Tuple[int, float]] = {}
+
+
+def parse_video_probe(stderr: str) -> Optional[Tuple[int, float]]:
+    """Extract ``(packets, fps)`` from a verbose ffmpeg stream-copy log.
+
+    *fps* is the container's declared rate (``0.0`` if not reported).
+    Returns ``None`` if the packet count is missing.
+    """
+    m = _PACKETS_READ_RE.search(stderr)
+    if m is None:
+        return None
+    f = _STREAM_FPS_RE.search(stderr)
+    return int(m.group(1)), float(f.group(1)) if f else 0.0
+
+
+def parse_ffprobe_packets(stdout: str) -> Optional[Tuple[int, float]]:
+    """Extract ``(packets, fps)`` from ``ffprobe -count_packets`` key=value output.
+
+    Expects ``nb_read_packets=`` and ``r_frame_rate=`` lines (the
+    ``default=noprint_wrappers=1`` writer).  *fps* is ``0.0`` when the
+    rate is missing or ``0/0``.  Returns ``None`` without a packet count.
+    """
+    fields = dict(
+        line.strip().partition("=")[::2] for line in stdout.splitlines() if "=" in line
+    )
+    try:
+        packets = int(fields["nb_read_packets"])
+    except (KeyError, ValueError):
+        return None
+    fps = 0.0
+    try:
+        num, _, den = fields.get("r_frame_rate", "").partition("/")
+        if int(den or 1):
+            fps = float(Fraction(int(num), int(den or 1)))
+    except ValueError:
+        pass
+    return packets, fps
+
+
+def _run_video_probe(path: str) -> Optional[Tuple[int, float]]:
+    """Count *path*'s video packets with ffprobe if present, else ffmpeg."""
+    ffprobe = ffprobe_exe()
+    if ffprobe:
+        result = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "v:0", "-count_packets",
+             "-show_entries", "stream=nb_read_packets,r_frame_rate",
+             "-of", "default=noprint_wrappers=1", path],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=60,
+            **subprocess_kwargs(),
+        )
+        probe = parse_ffprobe_packets(result.stdout.decode(errors="replace"))
+        if probe is not None:
+            return probe
+    result = subprocess.run(
+        [ffmpeg_exe(), "-hide_banner", "-nostats", "-v", "verbose",
+         "-i", path, "-map", "0:v:0", "-c", "copy", "-f", "null", "-"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60,
+        **subprocess_kwargs(),
+    )
+    return parse_video_probe(result.stderr.decode(errors="replace"))
+
+
+def probe_video_stream(path: str) -> Optional[Tuple[int, float]]:
+    """Return ``(frame_count, container_fps)`` for the first video stream.
+
+    Uses ``ffprobe -count_packets`` when an ffprobe binary is available,
+    otherwise stream-copies the video into ffmpeg's null muxer — either
+    way packets are read but never decoded, so the whole file is counted
+    by one subprocess instead of one ``grab()`` call per frame.  Results
+    are memoized per (path, mtime, size).  Returns ``None`` if neither
+    tool is usable or the output can't be parsed.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    cached = _video_probe_cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        probe = _run_video_probe(path)
+    except Exception as exc:
+        logger.warning("Video probe failed: %s", exc)
+        return None
+    if probe is not None:
+        _video_probe_cache[key] = probe
+    return probe
+
+
+def count_grabbed_frames(cap) -> int:
+    """Count the frames left in an open ``cv2.VideoCapture`` by grabbing them.
+
+    The last resort when neither the AVI header nor
+    :func:`probe_video_stream` has a count: ``grab()`` still demuxes every
+    frame, so the bound method is hoisted out of the per-frame loop.
+    """
+    grab = cap.grab
+    frames = 0
+    while grab():
+        frames += 1
+    return frames
+
+
+def ffmpeg_progress_fraction(line: str, total_frames: int,
+                             duration_us: float) -> Optional[float]:
+    """Map one ``ffmpeg -progress`` ``key=value`` line to a 0–1 fraction.
+
+    ``frame=`` is measured against *total_frames* and ``out_time_us=``
+    against *duration_us* (stream copies only report the latter);
+    ``progress=end`` is 1.0.  Returns ``None`` for any other line,
+    including ordinary log output interleaved on the same pipe.
+    """
+    key, sep, value = line.strip().partition("=")
+    if not sep:
+        return None
+    try:
+        if key == "frame" and total_frames > 0:
+            frac = int(value) / total_frames
+        elif key == "out_time_us" and duration_us > 0:
+            frac = int(value) / duration_us
+        elif key == "progress" and value == "end":
+            return 1.0
+        else:
+            return None
+    except ValueError:  # e.g. out_time_us=N/A before the first packet
+        return None
+    return min(max(frac, 0.0), 1.0)
+
+
+# ── AVI header patching ─────────────────────────────────────────────
+
+# The RIFF header list (``hdrl``) sits at the start of the file; this is
+# far more than any writer we use puts before the first stream header.
+_AVI_HEADER_SCAN = 64 * 1024
+_RIFF_CHUNK = struct.Struct("<4sI")
+
+
+def _riff_chunks(buf: bytes, start: int, end: int):
+    """Yield ``(fourcc, data_offset, size)`` for the chunks in buf[start:end]."""
+    pos = start
+    while pos + 8 <= end:
+        fourcc, size = _RIFF_CHUNK.unpack_from(buf, pos)
+        yield fourcc, pos + 8, size
+        pos += 8 + size + (size & 1)  # chunks are word-aligned
+
+
+def _avi_header_offsets(buf: bytes) -> Dict[bytes, int]:
+    """Map the ``avih`` / first video ``strh`` / ``dmlh`` chunks to their data offsets.
+
+    Only chunks found inside a well-formed ``RIFF AVI `` / ``hdrl``
+    prefix of *buf* are returned; the dict is empty if there is none.
+    """
+    found: Dict[bytes, int] = {}
+    if len(buf) < 12 or buf[:4] != b"RIFF" or buf[8:12] != b"AVI ":
+        return found
+    for fourcc, off, size in _riff_chunks(buf, 12, len(buf)):
+        if fourcc == b"LIST" and buf[off:off + 4] == b"hdrl":
+            hdrl_end = min(off + size, len(buf))
+            break
+    else:
+        return found
+
+    for fourcc, h_off, h_size in _riff_chunks(buf, off + 4, hdrl_end):
+        if fourcc == b"avih" and h_size >= 20:
+            found[b"avih"] = h_off
+        elif fourcc == b"LIST" and buf[h_off:h_off + 4] == b"strl" and b"strh" not in found:
+            for s_fourcc, s_off, s_size in _riff_chunks(buf, h_off + 4, min(h_off + h_size, hdrl_end)):
+                # fccType at +0, dwScale at +20, dwRate at +24
+                if s_fourcc == b"strh" and s_size >= 28 and buf[s_off:s_off + 4] == b"vids":
+                    found[b"strh"] = s_off
+                    break
+        elif fourcc == b"LIST" and buf[h_off:h_off + 4] == b"odml":
+            # OpenDML (>1 GB) files: avih only counts the first RIFF
+            # segment, dmlh.dwTotalFrames covers the whole file
+            for o_fourcc, o_off, o_size in _riff_chunks(buf, h_off + 4, min(h_off + h_size, hdrl_end)):
+                if o_fourcc == b"dmlh" and o_size >= 4:
+                    found[b"dmlh"] = o_off
+                    break
+    return found
+
+
+def avi_rate_offsets(buf: bytes) -> Optional[Tuple[int, int]]:
+    """Locate the frame-rate fields in an AVI header.
+
+    Returns ``(avih_offset, strh_offset)`` — file offsets of the main
+    header's data (``dwMicroSecPerFrame`` is its first field) and of the
+    first video stream header's data — or ``None`` if *buf* doesn't
+    start with a complete ``RIFF AVI `` / ``hdrl`` / ``strl`` chain.
+    """
+    found = _avi_header_offsets(buf)
+    if b"avih" not in found or b"strh" not in found:
+        return None
+    return found[b"avih"], found[b"strh"]
+
+
+def parse_avi_frame_info(buf: bytes) -> Optional[Tuple[int, float]]:
+    """Read ``(total_frames, fps)`` from the start of an AVI file.
+
+    The frame count is ``dmlh.dwTotalFrames`` when the file has an
+    OpenDML header, else ``avih.dwTotalFrames``; the FPS is the video
+    stream's ``dwRate / dwScale``, falling back to
+    ``avih.dwMicroSecPerFrame``.  Returns ``None`` if the headers are
+    missing or the frame count was never filled in (e.g. the writer
+    didn't finalize the file).
+    """
+    found = _avi_header_offsets(buf)
+    avih = found.get(b"avih")
+    if avih is None:
+        return None
+    usec_per_frame, = struct.unpack_from("<I", buf, avih)
+    total_frames, = struct.unpack_from("<I", buf, avih + 16)
+    if b"dmlh" in found:
+        total_frames = max(total_frames, struct.unpack_from("<I", buf, found[b"dmlh"])[0])
+    if total_frames == 0:
+        return None
+
+    fps = 0.0
+    if b"strh" in found:
+        scale, rate = struct.unpack_from("<II", buf, found[b"strh"] + 20)
+        if scale:
+            fps = rate / scale
+    if fps <= 0 and usec_per_frame:
+        fps = 1_000_000 / usec_per_frame
+    return total_frames, fps
+
+
+def read_avi_frame_info(path: str) -> Optional[Tuple[int, float]]:
+    """:func:`parse_avi_frame_info` for the AVI file at *path*.
+
+    Reads only the first few KB of the file.  Returns ``None`` if it
+    can't be read or its header doesn't carry a frame count.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_AVI_HEADER_SCAN)
+    except OSError:
+        return None
+    return parse_avi_frame_info(head)
+
+
+def patch_avi_fps(path: str, fps: float) -> bool:
+    """Rewrite the frame rate stored in an AVI's headers, in place.
+
+    Updates ``avih.dwMicroSecPerFrame`` and the video stream's
+    ``strh.dwRate`` / ``dwScale`` — a few bytes near the start of the
+    file — so fixing the declared FPS of a long recording no longer
+    needs a full stream-copy remux.  Returns ``False`` (file untouched)
+    if *fps* is not positive or the header layout isn't recognised.
+    """
+    if fps <= 0:
+        return False
+    rate = Fraction(fps).limit_denominator(10_000)
+    if not (0 < rate.numerator < 2 ** 32 and 0 < rate.denominator < 2 ** 32):
+        return False
+    try:
+        with open(path, "r+b") as f:
+            head = f.read(_AVI_HEADER_SCAN)
+            offsets = avi_rate_offsets(head)
+            if offsets is None:
+                return False
+            avih, strh = offsets
+            f.seek(avih)
+            f.write(struct.pack("<I", min(round(1_000_000 / fps), 2 ** 32 - 1)))
+            f.seek(strh + 20)
+            f.write(struct.pack("<II", rate.denominator, rate.numerator))
+            f.flush()
+            os.fsync(f.fileno())
+    except OSError as exc:
+        logger.warning("AVI header patch failed: %s", exc)
+        return False
+    return True
+
+
 def fmt_time(ms: float) -> str:
     """Format milliseconds as m:ss."""
     s = int(ms / 1000)
@@ -66,7 +384,7 @@ def detect_available_encoders() -> List[str]:
         ffmpeg = ffmpeg_exe()
         result = subprocess.run(
             [ffmpeg, "-hide_banner", "-encoders"],
-            capture_output=True, timeout=10,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10,
             **subprocess_kwargs(),
         )
         output = result.stdout.decode(errors="replace")
@@ -15,12 +15,15 @@ from PySide6.QtCore import QObject, Signal
 
 from .models import ZoomKeyframe, MousePosition, ClickEvent
 from .zoom_engine import ZoomEngine
-from .cursor_renderer import draw_cursor_cv, draw_clicks_cv, _build_cursor_template
+from .cursor_renderer import (
+    ClickTrack, MouseTrack, cursor_pixels_at, draw_cursor_cv, draw_cursor_cv_at,
+    draw_clicks_cv, _build_cursor_template,
+)
 from .backgrounds import BackgroundPreset, DEFAULT_PRESET, WAVE_LAYERS
 from .frames import FramePreset, DEFAULT_FRAME
 
 
-from .utils import ffmpeg_exe as _ffmpeg_exe, subprocess_kwargs as _subprocess_kwargs, build_encoder_args as _build_encoder_args, build_gif_args as _build_gif_args
+from .utils import FFMPEG_QUIET_ARGS, ffmpeg_exe as _ffmpeg_exe, subprocess_kwargs as _subprocess_kwargs, build_encoder_args as _build_encoder_args, build_gif_args as _build_gif_args
 
 
 # ── Numpy-based compositor for export (fast) ────────────────────────
@@ -523,7 +526,7 @@ class VideoExporter(QObject):
                 if _is_gif:
                     gif_args = _build_gif_args()
                     cmd = [
-                        ffmpeg, "-y",
+                        ffmpeg, "-y", *FFMPEG_QUIET_ARGS,
                         "-f", "rawvideo",
                         "-vcodec", "rawvideo",
                         "-s", f"{w}x{h}",
@@ -537,7 +540,7 @@ class VideoExporter(QObject):
                 else:
                     enc_args = _build_encoder_args(enc_id)
                     cmd = [
-                        ffmpeg, "-y",
+                        ffmpeg, "-y", *FFMPEG_QUIET_ARGS,
                         "-f", "rawvideo",
                         "-vcodec", "rawvideo",
                         "-s", f"{w}x{h}",
@@ -566,13 +569,31 @@ class VideoExporter(QObject):
 
                 # Pre-build cursor template for overlay
                 cursor_h_px = max(16, int(h * 0.015))
-                c_bgr, c_alpha = _build_cursor_template(cursor_h_px)
+                _, _, c_premul, c_inv_alpha = _build_cursor_template(cursor_h_px)
+                c_scratch = np.empty(c_premul.shape, dtype=np.uint16)
                 m_left = monitor_rect.get("left", 0)
                 m_top = monitor_rect.get("top", 0)
                 m_w = max(monitor_rect.get("width", w), 1)
                 m_h = max(monitor_rect.get("height", h), 1)
                 _has_cursor = len(mouse_track) > 0 and m_w > 0
+                track_soa = MouseTrack.from_positions(mouse_track)
+
+                # Cursor pixel positions for every expected frame, computed
+                # in one vectorized pass (same times as the loop below)
+                cur_px: List[int] = []
+                cur_py: List[int] = []
+                if _has_cursor:
+                    n_expected = max(total_frames, len(frame_timestamps or ()))
+                    frame_times = np.arange(n_expected) / fps * 1000.0
+                    if frame_timestamps:
+                        n_ts = min(len(frame_timestamps), n_expected)
+                        frame_times[:n_ts] = frame_timestamps[:n_ts]
+                    cur_px, cur_py = cursor_pixels_at(
+                        track_soa, frame_times,
+                        m_left, m_top, m_w, m_h, src_w, src_h,
+                    )
                 _has_clicks = len(click_events) > 0 and m_w > 0
+                clicks_soa = ClickTrack.from_events(click_events)
 
                 cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
                 f_idx = 0
@@ -607,14 +628,22 @@ class VideoExporter(QObject):
                     zoom, px, py = engine.compute_at(t_ms)
 
                     if _has_cursor:
-                        draw_cursor_cv(
-                            frame, mouse_track, t_ms,
-                            m_left, m_top, m_w, m_h,
-                            c_bgr, c_alpha,
-                        )
+                        fi = f_idx - 1
+                        if fi < len(cur_px):
+                            draw_cursor_cv_at(
+                                frame, cur_px[fi], cur_py[fi],
+                                c_premul, c_inv_alpha, c_scratch,
+                            )
+                        else:
+                            # More frames than the container reported
+                            draw_cursor_cv(
+                                frame, track_soa, t_ms,
+                                m_left, m_top, m_w, m_h,
+                                c_premul, c_inv_alpha,
+                            )
                     if _has_clicks:
                         draw_clicks_cv(
-                            frame, click_events, t_ms,
+                            frame, clicks_soa, t_ms,
                             m_left, m_top, m_w, m_h,
                         )
 
@@ -644,19 +673,25 @@ class VideoExporter(QObject):
                         video_end_ms = (f_idx / fps) * 1000.0
                     if end_time > video_end_ms:
                         extra = int((end_time - video_end_ms) / 1000.0 * fps) + 1
+                        if _has_cursor:
+                            tail_px, tail_py = cursor_pixels_at(
+                                track_soa,
+                                video_end_ms + (np.arange(extra) / fps) * 1000.0,
+                                m_left, m_top, m_w, m_h,
+                                last_f.shape[1], last_f.shape[0],
+                            )
                         for ei in range(extra):
                             t_ms = video_end_ms + (ei / fps) * 1000.0
                             zoom, px, py = engine.compute_at(t_ms)
                             fc = last_f.copy()
                             if _has_cursor:
-                                draw_cursor_cv(
-                                    fc, mouse_track, t_ms,
-                                    m_left, m_top, m_w, m_h,
-                                    c_bgr, c_alpha,
+                                draw_cursor_cv_at(
+                                    fc, tail_px[ei], tail_py[ei],
+                                    c_premul, c_inv_alpha, c_scratch,
                                 )
                             if _has_clicks:
                                 draw_clicks_cv(
-                                    fc, click_events, t_ms,
+                                    fc, clicks_soa, t_ms,
                                     m_left, m_top, m_w, m_h,
                                 )
                             composed = _compose_cv(
@@ -20,11 +20,12 @@ from PySide6.QtWidgets import (
 from ..models import ZoomKeyframe, MousePosition, KeyEvent, ClickEvent
 from ..activity_analyzer import analyze_activity
 from ..backgrounds import (
-    PRESETS, DEFAULT_PRESET, BackgroundPreset,
+    PRESETS_BY_NAME, DEFAULT_PRESET, BackgroundPreset,
     SOLID_PRESETS, GRADIENT_PRESETS, PATTERN_PRESETS,
     CAT_SOLID, CAT_GRADIENT, CAT_PATTERN, CATEGORY_LABELS,
 )
-from ..frames import FRAME_PRESETS, DEFAULT_FRAME, FramePreset
+from ..frames import FRAME_PRESETS, FRAME_PRESETS_BY_NAME, DEFAULT_FRAME, FramePreset
+from ..theme import MENU_QSS
 from ..utils import (
     fmt_time as _fmt,
     detect_available_encoders as _detect_encoders,
@@ -311,11 +312,7 @@ class EditorPanel(QWidget):
         """Show settings popup menu from the cog button."""
         from PySide6.QtWidgets import QMenu, QWidgetAction
         menu = QMenu(self)
-        menu.setStyleSheet(
-            "QMenu { background: #28263e; color: #e4e4ed; border: 1px solid #3d3a58; padding: 4px; }"
-            "QMenu::item { padding: 6px 20px; }"
-            "QMenu::item:selected { background: #8b5cf6; }"
-        )
+        menu.setStyleSheet(MENU_QSS)
 
         # Debug overlay toggle
         check_text = "✓ " if self._debug_overlay_enabled else "  "
@@ -390,13 +387,13 @@ class EditorPanel(QWidget):
         return self._current_output_dim
 
     def _on_frame_changed(self, text: str) -> None:
-        fp = next((f for f in FRAME_PRESETS if f.name == text), DEFAULT_FRAME)
+        fp = FRAME_PRESETS_BY_NAME.get(text, DEFAULT_FRAME)
         self._current_frame_preset = fp
         self.frame_changed.emit(fp)
 
     def set_background_by_name(self, name: str) -> None:
         """Programmatically select a background preset by name."""
-        preset = next((p for p in PRESETS if p.name == name), None)
+        preset = PRESETS_BY_NAME.get(name)
         if preset is None:
             return
         self._current_bg_preset = preset
@@ -457,7 +454,7 @@ class EditorPanel(QWidget):
         """Update border highlight on the selected swatch."""
         for btn in self._bg_buttons:
             tip = btn.toolTip()
-            preset = next((p for p in PRESETS if p.name == tip), None)
+            preset = PRESETS_BY_NAME.get(tip)
             if preset is None:
                 continue
             is_active = btn is active_btn
@@ -14,6 +14,8 @@ from PySide6.QtGui import QImage, QPainter, QColor, QFont, QPen
 from PySide6.QtWidgets import QWidget, QMenu
 
 from ..models import MousePosition, ClickEvent, ZoomKeyframe
+from ..cursor_renderer import ClickTrack, MouseTrack
+from ..utils import count_grabbed_frames, probe_video_stream, read_avi_frame_info
 
 
 class PreviewWidget(QWidget):
@@ -43,8 +45,8 @@ class PreviewWidget(QWidget):
         self._pan_y: float = 0.5
 
         # mouse cursor overlay data
-        self._mouse_track: List[MousePosition] = []
-        self._click_events: List[ClickEvent] = []
+        self._mouse_track: Optional[MouseTrack] = None
+        self._click_events: Optional[ClickTrack] = None
         self._monitor_rect: Optional[dict] = None
         self._current_time_ms: float = 0.0
 
@@ -101,9 +103,15 @@ class PreviewWidget(QWidget):
         click_events: Optional[List[ClickEvent]] = None,
     ) -> None:
         """Provide mouse track + monitor rect for cursor overlay."""
-        self._mouse_track = mouse_track
+        # Converted once here so per-frame interpolation is a searchsorted
+        self._mouse_track = MouseTrack.from_positions(mouse_track)
         self._monitor_rect = monitor_rect
-        self._click_events = click_events or []
+        self._click_events = ClickTrack.from_events(click_events or [])
+
+    def set_click_events(self, click_events: List[ClickEvent]) -> None:
+        """Replace the clicks drawn as ripples (e.g. after a deletion)."""
+        self._click_events = ClickTrack.from_events(click_events)
+        self.update()
 
     def set_current_time(self, time_ms: float) -> None:
         """Set the current playback time for cursor positioning."""
@@ -207,10 +215,17 @@ class PreviewWidget(QWidget):
                 need_recount = True
 
         if need_recount:
-            real_frame_count = 0
-            while self._video_cap.grab():
-                real_frame_count += 1
-            self._video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            # Read the count from the AVI header or a packet probe (as the
+            # post-recording finalize does) so this GUI-thread path doesn't
+            # decode the whole file; grab frames only if neither answers
+            probe = read_avi_frame_info(path) if path.lower().endswith(".avi") else None
+            if probe is None:
+                probe = probe_video_stream(path)
+            if probe is not None:
+                real_frame_count = probe[0]
+            else:
+                real_frame_count = count_grabbed_frames(self._video_cap)
+                self._video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
             if duration_ms > 0 and real_frame_count > 0:
                 self._video_fps = real_frame_count / (duration_ms / 1000.0)
             elif actual_fps > 0:
@@ -773,6 +788,12 @@ class PreviewWidget(QWidget):
 
     @staticmethod
     def _numpy_to_qimage(frame: np.ndarray) -> QImage:
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, c = rgb.shape
-        return QImage(rgb.data, w, h, rgb.strides[0], QImage.Format.Format_RGB888).copy()
+        """Wrap a decoded BGR frame as an opaque ``Format_RGB32`` image.
+
+        BGRA bytes with alpha 255 are exactly RGB32's little-endian
+        ``0xffRRGGBB`` layout, which the raster engine scales and blends
+        without the per-paint conversion that ``Format_RGB888`` needs.
+        """
+        bgra = cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA)
+        h, w = bgra.shape[:2]
+        return QImage(bgra.data, w, h, bgra.strides[0], QImage.Format.Format_RGB32).copy()
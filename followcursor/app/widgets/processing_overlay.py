@@ -1,5 +1,7 @@
 """Processing overlay — prominent banner shown while finishing a recording."""
 
+from typing import Optional
+
 from PySide6.QtCore import Qt, QTimer, QRectF
 from PySide6.QtGui import QPainter, QColor, QFont, QLinearGradient
 from PySide6.QtWidgets import QWidget
@@ -17,6 +19,7 @@ class ProcessingOverlay(QWidget):
         self._pulse_dir: float = 1.0
         self._title: str = "Finishing recording\u2026"
         self._subtitle: str = "Processing video, please wait"
+        self._progress: Optional[float] = None  # None = indeterminate
         self._timer = QTimer(self)
         self._timer.setInterval(30)
         self._timer.timeout.connect(self._tick)
@@ -29,6 +32,7 @@ class ProcessingOverlay(QWidget):
         """Display the overlay with custom title and subtitle text."""
         self._title = title
         self._subtitle = subtitle
+        self._progress = None
         self._pulse = 0.0
         self._pulse_dir = 1.0
         self.setVisible(True)
@@ -36,6 +40,11 @@ class ProcessingOverlay(QWidget):
         self.update()
         self._timer.start()
 
+    def set_progress(self, fraction: float) -> None:
+        """Show a determinate progress bar in the banner (0.0–1.0)."""
+        self._progress = min(max(fraction, 0.0), 1.0)
+        self.update()
+
     def hide_overlay(self) -> None:
         """Hide the overlay and stop the pulse animation."""
         self._timer.stop()
@@ -114,3 +123,14 @@ class ProcessingOverlay(QWidget):
         painter.setFont(sub_font)
         painter.setPen(QColor(136, 134, 160))
         painter.drawText(int(text_x), int(text_y + 20), self._subtitle)
+
+        # Progress bar along the bottom of the banner, once known
+        if self._progress is not None:
+            track = QRectF(bx + 60, by + banner_h - 16, banner_w - 84, 4)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(255, 255, 255, 30))
+            painter.drawRoundedRect(track, 2, 2)
+            if self._progress > 0:
+                fill = QRectF(track.x(), track.y(), track.width() * self._progress, track.height())
+                painter.setBrush(QColor(139, 92, 246))
+                painter.drawRoundedRect(fill, 2, 2)
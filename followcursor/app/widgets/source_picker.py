@@ -1,5 +1,6 @@
 """Source picker dialog — select a monitor or window to capture."""
 
+import time
 from typing import Optional, List
 
 from PySide6.QtCore import Qt, QThread, Signal as QtSignal
@@ -19,6 +20,10 @@ from PySide6.QtGui import QPixmap, QImage
 
 from ..screen_recorder import ScreenRecorder
 
+# A reopened dialog re-enumerates monitors and windows (and re-grabs
+# their thumbnails) only if its last snapshot is older than this.
+SNAPSHOT_MAX_AGE_S = 2.0
+
 
 # ── background workers ──────────────────────────────────────────
 
@@ -128,7 +133,11 @@ class _SourceCard(QFrame):
 
 
 class SourcePickerDialog(QDialog):
-    """Modal dialog that lists available monitors and windows."""
+    """Modal dialog that lists available monitors and windows.
+
+    The dialog is meant to be kept and reopened: call :meth:`refresh`
+    before each ``exec()`` to bring a stale source list up to date.
+    """
 
     def __init__(self, parent: QWidget | None = None,
                  exclude_hwnd: int = 0) -> None:
@@ -145,6 +154,10 @@ class SourcePickerDialog(QDialog):
         self._card_by_monitor: dict[int, _SourceCard] = {}
         self._card_by_hwnd: dict[int, _SourceCard] = {}
         self.chosen_source: dict = {}  # returned to caller
+        self._snapshot_time: float = 0.0  # time.monotonic() of last enumeration
+        # Last thumbnail per ("monitor", index) / ("window", hwnd), shown on
+        # re-enumerated cards until the fresh grab arrives
+        self._thumbs: dict[tuple, QPixmap] = {}
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 28, 32, 24)
@@ -181,6 +194,19 @@ class SourcePickerDialog(QDialog):
         btn_row.addWidget(select_btn)
         layout.addLayout(btn_row)
 
+        self._snapshot_time = time.monotonic()
+
+    def refresh(self, max_age_s: float = SNAPSHOT_MAX_AGE_S) -> None:
+        """Re-enumerate monitors and windows if the snapshot is older than *max_age_s*.
+
+        A recent snapshot is kept as-is, including the current selection.
+        """
+        if time.monotonic() - self._snapshot_time < max_age_s:
+            return
+        self._populate_monitors()
+        self._refresh_windows()
+        self._snapshot_time = time.monotonic()
+
     # ── tabs ────────────────────────────────────────────────────
 
     def _build_screens_tab(self) -> QWidget:
@@ -199,28 +225,13 @@ class SourcePickerDialog(QDialog):
         scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
         grid_widget = QWidget()
         grid_widget.setStyleSheet("background: transparent;")
-        grid = QGridLayout(grid_widget)
-        grid.setSpacing(16)
-
-        monitors = ScreenRecorder.get_monitors()
-        for i, mon in enumerate(monitors):
-            mon["type"] = "monitor"
-            card = _SourceCard(mon, None)
-            if i == 0:
-                card.selected = True
-                self.chosen_source = mon
-            card.mousePressEvent = self._make_card_click(card, card.mousePressEvent)
-            self._monitor_cards.append(card)
-            self._card_by_monitor[mon["index"]] = card
-            grid.addWidget(card, i // 3, i % 3)
+        self._mon_grid = QGridLayout(grid_widget)
+        self._mon_grid.setSpacing(16)
 
         scroll.setWidget(grid_widget)
         tab_layout.addWidget(scroll, 1)
 
-        # Load thumbnails in background
-        self._mon_worker = _MonitorThumbWorker(monitors, self)
-        self._mon_worker.thumbnail_ready.connect(self._on_monitor_thumb)
-        self._mon_worker.start()
+        self._populate_monitors()
 
         return widget
 
@@ -260,6 +271,33 @@ class SourcePickerDialog(QDialog):
 
         return widget
 
+    # ── monitor list ────────────────────────────────────────────
+
+    def _populate_monitors(self) -> None:
+        for card in self._monitor_cards:
+            card.setParent(None)
+            card.deleteLater()
+        self._monitor_cards.clear()
+        self._card_by_monitor.clear()
+
+        monitors = ScreenRecorder.get_monitors()
+        self._prune_thumbs("monitor", {mon["index"] for mon in monitors})
+        for i, mon in enumerate(monitors):
+            mon["type"] = "monitor"
+            card = _SourceCard(mon, self._thumbs.get(("monitor", mon["index"])))
+            if i == 0:
+                card.selected = True
+                self.chosen_source = mon
+            card.mousePressEvent = self._make_card_click(card, card.mousePressEvent)
+            self._monitor_cards.append(card)
+            self._card_by_monitor[mon["index"]] = card
+            self._mon_grid.addWidget(card, i // 3, i % 3)
+
+        # Load thumbnails in background
+        self._mon_worker = _MonitorThumbWorker(monitors, self)
+        self._mon_worker.thumbnail_ready.connect(self._on_monitor_thumb)
+        self._mon_worker.start()
+
     # ── window list ─────────────────────────────────────────────
 
     def _refresh_windows(self) -> None:
@@ -271,9 +309,10 @@ class SourcePickerDialog(QDialog):
 
         from ..window_utils import enumerate_windows
         windows = enumerate_windows(exclude_hwnd=self._exclude_hwnd)
+        self._prune_thumbs("window", {win["hwnd"] for win in windows})
 
         for i, win in enumerate(windows):
-            card = _SourceCard(win, None)
+            card = _SourceCard(win, self._thumbs.get(("window", win["hwnd"])))
             card.mousePressEvent = self._make_card_click(card, card.mousePressEvent)
             self._window_cards.append(card)
             self._card_by_hwnd[win["hwnd"]] = card
@@ -286,7 +325,14 @@ class SourcePickerDialog(QDialog):
 
     # ── thumbnail callbacks ─────────────────────────────────────
 
+    def _prune_thumbs(self, kind: str, keep: set) -> None:
+        """Forget cached *kind* thumbnails whose source is no longer listed."""
+        for key in [k for k in self._thumbs if k[0] == kind and k[1] not in keep]:
+            del self._thumbs[key]
+
     def _on_monitor_thumb(self, monitor_index: int, pixmap) -> None:
+        if pixmap:
+            self._thumbs[("monitor", monitor_index)] = pixmap
         card = self._card_by_monitor.get(monitor_index)
         if card and pixmap:
             tw = card._thumb_label.width() or 400
@@ -298,6 +344,8 @@ class SourcePickerDialog(QDialog):
             )
 
     def _on_window_thumb(self, hwnd: int, pixmap) -> None:
+        if pixmap:
+            self._thumbs[("window", hwnd)] = pixmap
         card = self._card_by_hwnd.get(hwnd)
         if card and pixmap:
             tw = card._thumb_label.width() or 400
@@ -1,8 +1,8 @@
 """Timeline widget — Clipchamp-inspired with playback controls, heatmap & keyframes."""
 
-import math
-from typing import List
+from typing import List, Optional, Tuple
 
+import numpy as np
 from PySide6.QtCore import Qt, Signal, QRectF, QPointF
 from PySide6.QtGui import (
     QPainter,
@@ -15,7 +15,9 @@ from PySide6.QtGui import (
 )
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMenu
 
+from ..cursor_renderer import MouseTrack
 from ..models import ZoomKeyframe, MousePosition, KeyEvent, ClickEvent
+from ..theme import MENU_QSS
 from ..utils import fmt_time as _fmt
 
 
@@ -27,6 +29,33 @@ def _fmt_precise(ms: float) -> str:
     return f"{m}:{s:02d}.{cs:02d}"
 
 
+def _bucket_index(ts: np.ndarray, duration: float, buckets: int) -> np.ndarray:
+    """Heatmap bucket of each timestamp in *ts*, clamped to ``[0, buckets)``."""
+    return np.clip((ts / duration * buckets).astype(np.int64), 0, buckets - 1)
+
+
+def mouse_speed_buckets(track: MouseTrack, duration: float, buckets: int) -> np.ndarray:
+    """Peak mouse speed (px/ms) per heatmap bucket across *duration*.
+
+    Each speed is attributed to the bucket of the later sample of its pair.
+    """
+    ts, xs, ys = track.ts, track.xs, track.ys
+    speeds = np.zeros(buckets)
+    if len(ts) < 2 or duration <= 0:
+        return speeds
+    dt = np.maximum(np.diff(ts), 1.0)
+    speed = np.hypot(np.diff(xs), np.diff(ys)) / dt
+    np.maximum.at(speeds, _bucket_index(ts[1:], duration, buckets), speed)
+    return speeds
+
+
+def event_count_buckets(ts: np.ndarray, duration: float, buckets: int) -> np.ndarray:
+    """Number of events per heatmap bucket across *duration*."""
+    if len(ts) == 0 or duration <= 0:
+        return np.zeros(buckets, dtype=np.int64)
+    return np.bincount(_bucket_index(ts, duration, buckets), minlength=buckets)
+
+
 class _TimelineTrack(QWidget):
     """Custom-painted track showing activity heatmap, zoom segments, and trim handles.
 
@@ -67,6 +96,12 @@ class _TimelineTrack(QWidget):
         self.trim_start_ms: float = 0.0
         self.trim_end_ms: float = 0.0  # 0 = no trim
 
+        # Heatmaps are rebuilt only when their inputs change, not on every
+        # playhead repaint: (source list, cache key, buckets) per activity
+        # track.  Holding the list keeps its identity from being reused.
+        self._mouse_heat: Optional[Tuple[list, tuple, np.ndarray]] = None
+        self._key_heat: Optional[Tuple[list, tuple, np.ndarray]] = None
+
         # Drag state for zoom segment resizing / moving
         self._drag_kf_id: str | None = None    # which keyframe is being dragged
         self._dragging: bool = False
@@ -105,11 +140,7 @@ class _TimelineTrack(QWidget):
             self._selected_click_idx = click_idx
             self.update()
             menu = QMenu(self)
-            menu.setStyleSheet(
-                "QMenu { background: #28263e; color: #e4e4ed; border: 1px solid #3d3a58; padding: 4px; }"
-                "QMenu::item { padding: 6px 20px; }"
-                "QMenu::item:selected { background: #8b5cf6; }"
-            )
+            menu.setStyleSheet(MENU_QSS)
             del_act = menu.addAction("🗑 Delete click event")
             del_act.triggered.connect(lambda: self._delete_selected_click())
             menu.exec(self.mapToGlobal(pos))
@@ -210,24 +241,21 @@ class _TimelineTrack(QWidget):
         painter.drawText(4, top + h - 3, "Mouse")
 
         buckets = min(w, 200)
-        speeds = [0.0] * buckets
-        max_speed = 0.0
-
-        for i in range(1, len(track)):
-            prev, curr = track[i - 1], track[i]
-            dx = curr.x - prev.x
-            dy = curr.y - prev.y
-            dt = max(curr.timestamp - prev.timestamp, 1)
-            speed = math.sqrt(dx * dx + dy * dy) / dt
-            bucket = min(buckets - 1, int((curr.timestamp / dur) * buckets))
-            speeds[bucket] = max(speeds[bucket], speed)
-            max_speed = max(max_speed, speed)
+        # The track list is replaced, never mutated, so identity + length
+        # is enough to tell whether the cached heatmap is stale
+        key = (len(track), dur, buckets)
+        cached = self._mouse_heat
+        if cached is None or cached[0] is not track or cached[1] != key:
+            speeds = mouse_speed_buckets(MouseTrack.from_positions(track), dur, buckets)
+            cached = self._mouse_heat = (track, key, speeds)
+        speeds = cached[2]
+        max_speed = float(speeds.max())
 
         if max_speed == 0:
             return
 
         bw = w / buckets
-        for i, s in enumerate(speeds):
+        for i, s in enumerate(speeds.tolist()):
             intensity = s / max_speed
             r = int(120 + intensity * 100)
             g = int(60 + intensity * 20)
@@ -251,19 +279,19 @@ class _TimelineTrack(QWidget):
         painter.drawText(4, top + h - 2, "Keys")
 
         buckets = min(w, 200)
-        counts = [0] * buckets
-        max_count = 0
-
-        for ev in events:
-            bucket = min(buckets - 1, int((ev.timestamp / dur) * buckets))
-            counts[bucket] += 1
-            max_count = max(max_count, counts[bucket])
+        key = (len(events), dur, buckets)
+        cached = self._key_heat
+        if cached is None or cached[0] is not events or cached[1] != key:
+            ts = np.fromiter((ev.timestamp for ev in events), np.float64, len(events))
+            cached = self._key_heat = (events, key, event_count_buckets(ts, dur, buckets))
+        counts = cached[2]
+        max_count = int(counts.max())
 
         if max_count == 0:
             return
 
         bw = w / buckets
-        for i, c in enumerate(counts):
+        for i, c in enumerate(counts.tolist()):
             if c == 0:
                 continue
             intensity = c / max_count
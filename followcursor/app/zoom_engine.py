@@ -3,11 +3,12 @@
 The engine holds an ordered list of :class:`ZoomKeyframe` objects and
 computes the current ``(zoom, pan_x, pan_y)`` at any point in time
 using quintic ease-out interpolation.  It also maintains an undo/redo
-stack (deep-copy snapshots, max 50 entries).
+stack (deep-copy snapshots, max 50 entries) and an id → index map
+so editor callbacks can find a keyframe without scanning the list.
 """
 
 import copy
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from .models import ZoomKeyframe
 
 
@@ -45,6 +46,9 @@ class ZoomEngine:
         self.current_pan_x: float = 0.5
         self.current_pan_y: float = 0.5
 
+        # id → position in ``keyframes``; rebuilt lazily when stale
+        self._id_index: Dict[str, int] = {}
+
         # Undo / redo stacks — each entry is a deep-copied keyframe list
         self._undo_stack: List[List[ZoomKeyframe]] = []
         self._redo_stack: List[List[ZoomKeyframe]] = []
@@ -99,10 +103,37 @@ class ZoomEngine:
         """Insert a keyframe, keeping the list sorted by timestamp."""
         self.keyframes.append(kf)
         self.keyframes.sort(key=lambda k: k.timestamp)
+        self._rebuild_index()
 
     def remove_keyframe(self, kf_id: str) -> None:
         """Remove a keyframe by its unique ID."""
         self.keyframes = [kf for kf in self.keyframes if kf.id != kf_id]
+        self._rebuild_index()
+
+    # ── id lookup ───────────────────────────────────────────────────
+
+    def _rebuild_index(self) -> None:
+        """Re-map every keyframe id to its current list position."""
+        self._id_index = {kf.id: i for i, kf in enumerate(self.keyframes)}
+
+    def index_of(self, kf_id: str) -> Optional[int]:
+        """Position of keyframe *kf_id* in ``keyframes``, or None.
+
+        ``keyframes`` is a plain list that callers also sort or replace
+        directly (drags, undo/redo), so a cached position is verified
+        before use and the map rebuilt once if it has gone stale.
+        """
+        kfs = self.keyframes
+        idx = self._id_index.get(kf_id)
+        if idx is None or idx >= len(kfs) or kfs[idx].id != kf_id:
+            self._rebuild_index()
+            idx = self._id_index.get(kf_id)
+        return idx
+
+    def find(self, kf_id: str) -> Optional[ZoomKeyframe]:
+        """Return keyframe *kf_id*, or None if there is no such keyframe."""
+        idx = self.index_of(kf_id)
+        return self.keyframes[idx] if idx is not None else None
 
     def clear(self) -> None:
         """Remove all keyframes and reset zoom/pan to defaults."""
@@ -1,10 +1,21 @@
 """Tests for app.activity_analyzer — auto-zoom generation logic."""
 
+import numpy as np
 import pytest
 
 from app.activity_analyzer import (
     analyze_activity,
     _dampen_pan,
+    _make_dampen_pan,
+    _window_means,
+    _score_windows,
+    _grid_add,
+    _has_spatial_neighbour,
+    _reduce_clusters,
+    _segment_argmax,
+    LABEL_MOUSE,
+    LABEL_TYPING,
+    LABEL_CLICK,
     PEAK_TOP_N,
     MAX_CLUSTER_DURATION_MS,
     PAN_MERGE_GAP_MS,
@@ -13,6 +24,7 @@ from app.activity_analyzer import (
     ANTICIPATION_MS,
     ZOOM_LEVEL,
     WINDOW_MS,
+    SPATIAL_MERGE_DIST,
 )
 from app.models import MousePosition, KeyEvent, ClickEvent, ZoomKeyframe
 
@@ -83,6 +95,108 @@ class TestDampenPan:
         assert py >= half
 
 
+class TestMakeDampenPan:
+    @pytest.mark.parametrize("zoom", [1.0, 1.25, 1.5, 2.0, 3.0])
+    def test_matches_dampen_pan(self, zoom: float) -> None:
+        dampen = _make_dampen_pan(zoom)
+        for tx, ty, fx, fy in [(0.9, 0.1, 0.5, 0.5), (0.0, 1.0, 0.3, 0.7),
+                               (0.5, 0.5, 0.5, 0.5), (0.2, 0.8, 0.6, 0.4)]:
+            assert dampen(tx, ty, fx, fy) == _dampen_pan(tx, ty, zoom, from_x=fx, from_y=fy)
+
+
+# ── _window_means ───────────────────────────────────────────────────
+
+
+class TestWindowMeans:
+    def test_means_per_slice(self) -> None:
+        values = np.array([1.0, 3.0, 10.0, 20.0, 30.0])
+        bounds = np.array([0, 2, 5])
+        assert _window_means(values, bounds, 0.0).tolist() == [2.0, 20.0]
+
+    def test_empty_slices_get_default(self) -> None:
+        """Empty windows (including trailing ones) use the default."""
+        values = np.array([4.0, 6.0, 99.0])
+        bounds = np.array([0, 0, 2, 2, 2])
+        assert _window_means(values, bounds, 0.5).tolist() == [0.5, 5.0, 0.5, 0.5]
+
+    def test_ignores_values_past_last_bound(self) -> None:
+        values = np.array([2.0, 4.0, 1000.0])
+        bounds = np.array([0, 2])
+        assert _window_means(values, bounds, 0.0).tolist() == [3.0]
+
+
+# ── _score_windows ──────────────────────────────────────────────────
+
+
+class TestScoreWindows:
+    def test_typing_and_settlement_labels(self) -> None:
+        """Keys over a still mouse → typing; fast→still → settlement."""
+        # Window 0: fast movement, window 1: still, window 2: still + keys
+        sample_t = np.arange(0.0, 1500.0, 16.0)
+        speed = np.where(sample_t < WINDOW_MS, 5.0, 0.0)
+        pos = np.full_like(sample_t, 0.5)
+        key_ts = np.arange(1000.0, 1500.0, 50.0)
+        _, score, _, _, label = _score_windows(sample_t, speed, pos, pos, key_ts, 3)
+        assert label.tolist() == [LABEL_MOUSE, LABEL_MOUSE, LABEL_TYPING]
+        assert score[1] == pytest.approx(0.5)   # capped deceleration score
+        assert score[2] == pytest.approx(1.0)   # 20 kps, mouse still
+
+
+# ── spatial merge grid ──────────────────────────────────────────────
+
+
+class TestSpatialGrid:
+    def test_neighbour_across_cell_boundary(self) -> None:
+        grid: dict = {}
+        _grid_add(grid, (1000.0, 0.8, SPATIAL_MERGE_DIST - 0.01, 0.5, LABEL_CLICK))
+        p = (3000.0, 0.8, SPATIAL_MERGE_DIST + 0.01, 0.5, LABEL_CLICK)
+        assert _has_spatial_neighbour(grid, p, max_gap=8000)
+
+    def test_rejects_far_stale_or_other_type(self) -> None:
+        grid: dict = {}
+        _grid_add(grid, (1000.0, 0.8, 0.5, 0.5, LABEL_CLICK))
+        assert not _has_spatial_neighbour(grid, (3000.0, 0.8, 0.9, 0.5, LABEL_CLICK), 8000)
+        assert not _has_spatial_neighbour(grid, (9500.0, 0.8, 0.5, 0.5, LABEL_CLICK), 8000)
+        assert not _has_spatial_neighbour(grid, (3000.0, 0.8, 0.5, 0.5, LABEL_TYPING), 8000)
+
+
+# ── _segment_argmax ─────────────────────────────────────────────────
+
+
+class TestSegmentArgmax:
+    def test_first_max_per_segment(self) -> None:
+        values = np.array([1.0, 3.0, 3.0, 2.0, 5.0, 0.0])
+        starts = np.array([0, 3, 5])
+        assert _segment_argmax(values, starts).tolist() == [1, 4, 5]
+
+
+# ── _reduce_clusters ────────────────────────────────────────────────
+
+
+class TestReduceClusters:
+    def test_per_cluster_stats(self) -> None:
+        clusters = [
+            [(100.0, 0.2, 0.1, 0.1, LABEL_MOUSE), (300.0, 0.6, 0.3, 0.5, LABEL_TYPING)],
+            [(900.0, 0.8, 0.7, 0.7, LABEL_CLICK)],
+        ]
+        start, end, peak, total, sum_x, sum_y, best = _reduce_clusters(clusters)
+        assert start.tolist() == [100.0, 900.0]
+        assert end.tolist() == [300.0, 900.0]
+        assert peak.tolist() == pytest.approx([0.6, 0.8])
+        assert total.tolist() == pytest.approx([0.8, 0.8])
+        assert sum_x[0] / total[0] == pytest.approx(0.25)
+        assert sum_y[0] / total[0] == pytest.approx(0.4)
+        assert [b[4] for b in best] == [LABEL_TYPING, LABEL_CLICK]
+
+    def test_best_is_first_of_tied_peaks(self) -> None:
+        cluster = [(100.0, 0.5, 0.1, 0.1, LABEL_MOUSE), (200.0, 0.5, 0.9, 0.9, LABEL_TYPING)]
+        best = _reduce_clusters([cluster])[6]
+        assert best[0] is cluster[0]
+
+    def test_no_clusters(self) -> None:
+        assert _reduce_clusters([])[6] == []
+
+
 # ── analyze_activity — edge cases ───────────────────────────────────
 
 
@@ -0,0 +1,297 @@
+"""Tests for app.cursor_renderer — cursor template and export blending."""
+
+import numpy as np
+import pytest
+
+from app.cursor_renderer import (
+    CLICK_COLOR_BGR,
+    CLICK_DURATION_MS,
+    ClickTrack,
+    MouseTrack,
+    _CLICK_BGR_RAMP,
+    _RIPPLE_CV_RING_SHADE,
+    _RIPPLE_RADIUS_FRAC,
+    _RIPPLE_RING_ALPHA,
+    _RIPPLE_STEPS,
+    _build_cursor_template,
+    _cv_line_type,
+    _interp_mouse,
+    as_click_track,
+    as_mouse_track,
+    cursor_pixels_at,
+    draw_clicks_cv,
+    draw_cursor_cv,
+    draw_cursor_cv_at,
+)
+from app.models import ClickEvent, MousePosition
+
+
+def _reference_blend(bg: np.ndarray, bgr: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """Float alpha blend, rounded to nearest — the ground truth."""
+    a = alpha[:, :, np.newaxis] / 255.0
+    return np.rint(bgr * a + bg.astype(np.float64) * (1.0 - a)).astype(np.uint8)
+
+
+# ── MouseTrack / _interp_mouse ──────────────────────────────────────
+
+
+class TestMouseTrack:
+    def test_from_positions(self, simple_mouse_track: list[MousePosition]) -> None:
+        mt = MouseTrack.from_positions(simple_mouse_track)
+        assert len(mt) == len(simple_mouse_track)
+        assert mt.ts.tolist() == [p.timestamp for p in simple_mouse_track]
+        assert mt.xs.tolist() == [p.x for p in simple_mouse_track]
+        assert mt.ys.tolist() == [p.y for p in simple_mouse_track]
+
+    def test_as_mouse_track_passthrough(self, simple_mouse_track: list[MousePosition]) -> None:
+        mt = MouseTrack.from_positions(simple_mouse_track)
+        assert as_mouse_track(mt) is mt
+        assert len(as_mouse_track(simple_mouse_track)) == len(simple_mouse_track)
+
+
+class TestInterpMouse:
+    def test_empty(self) -> None:
+        assert _interp_mouse(MouseTrack.from_positions([]), 100.0) is None
+
+    def test_clamps_to_ends(self, simple_mouse_track: list[MousePosition]) -> None:
+        mt = MouseTrack.from_positions(simple_mouse_track)
+        first, last = simple_mouse_track[0], simple_mouse_track[-1]
+        assert _interp_mouse(mt, -50.0) == (first.x, first.y)
+        assert _interp_mouse(mt, 1e9) == (last.x, last.y)
+
+    def test_exact_sample(self, simple_mouse_track: list[MousePosition]) -> None:
+        mt = MouseTrack.from_positions(simple_mouse_track)
+        p = simple_mouse_track[5]
+        assert _interp_mouse(mt, p.timestamp) == pytest.approx((p.x, p.y))
+
+    def test_linear_between_samples(self) -> None:
+        mt = MouseTrack.from_positions([
+            MousePosition(0.0, 0.0, 0.0),
+            MousePosition(100.0, 50.0, 100.0),
+            MousePosition(100.0, 150.0, 200.0),
+        ])
+        assert _interp_mouse(mt, 25.0) == pytest.approx((25.0, 12.5))
+        assert _interp_mouse(mt, 150.0) == pytest.approx((100.0, 100.0))
+
+    def test_duplicate_timestamps(self) -> None:
+        mt = MouseTrack.from_positions([
+            MousePosition(0.0, 0.0, 0.0),
+            MousePosition(10.0, 10.0, 50.0),
+            MousePosition(20.0, 20.0, 50.0),
+            MousePosition(30.0, 30.0, 100.0),
+        ])
+        # Past the duplicate, interpolation starts from its last sample
+        assert _interp_mouse(mt, 75.0) == pytest.approx((25.0, 25.0))
+
+
+class TestPositionsAt:
+    def test_matches_scalar_interp(self, long_mouse_track: list[MousePosition]) -> None:
+        mt = MouseTrack.from_positions(long_mouse_track)
+        times = np.concatenate([
+            [-100.0, 0.0, 16.0, 4000.0, 9984.0, 20000.0],
+            np.random.default_rng(1).uniform(-50, 10050, 500),
+        ])
+        xs, ys = mt.positions_at(times)
+        for t, x, y in zip(times, xs, ys):
+            assert (x, y) == _interp_mouse(mt, t)
+
+    def test_single_sample(self) -> None:
+        mt = MouseTrack.from_positions([MousePosition(3.0, 4.0, 100.0)])
+        xs, ys = mt.positions_at(np.array([0.0, 100.0, 500.0]))
+        assert xs.tolist() == [3.0, 3.0, 3.0]
+        assert ys.tolist() == [4.0, 4.0, 4.0]
+
+    def test_duplicate_timestamps(self) -> None:
+        mt = MouseTrack.from_positions([
+            MousePosition(0.0, 0.0, 0.0),
+            MousePosition(10.0, 10.0, 50.0),
+            MousePosition(20.0, 20.0, 50.0),
+            MousePosition(30.0, 30.0, 100.0),
+        ])
+        times = np.array([25.0, 50.0, 75.0])
+        xs, ys = mt.positions_at(times)
+        assert [(x, y) for x, y in zip(xs, ys)] == [_interp_mouse(mt, t) for t in times]
+
+
+class TestCursorPixelsAt:
+    def test_matches_per_frame_mapping(
+        self, long_mouse_track: list[MousePosition], monitor_rect: dict,
+    ) -> None:
+        mt = MouseTrack.from_positions(long_mouse_track)
+        times = np.arange(600) / 60.0 * 1000.0
+        pxs, pys = cursor_pixels_at(mt, times, 0, 0, 1920, 1080, 1280, 720)
+        for t, px, py in zip(times, pxs, pys):
+            mx, my = _interp_mouse(mt, t)
+            assert px == int(mx / 1920 * 1280)
+            assert py == int(my / 1080 * 720)
+
+
+# ── _build_cursor_template ──────────────────────────────────────────
+
+
+class TestCursorTemplate:
+    def test_shapes(self) -> None:
+        bgr, alpha, premul, inv_alpha = _build_cursor_template(32)
+        h, w = alpha.shape
+        assert bgr.shape == (h, w, 3)
+        assert premul.shape == (h, w, 3)
+        assert inv_alpha.shape == (h, w, 1)
+        assert premul.dtype == np.uint16
+        assert inv_alpha.dtype == np.uint16
+
+    def test_blend_operands(self) -> None:
+        bgr, alpha, premul, inv_alpha = _build_cursor_template(24)
+        np.testing.assert_array_equal(
+            premul, bgr.astype(np.uint16) * alpha[:, :, np.newaxis])
+        np.testing.assert_array_equal(inv_alpha[:, :, 0], 255 - alpha.astype(np.uint16))
+
+    def test_memoized_and_read_only(self) -> None:
+        first = _build_cursor_template(28)
+        assert _build_cursor_template(28) is first
+        for arr in first:
+            assert not arr.flags.writeable
+
+    def test_trimmed_to_visible_pixels(self) -> None:
+        _, alpha, _, _ = _build_cursor_template(40)
+        assert alpha[0].any() and alpha[-1].any()
+        assert alpha[:, 0].any() and alpha[:, -1].any()
+
+
+# ── draw_cursor_cv ──────────────────────────────────────────────────
+
+
+class TestDrawCursorCv:
+    @pytest.mark.parametrize("px, py", [(100, 80), (-5, -7), (390, 290)])
+    def test_matches_float_blend(self, px: int, py: int) -> None:
+        bgr, alpha, premul, inv_alpha = _build_cursor_template(40)
+        rng = np.random.default_rng(0)
+        frame = rng.integers(0, 256, (300, 400, 3), dtype=np.uint8)
+        expected = frame.copy()
+
+        # Monitor == frame size, so the track position is the pixel position
+        draw_cursor_cv(frame, [MousePosition(px, py, 0.0)], 0.0,
+                       0, 0, 400, 300, premul, inv_alpha)
+
+        ch, cw = alpha.shape
+        y1, x1 = max(py, 0), max(px, 0)
+        y2, x2 = min(py + ch, 300), min(px + cw, 400)
+        sy, sx = y1 - py, x1 - px
+        expected[y1:y2, x1:x2] = _reference_blend(
+            expected[y1:y2, x1:x2],
+            bgr[sy:sy + y2 - y1, sx:sx + x2 - x1],
+            alpha[sy:sy + y2 - y1, sx:sx + x2 - x1],
+        )
+        np.testing.assert_array_equal(frame, expected)
+
+    def test_draw_at_matches_track_lookup(self) -> None:
+        _, _, premul, inv_alpha = _build_cursor_template(30)
+        rng = np.random.default_rng(2)
+        a = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+        b = a.copy()
+        draw_cursor_cv(a, [MousePosition(40, 30, 0.0)], 0.0,
+                       0, 0, 320, 240, premul, inv_alpha)
+        draw_cursor_cv_at(b, 20, 15, premul, inv_alpha)
+        np.testing.assert_array_equal(a, b)
+
+    @pytest.mark.parametrize("px, py", [(10, 10), (-4, 90), (150, -3)])
+    def test_scratch_buffer_matches(self, px: int, py: int) -> None:
+        _, _, premul, inv_alpha = _build_cursor_template(30)
+        rng = np.random.default_rng(3)
+        a = rng.integers(0, 256, (100, 160, 3), dtype=np.uint8)
+        b = a.copy()
+        scratch = np.empty(premul.shape, dtype=np.uint16)
+        draw_cursor_cv_at(a, px, py, premul, inv_alpha)
+        draw_cursor_cv_at(b, px, py, premul, inv_alpha, scratch)
+        np.testing.assert_array_equal(a, b)
+
+    def test_offscreen_cursor_is_noop(self) -> None:
+        _, _, premul, inv_alpha = _build_cursor_template(20)
+        frame = np.full((50, 60, 3), 7, dtype=np.uint8)
+        draw_cursor_cv(frame, [MousePosition(500, 500, 0.0)], 0.0,
+                       0, 0, 60, 50, premul, inv_alpha)
+        assert (frame == 7).all()
+
+    def test_empty_track_is_noop(self) -> None:
+        _, _, premul, inv_alpha = _build_cursor_template(20)
+        frame = np.zeros((50, 60, 3), dtype=np.uint8)
+        draw_cursor_cv(frame, [], 0.0, 0, 0, 60, 50, premul, inv_alpha)
+        assert not frame.any()
+
+
+# ── ClickTrack ──────────────────────────────────────────────────────
+
+
+class TestClickTrack:
+    def test_sorted_by_timestamp(self) -> None:
+        ct = ClickTrack.from_events([
+            ClickEvent(3, 30, 300.0), ClickEvent(1, 10, 100.0), ClickEvent(2, 20, 200.0),
+        ])
+        assert ct.ts.tolist() == [100.0, 200.0, 300.0]
+        assert ct.xs.tolist() == [1, 2, 3]
+        assert ct.ys.tolist() == [10, 20, 30]
+
+    def test_as_click_track_passthrough(self) -> None:
+        ct = ClickTrack.from_events([ClickEvent(1, 2, 3.0)])
+        assert as_click_track(ct) is ct
+        assert len(as_click_track([ClickEvent(1, 2, 3.0)])) == 1
+
+    def test_visible_window(self) -> None:
+        clicks = [ClickEvent(i, i, i * 100.0) for i in range(20)]
+        ct = ClickTrack.from_events(clicks)
+        for time_ms in (-50.0, 0.0, 250.0, 999.0, 1000.0, 5000.0):
+            ts, xs, ys = ct.visible(time_ms)
+            expected = [c for c in clicks
+                        if 0 <= time_ms - c.timestamp <= CLICK_DURATION_MS]
+            assert ts == [c.timestamp for c in expected]
+            assert xs == [c.x for c in expected]
+
+    def test_empty(self) -> None:
+        assert ClickTrack.from_events([]).visible(100.0) == ([], [], [])
+
+
+# ── draw_clicks_cv ──────────────────────────────────────────────────
+
+
+class TestDrawClicksCv:
+    def test_line_type_threshold(self) -> None:
+        import cv2
+        assert _cv_line_type(10, 3) == cv2.LINE_8
+        assert _cv_line_type(40, 1) == cv2.LINE_8
+        assert _cv_line_type(40, 2) == cv2.LINE_AA
+
+    def test_color_ramp(self) -> None:
+        assert _CLICK_BGR_RAMP[0] == (0, 0, 0)
+        assert _CLICK_BGR_RAMP[255] == CLICK_COLOR_BGR
+        assert len(_CLICK_BGR_RAMP) == 256
+
+    def test_ripple_ramps(self) -> None:
+        assert len(_RIPPLE_RADIUS_FRAC) == _RIPPLE_STEPS
+        assert _RIPPLE_RADIUS_FRAC[0] == pytest.approx(0.3)
+        assert _RIPPLE_RADIUS_FRAC[-1] == pytest.approx(1.0)
+        assert _RIPPLE_RING_ALPHA[0] == 220 and _RIPPLE_RING_ALPHA[-1] == 0
+        # Ring hidden once it has faded below 5 %
+        assert _RIPPLE_CV_RING_SHADE[0] == int(0.85 * 255)
+        assert _RIPPLE_CV_RING_SHADE[-1] == -1
+
+    def test_ripple_at_window_edges(self) -> None:
+        frame = np.zeros((200, 300, 3), dtype=np.uint8)
+        clicks = [ClickEvent(150, 100, 1000.0)]
+        # Exactly at the click and at the end of the ripple window
+        draw_clicks_cv(frame, clicks, 1000.0, 0, 0, 300, 200)
+        draw_clicks_cv(frame, clicks, 1000.0 + CLICK_DURATION_MS, 0, 0, 300, 200)
+        assert frame[100, 150].any()
+
+    def test_draws_recent_click_only(self) -> None:
+        frame = np.zeros((200, 300, 3), dtype=np.uint8)
+        clicks = [ClickEvent(150, 100, 1000.0), ClickEvent(20, 20, 0.0)]
+        draw_clicks_cv(frame, clicks, 1100.0, 0, 0, 300, 200)
+        assert frame[100, 150].any()
+        assert not frame[:50, :50].any()
+
+    def test_track_matches_list(self) -> None:
+        clicks = [ClickEvent(40 + 10 * i, 60, 900.0 + 50 * i) for i in range(6)]
+        a = np.zeros((200, 300, 3), dtype=np.uint8)
+        b = a.copy()
+        draw_clicks_cv(a, clicks, 1100.0, 0, 0, 300, 200)
+        draw_clicks_cv(b, ClickTrack.from_events(clicks), 1100.0, 0, 0, 300, 200)
+        np.testing.assert_array_equal(a, b)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from app.frames import FramePreset, FRAME_PRESETS, DEFAULT_FRAME
+from app.frames import FramePreset, FRAME_PRESETS, FRAME_PRESETS_BY_NAME, DEFAULT_FRAME
 from app.backgrounds import (
     BackgroundPreset,
     PRESETS as BG_PRESETS,
@@ -10,6 +10,10 @@ from app.backgrounds import (
     SOLID_PRESETS,
     GRADIENT_PRESETS,
     PATTERN_PRESETS,
+    PRESETS_BY_CATEGORY,
+    PRESETS_BY_NAME as BG_PRESETS_BY_NAME,
+    PRESET_TABLE,
+    PresetTable,
     WAVE_LAYERS,
     CAT_SOLID,
     CAT_GRADIENT,
@@ -40,6 +44,27 @@ class TestFramePreset:
     def test_preset_count(self) -> None:
         assert len(FRAME_PRESETS) == 5
 
+    def test_by_name(self) -> None:
+        assert list(FRAME_PRESETS_BY_NAME.values()) == FRAME_PRESETS
+        assert FRAME_PRESETS_BY_NAME["Wide Bezel"] is DEFAULT_FRAME
+
+    def test_from_dict_interns_builtins(self) -> None:
+        for fp in FRAME_PRESETS:
+            assert FramePreset.from_dict(fp.to_dict()) is fp
+
+    def test_from_dict_modified_builtin_is_rebuilt(self) -> None:
+        d = DEFAULT_FRAME.to_dict()
+        d["padding"] = 0.1
+        fp = FramePreset.from_dict(d)
+        assert fp is not DEFAULT_FRAME
+        assert fp.name == DEFAULT_FRAME.name
+        assert fp.padding == 0.1
+
+    def test_frozen_and_hashable(self) -> None:
+        with pytest.raises(AttributeError):
+            DEFAULT_FRAME.padding = 0.5  # type: ignore[misc]
+        assert len({fp for fp in FRAME_PRESETS}) == len(FRAME_PRESETS)
+
     def test_default_is_wide_bezel(self) -> None:
         assert DEFAULT_FRAME.name == "Wide Bezel"
 
@@ -92,6 +117,10 @@ class TestBackgroundPreset:
             assert bp2.color_top == bp.color_top
             assert bp2.color_bottom == bp.color_bottom
 
+    def test_by_name(self) -> None:
+        assert list(BG_PRESETS_BY_NAME.values()) == BG_PRESETS
+        assert BG_PRESETS_BY_NAME["Pure White"] is BG_DEFAULT
+
     def test_preset_count_minimum(self) -> None:
         """Should have a substantial number of presets."""
         assert len(BG_PRESETS) >= 80
@@ -152,6 +181,21 @@ class TestBackgroundPreset:
             assert bp.kind == "wavy"
             assert bp.category == CAT_PATTERN
 
+    def test_presets_by_category_preserves_order(self) -> None:
+        assert list(PRESETS_BY_CATEGORY) == CATEGORIES
+        for cat, presets in PRESETS_BY_CATEGORY.items():
+            assert presets == [bp for bp in BG_PRESETS if bp.category == cat]
+
+    def test_qcolors_match_rgb(self) -> None:
+        pytest.importorskip("PySide6.QtGui")
+        bp = BackgroundPreset("t", "gradient", (10, 20, 30), (40, 50, 60))
+        assert bp.qcolor_top.getRgb()[:3] == (10, 20, 30)
+        assert bp.qcolor_bottom.getRgb()[:3] == (40, 50, 60)
+
+    def test_qcolors_ignored_by_equality(self) -> None:
+        d = BG_DEFAULT.to_dict()
+        assert BackgroundPreset.from_dict(d) == BG_DEFAULT
+
     def test_colors_are_tuples_after_roundtrip(self) -> None:
         d = BG_DEFAULT.to_dict()
         bp = BackgroundPreset.from_dict(d)
@@ -167,6 +211,34 @@ class TestBackgroundPreset:
         assert set(d.keys()) == {"name", "kind", "color_top", "color_bottom"}
 
 
+# ── PresetTable ─────────────────────────────────────────────────────
+
+
+class TestPresetTable:
+    def test_columns_match_presets(self) -> None:
+        assert len(PRESET_TABLE) == len(BG_PRESETS)
+        for i, bp in enumerate(BG_PRESETS):
+            assert PRESET_TABLE[i] is bp
+            assert PRESET_TABLE.names[i] == bp.name
+            assert PRESET_TABLE.kinds[i] == bp.kind
+            assert tuple(PRESET_TABLE.color_top[i].tolist()) == bp.color_top
+            assert tuple(PRESET_TABLE.color_bottom[i].tolist()) == bp.color_bottom
+
+    def test_category_indices(self) -> None:
+        assert [BG_PRESETS[i] for i in PRESET_TABLE.solids()] == SOLID_PRESETS
+        assert [BG_PRESETS[i] for i in PRESET_TABLE.gradients()] == GRADIENT_PRESETS
+        assert [BG_PRESETS[i] for i in PRESET_TABLE.patterns()] == PATTERN_PRESETS
+
+    def test_to_dicts_matches_to_dict(self) -> None:
+        assert PRESET_TABLE.to_dicts() == [bp.to_dict() for bp in BG_PRESETS]
+
+    def test_empty_table(self) -> None:
+        table = PresetTable([])
+        assert len(table) == 0
+        assert table.select(CAT_SOLID) == []
+        assert table.to_dicts() == []
+
+
 # ── Wave layers ─────────────────────────────────────────────────────
 
 
@@ -0,0 +1,43 @@
+"""Tests for app.icon — reuse checks for the generated .ico file."""
+
+import os
+
+import pytest
+
+pytest.importorskip("PySide6.QtGui")
+
+from app import icon
+from app.icon import _ICON_SIZES, _ico_is_current, _write_ico
+
+
+def _write(path: str) -> None:
+    _write_ico(path, [(sz, b"\x89PNG" + bytes(sz)) for sz in _ICON_SIZES])
+
+
+class TestIcoIsCurrent:
+    def test_freshly_written(self, tmp_path) -> None:
+        path = str(tmp_path / "a.ico")
+        _write(path)
+        assert _ico_is_current(path)
+
+    def test_missing(self, tmp_path) -> None:
+        assert not _ico_is_current(str(tmp_path / "none.ico"))
+
+    def test_truncated(self, tmp_path) -> None:
+        path = str(tmp_path / "a.ico")
+        _write(path)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 10)
+        assert not _ico_is_current(path)
+
+    def test_wrong_sizes(self, tmp_path) -> None:
+        path = str(tmp_path / "a.ico")
+        _write_ico(path, [(16, b"png")] * len(_ICON_SIZES))
+        assert not _ico_is_current(path)
+
+    def test_older_than_module(self, tmp_path) -> None:
+        path = str(tmp_path / "a.ico")
+        _write(path)
+        stale = os.path.getmtime(icon.__file__) - 60
+        os.utime(path, (stale, stale))
+        assert not _ico_is_current(path)
@@ -1,5 +1,7 @@
 """Tests for app.utils — fmt_time, encoder profiles, build_encoder_args, GIF."""
 
+import struct
+
 import pytest
 from unittest.mock import patch
 
@@ -12,6 +14,14 @@ from app.utils import (
     detect_available_encoders,
     GIF_FPS,
     build_gif_args,
+    parse_video_probe,
+    parse_ffprobe_packets,
+    ffmpeg_progress_fraction,
+    avi_rate_offsets,
+    patch_avi_fps,
+    parse_avi_frame_info,
+    read_avi_frame_info,
+    count_grabbed_frames,
 )
 
 # ── fmt_time ────────────────────────────────────────────────────────
@@ -184,3 +194,177 @@ class TestGifExport:
         args = build_gif_args()
         vf = args[args.index("-vf") + 1]
         assert "paletteuse" in vf
+
+
+# ── parse_video_probe ───────────────────────────────────────────────
+
+_PROBE_LOG = """\
+Input #0, avi, from 'rec.avi':
+  Duration: 00:00:02.00, start: 0.000000, bitrate: 791 kb/s
+  Stream #0:0: Video: huffyuv (HFYU / 0x55594648), bgr24, 1920x1080, {fps} fps, 30 tbr, 30 tbn
+Output #0, null, to 'pipe:':
+  Stream #0:0: Video: huffyuv (HFYU / 0x55594648), bgr24, 1920x1080, q=2-31, {fps} fps, 30 tbr, 30 tbn
+[out#0/null @ 0x1]   Output stream #0:0 (video): 1234 packets muxed (197887 bytes);
+[in#0/avi @ 0x2]   Input stream #0:0 (video): 1234 packets read (197887 bytes);
+"""
+
+
+class TestParseVideoProbe:
+    def test_integer_fps(self) -> None:
+        assert parse_video_probe(_PROBE_LOG.format(fps="30")) == (1234, 30.0)
+
+    def test_fractional_fps(self) -> None:
+        assert parse_video_probe(_PROBE_LOG.format(fps="29.97")) == (1234, 29.97)
+
+    def test_missing_fps(self) -> None:
+        log = _PROBE_LOG.replace("{fps} fps, ", "")
+        assert parse_video_probe(log) == (1234, 0.0)
+
+    def test_missing_packet_count(self) -> None:
+        assert parse_video_probe("Input #0, avi, from 'rec.avi':\n") is None
+
+
+class TestParseFfprobePackets:
+    def test_rational_rate(self) -> None:
+        out = "r_frame_rate=30000/1001\nnb_read_packets=2000\n"
+        packets, fps = parse_ffprobe_packets(out)
+        assert packets == 2000
+        assert fps == pytest.approx(29.97, abs=1e-2)
+
+    def test_field_order_and_crlf(self) -> None:
+        assert parse_ffprobe_packets("nb_read_packets=7\r\nr_frame_rate=7/1\r\n") == (7, 7.0)
+
+    def test_unknown_rate(self) -> None:
+        assert parse_ffprobe_packets("r_frame_rate=0/0\nnb_read_packets=5") == (5, 0.0)
+        assert parse_ffprobe_packets("nb_read_packets=5") == (5, 0.0)
+
+    def test_missing_count(self) -> None:
+        assert parse_ffprobe_packets("r_frame_rate=30/1\n") is None
+        assert parse_ffprobe_packets("nb_read_packets=N/A\n") is None
+
+
+class TestCountGrabbedFrames:
+    class _FakeCapture:
+        def __init__(self, frames: int) -> None:
+            self._left = frames
+
+        def grab(self) -> bool:
+            if self._left <= 0:
+                return False
+            self._left -= 1
+            return True
+
+    def test_counts_until_grab_fails(self) -> None:
+        assert count_grabbed_frames(self._FakeCapture(42)) == 42
+
+    def test_empty(self) -> None:
+        assert count_grabbed_frames(self._FakeCapture(0)) == 0
+
+
+class TestFfmpegProgressFraction:
+    def test_frame(self) -> None:
+        assert ffmpeg_progress_fraction("frame=50\n", 200, 0) == 0.25
+
+    def test_out_time(self) -> None:
+        assert ffmpeg_progress_fraction("out_time_us=1500000", 0, 3_000_000) == 0.5
+        assert ffmpeg_progress_fraction("out_time_us=N/A", 0, 3_000_000) is None
+
+    def test_end_and_clamp(self) -> None:
+        assert ffmpeg_progress_fraction("progress=end", 10, 1.0) == 1.0
+        assert ffmpeg_progress_fraction("progress=continue", 10, 1.0) is None
+        assert ffmpeg_progress_fraction("frame=30", 10, 1.0) == 1.0
+
+    def test_other_lines(self) -> None:
+        assert ffmpeg_progress_fraction("Stream #0:0 -> #0:0 (copy)", 10, 1.0) is None
+        assert ffmpeg_progress_fraction("speed=8.36e+03x", 10, 1.0) is None
+        assert ffmpeg_progress_fraction("frame=5", 0, 0) is None
+
+
+# ── AVI header patching ─────────────────────────────────────────────
+
+
+def _chunk(fourcc: bytes, data: bytes) -> bytes:
+    pad = b"\0" if len(data) % 2 else b""
+    return fourcc + struct.pack("<I", len(data)) + data + pad
+
+
+def _list(kind: bytes, *chunks: bytes) -> bytes:
+    return _chunk(b"LIST", kind + b"".join(chunks))
+
+
+def _make_avi(scale: int = 1, rate: int = 30, frames: int = 0,
+              odml_frames: int | None = None) -> bytes:
+    """Minimal AVI header: avih + one audio and one video stream list."""
+    avih = _chunk(b"avih", struct.pack("<I", 33333) + bytes(12) + struct.pack("<I", frames) + bytes(36))
+    auds = _list(b"strl", _chunk(b"strh", b"auds" + bytes(16) + struct.pack("<II", 1, 44100) + bytes(28)))
+    vids = _list(b"strl",
+                 _chunk(b"strh", b"vids" + b"HFYU" + bytes(12) + struct.pack("<II", scale, rate) + bytes(28)),
+                 _chunk(b"strf", bytes(41)))  # odd size → padded
+    extra = ()
+    if odml_frames is not None:
+        extra = (_list(b"odml", _chunk(b"dmlh", struct.pack("<I", odml_frames) + bytes(244))),)
+    hdrl = _list(b"hdrl", avih, auds, vids, *extra)
+    body = b"AVI " + _chunk(b"JUNK", bytes(7)) + hdrl + _list(b"movi")
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+class TestAviPatch:
+    def test_offsets(self) -> None:
+        buf = _make_avi()
+        avih, strh = avi_rate_offsets(buf)
+        assert struct.unpack_from("<I", buf, avih)[0] == 33333
+        assert buf[strh:strh + 4] == b"vids"
+        assert struct.unpack_from("<II", buf, strh + 20) == (1, 30)
+
+    def test_not_avi(self) -> None:
+        assert avi_rate_offsets(b"RIFF\0\0\0\0WAVE") is None
+        assert avi_rate_offsets(b"") is None
+
+    def test_missing_video_stream(self) -> None:
+        buf = _make_avi().replace(b"vids", b"txts")
+        assert avi_rate_offsets(buf) is None
+
+    def test_patch_in_place(self, tmp_path) -> None:
+        path = tmp_path / "rec.avi"
+        original = _make_avi()
+        path.write_bytes(original)
+        assert patch_avi_fps(str(path), 24.5)
+        buf = path.read_bytes()
+        assert len(buf) == len(original)
+        avih, strh = avi_rate_offsets(buf)
+        assert struct.unpack_from("<I", buf, avih)[0] == round(1_000_000 / 24.5)
+        assert struct.unpack_from("<II", buf, strh + 20) == (2, 49)
+        # Only the rate fields changed
+        changed = [i for i, (a, b) in enumerate(zip(original, buf)) if a != b]
+        assert all(avih <= i < avih + 4 or strh + 20 <= i < strh + 28 for i in changed)
+
+    def test_patch_rejects_other_files(self, tmp_path) -> None:
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(b"\0\0\0\x20ftypisom" + bytes(64))
+        assert not patch_avi_fps(str(path), 30.0)
+        assert not patch_avi_fps(str(tmp_path / "missing.avi"), 30.0)
+        assert not patch_avi_fps(str(path), 0.0)
+
+
+class TestAviFrameInfo:
+    def test_frames_and_stream_rate(self) -> None:
+        assert parse_avi_frame_info(_make_avi(scale=2, rate=15, frames=120)) == (120, 7.5)
+
+    def test_opendml_total_wins(self) -> None:
+        buf = _make_avi(frames=500, odml_frames=90_000)
+        assert parse_avi_frame_info(buf) == (90_000, 30.0)
+
+    def test_unset_count(self) -> None:
+        assert parse_avi_frame_info(_make_avi(frames=0)) is None
+
+    def test_falls_back_to_avih_rate(self) -> None:
+        buf = _make_avi(frames=10).replace(b"vids", b"txts")
+        total, fps = parse_avi_frame_info(buf)
+        assert total == 10
+        assert fps == pytest.approx(30.0, abs=1e-3)
+
+    def test_read_file(self, tmp_path) -> None:
+        path = tmp_path / "rec.avi"
+        path.write_bytes(_make_avi(frames=42))
+        assert read_avi_frame_info(str(path)) == (42, 30.0)
+        assert read_avi_frame_info(str(tmp_path / "missing.avi")) is None
@@ -260,3 +260,56 @@ class TestZoomEngineUndoRedo:
         engine.keyframes[0] = ZoomKeyframe.create(timestamp=999, zoom=3.0)
         engine.undo()
         assert engine.keyframes[0].timestamp == 100
+
+
+# ── ZoomEngine — id lookup ──────────────────────────────────────────
+
+
+class TestZoomEngineIdLookup:
+    def test_index_of_follows_sort_order(self) -> None:
+        engine = ZoomEngine()
+        kf_late = ZoomKeyframe.create(timestamp=2000, zoom=1.0)
+        kf_early = ZoomKeyframe.create(timestamp=500, zoom=1.5)
+        engine.add_keyframe(kf_late)
+        engine.add_keyframe(kf_early)
+        assert engine.index_of(kf_early.id) == 0
+        assert engine.index_of(kf_late.id) == 1
+
+    def test_missing_id(self) -> None:
+        engine = ZoomEngine()
+        engine.add_keyframe(ZoomKeyframe.create(timestamp=100, zoom=1.5))
+        assert engine.index_of("no-such-id") is None
+        assert engine.find("no-such-id") is None
+
+    def test_find_after_remove(self) -> None:
+        engine = ZoomEngine()
+        a = ZoomKeyframe.create(timestamp=100, zoom=1.5)
+        b = ZoomKeyframe.create(timestamp=200, zoom=1.0)
+        engine.add_keyframe(a)
+        engine.add_keyframe(b)
+        engine.remove_keyframe(a.id)
+        assert engine.find(a.id) is None
+        assert engine.find(b.id) is b
+
+    def test_external_resort_is_picked_up(self) -> None:
+        """Callers re-sort ``keyframes`` in place after moving one."""
+        engine = ZoomEngine()
+        a = ZoomKeyframe.create(timestamp=100, zoom=1.5)
+        b = ZoomKeyframe.create(timestamp=200, zoom=1.0)
+        engine.add_keyframe(a)
+        engine.add_keyframe(b)
+        a.timestamp = 300
+        engine.keyframes.sort(key=lambda k: k.timestamp)
+        assert engine.index_of(a.id) == 1
+        assert engine.index_of(b.id) == 0
+
+    def test_undo_restores_lookup(self) -> None:
+        engine = ZoomEngine()
+        kf = ZoomKeyframe.create(timestamp=100, zoom=1.5)
+        engine.add_keyframe(kf)
+        engine.push_undo()
+        engine.remove_keyframe(kf.id)
+        engine.undo()
+        found = engine.find(kf.id)
+        assert found is not None
+        assert found is engine.keyframes[0]